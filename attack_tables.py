@@ -0,0 +1,234 @@
+from typing import List, Tuple, Dict
+
+# Built once at import, every table is indexed by the square index x * 8 + y
+
+KNIGHT_DIRECTIONS: List[Tuple[int, int]] = [
+    (2, 1),
+    (2, -1),
+    (-2, 1),
+    (-2, -1),
+    (1, 2),
+    (1, -2),
+    (-1, 2),
+    (-1, -2),
+]
+
+KING_DIRECTIONS: List[Tuple[int, int]] = [
+    (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2) if (dx, dy) != (0, 0)
+]
+
+# Pawn capture directions, indexed by color value (white moves towards x = 0)
+PAWN_CAPTURE_DIRECTIONS: List[List[Tuple[int, int]]] = [
+    [(-1, -1), (-1, 1)],
+    [(1, -1), (1, 1)],
+]
+
+ROOK_DIRECTIONS: List[Tuple[int, int]] = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS: List[Tuple[int, int]] = [(1, 1), (-1, 1), (-1, -1), (1, -1)]
+QUEEN_DIRECTIONS: List[Tuple[int, int]] = KING_DIRECTIONS
+
+
+def square_index(x: int, y: int) -> int:
+    """
+    Get the index of a board position in the tables and bitboards.
+
+    Args:
+        x (int): The x-coordinate of the position.
+        y (int): The y-coordinate of the position.
+
+    Returns:
+        int: The index of the position.
+    """
+    return x * 8 + y
+
+
+def build_target_table(
+    directions: List[Tuple[int, int]]
+) -> List[List[Tuple[int, int]]]:
+    """
+    Build the on-board targets of a piece jumping by fixed offsets for every square.
+
+    The targets keep the order of the given directions.
+
+    Args:
+        directions (List[Tuple[int, int]]): The (dx, dy) offsets the piece can jump by.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The target positions for each of the 64 squares.
+    """
+
+    table = []
+    for square in range(64):
+        x, y = divmod(square, 8)
+        table.append(
+            [
+                (x + dx, y + dy)
+                for dx, dy in directions
+                if 0 <= x + dx < 8 and 0 <= y + dy < 8
+            ]
+        )
+    return table
+
+
+def build_mask_table(target_table: List[List[Tuple[int, int]]]) -> List[int]:
+    """
+    Convert a target table into one bitboard mask per square.
+
+    Args:
+        target_table (List[List[Tuple[int, int]]]): The target positions for each square.
+
+    Returns:
+        List[int]: The mask of the targets for each of the 64 squares.
+    """
+
+    table = []
+    for targets in target_table:
+        mask = 0
+        for x, y in targets:
+            mask |= 1 << square_index(x, y)
+        table.append(mask)
+    return table
+
+
+KNIGHT_TARGETS = build_target_table(KNIGHT_DIRECTIONS)
+KING_TARGETS = build_target_table(KING_DIRECTIONS)
+PAWN_CAPTURE_TARGETS = [
+    build_target_table(directions) for directions in PAWN_CAPTURE_DIRECTIONS
+]
+
+KNIGHT_ATTACKS = build_mask_table(KNIGHT_TARGETS)
+KING_ATTACKS = build_mask_table(KING_TARGETS)
+PAWN_ATTACKS = [build_mask_table(targets) for targets in PAWN_CAPTURE_TARGETS]
+
+
+def build_ray_table(direction: Tuple[int, int]) -> List[List[Tuple[int, int]]]:
+    """
+    Build the squares a sliding piece passes on an empty board in one direction, for every square.
+
+    Args:
+        direction (Tuple[int, int]): The (dx, dy) step of the ray.
+
+    Returns:
+        List[List[Tuple[int, int]]]: The ray positions, nearest first, for each of the 64 squares.
+    """
+
+    dx, dy = direction
+    table = []
+    for square in range(64):
+        x, y = divmod(square, 8)
+        ray = []
+        x, y = x + dx, y + dy
+        while 0 <= x < 8 and 0 <= y < 8:
+            ray.append((x, y))
+            x, y = x + dx, y + dy
+        table.append(ray)
+    return table
+
+
+# Ray positions by direction, then by square
+RAYS: Dict[Tuple[int, int], List[List[Tuple[int, int]]]] = {
+    direction: build_ray_table(direction) for direction in QUEEN_DIRECTIONS
+}
+
+
+def build_slider_tables(
+    directions: List[Tuple[int, int]]
+) -> Tuple[List[int], List[Dict[int, int]]]:
+    """
+    Build the occupancy-indexed attack lookup of a sliding piece for every square.
+
+    Only the squares that can block a ray are relevant, so the last square of each ray
+    is left out of the mask. Every subset of the mask is enumerated and its attacks stored,
+    so the attacks for any occupancy are a single lookup of occupancy & mask.
+
+    Args:
+        directions (List[Tuple[int, int]]): The directions the piece slides in.
+
+    Returns:
+        Tuple[List[int], List[Dict[int, int]]]: The relevant occupancy mask and the attack lookup for each square.
+    """
+
+    masks = []
+    tables = []
+    for square in range(64):
+        rays = [
+            [1 << square_index(x, y) for x, y in RAYS[direction][square]]
+            for direction in directions
+        ]
+        mask = 0
+        for ray in rays:
+            for bit in ray[:-1]:
+                mask |= bit
+
+        table = {}
+        subset = 0
+        while True:
+            attacks = 0
+            for ray in rays:
+                for bit in ray:
+                    attacks |= bit
+                    if subset & bit:
+                        break
+            table[subset] = attacks
+
+            # Carry-rippler trick to step through every subset of the mask
+            subset = (subset - mask) & mask
+            if subset == 0:
+                break
+
+        masks.append(mask)
+        tables.append(table)
+    return masks, tables
+
+
+ROOK_MASKS, ROOK_ATTACK_TABLE = build_slider_tables(ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_ATTACK_TABLE = build_slider_tables(BISHOP_DIRECTIONS)
+
+
+def rook_attacks(square: int, occupied: int) -> int:
+    """
+    Get the squares attacked by a rook, including the first blocker on each ray.
+
+    Args:
+        square (int): The index of the square of the rook.
+        occupied (int): The mask of all occupied squares.
+
+    Returns:
+        int: The mask of attacked squares.
+    """
+    return ROOK_ATTACK_TABLE[square][occupied & ROOK_MASKS[square]]
+
+
+def bishop_attacks(square: int, occupied: int) -> int:
+    """
+    Get the squares attacked by a bishop, including the first blocker on each ray.
+
+    Args:
+        square (int): The index of the square of the bishop.
+        occupied (int): The mask of all occupied squares.
+
+    Returns:
+        int: The mask of attacked squares.
+    """
+    return BISHOP_ATTACK_TABLE[square][occupied & BISHOP_MASKS[square]]
+
+
+def build_between_table() -> List[List[int]]:
+    """
+    Build the mask of the squares strictly between every pair of aligned squares.
+
+    Returns:
+        List[List[int]]: The in-between mask indexed by both square indexes, 0 when not aligned.
+    """
+
+    table = [[0] * 64 for _ in range(64)]
+    for square in range(64):
+        for direction in QUEEN_DIRECTIONS:
+            between = 0
+            for x, y in RAYS[direction][square]:
+                table[square][square_index(x, y)] = between
+                between |= 1 << square_index(x, y)
+    return table
+
+
+BETWEEN = build_between_table()
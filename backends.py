@@ -0,0 +1,303 @@
+from typing import List, Tuple, Dict
+from abc import ABC, abstractmethod
+from pieces import Piece, Color, PieceType
+from moves import (
+    PIECE_MOVE_MAP,
+    UniversalMovementValidation,
+    Move,
+    PROMOTION_TYPES,
+    CASTLING_MOVES,
+)
+from utility import MoveUndo
+
+
+class BoardBackend(ABC):
+    """
+    Abstract class for the move generation backend used by the Board.
+
+    The Board always keeps its dictionary of pieces. A backend may keep its own
+    representation of the position, which is rebuilt by load and kept in step by
+    make_move and unmake_move.
+    """
+
+    def load(self, board: Dict[Tuple[int, int], Piece]) -> None:
+        """
+        Rebuild the backend state from the given board.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+        """
+        pass
+
+    def make_move(self, undo: MoveUndo) -> None:
+        """
+        Update the backend state after a move was played on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was played.
+        """
+        pass
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Update the backend state after a move was reverted on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was reverted.
+        """
+        pass
+
+    @abstractmethod
+    def get_valid_moves(
+        self, piece: Piece, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the valid moves for the given piece.
+
+        Args:
+            piece (Piece): The piece for which to determine valid moves.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for the piece.
+        """
+        pass
+
+    @abstractmethod
+    def get_all_valid_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get all valid moves for pieces of the specified color.
+
+        Args:
+            color (Color): The color of pieces for which to find valid moves.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for pieces of the specified color.
+        """
+        pass
+
+    def get_legal_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get every legal move of the specified color.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Move]: The legal moves, with one move per promotion piece type.
+        """
+
+        last_row = 0 if color == Color.WHITE else 7
+        legal_moves = []
+        for position, piece in list(board.items()):
+            if piece.color != color:
+                continue
+            for target in self.get_valid_moves(piece, board):
+                if piece.type == PieceType.PAWN and target[0] == last_row:
+                    legal_moves.extend(
+                        Move(position, target, promotion)
+                        for promotion in PROMOTION_TYPES
+                    )
+                else:
+                    legal_moves.append(Move(position, target))
+        return legal_moves
+
+    def get_legal_captures(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get the legal moves of the specified color that capture a piece, including en passant.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Move]: The legal captures, with one move per promotion piece type.
+        """
+
+        return [
+            move
+            for move in self.get_legal_moves(color, board)
+            if board[move.target].type != PieceType.EMPTY
+            # A pawn moving diagonally onto an empty square captures en passant
+            or (
+                board[move.origin].type == PieceType.PAWN
+                and move.origin[1] != move.target[1]
+            )
+        ]
+
+    def is_position_attacked(
+        self, position: Tuple[int, int], color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if any piece of the given color attacks a square.
+
+        Args:
+            position (Tuple[int, int]): The position of the attacked square.
+            color (Color): The color of the attacking pieces.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+        return UniversalMovementValidation.is_square_attacked(board, position, color)
+
+    def get_castling_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece], castling_rights: int
+    ) -> List[Move]:
+        """
+        Get the castling moves of the specified color, as moves of the king.
+
+        A side may castle when it still has the right, its king and rook stand on their
+        starting squares with nothing between them, and the king does not start on, cross
+        or reach an attacked square.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            castling_rights (int): The bit mask of the castling rights left.
+
+        Returns:
+            List[Move]: The legal castling moves.
+        """
+
+        opponent = Color.BLACK if color == Color.WHITE else Color.WHITE
+        castling_moves = []
+        for castling in CASTLING_MOVES:
+            if castling.color != color or not castling_rights & castling.right:
+                continue
+            king = board[castling.king.origin]
+            rook = board[castling.rook.origin]
+            if (
+                king.type != PieceType.KING
+                or king.color != color
+                or rook.type != PieceType.ROOK
+                or rook.color != color
+            ):
+                continue
+            if any(board[position].type != PieceType.EMPTY for position in castling.empty):
+                continue
+            if any(
+                self.is_position_attacked(position, opponent, board)
+                for position in castling.safe
+            ):
+                continue
+            castling_moves.append(castling.king)
+        return castling_moves
+
+    @abstractmethod
+    def is_king_in_check(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if the king of the given color is in check.
+
+        Args:
+            color (Color): The color of the king.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            bool: True if the king is in check, False otherwise.
+        """
+        pass
+
+
+class DictBackend(BoardBackend):
+    """
+    Backend generating moves directly on the dictionary board with the movement classes.
+
+    Inherits from BoardBackend.
+    """
+
+    def get_valid_moves(
+        self, piece: Piece, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the valid moves for the given piece based on its type.
+
+        Args:
+            piece (Piece): The piece for which to determine valid moves.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for the piece.
+
+        Raises:
+            ValueError: If the piece type has no movement, such as an empty square.
+        """
+        pieceMovement_class = PIECE_MOVE_MAP.get(piece.type)
+        if pieceMovement_class is None:
+            raise ValueError(f"Piece not recognized for movement: {piece.type}")
+        return pieceMovement_class(piece).get_valid_moves(board)
+
+    def get_all_valid_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get all valid moves for pieces of the specified color on the board.
+
+        Args:
+            color (Color): The color of pieces for which to find valid moves.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for pieces of the specified color.
+        """
+
+        all_valid_moves = []
+        for position, piece in board.items():
+            if piece.color == color:
+                piece_valid_moves = self.get_valid_moves(piece, board)
+                all_valid_moves.extend(piece_valid_moves)
+        return all_valid_moves
+
+    def get_legal_captures(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get the legal captures of the specified color with the capture generation of the movement classes.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Move]: The legal captures, with one move per promotion piece type.
+        """
+
+        last_row = 0 if color == Color.WHITE else 7
+        legal_captures = []
+        for position, piece in list(board.items()):
+            if piece.color != color:
+                continue
+            for target in PIECE_MOVE_MAP[piece.type](piece).get_valid_captures(board):
+                if piece.type == PieceType.PAWN and target[0] == last_row:
+                    legal_captures.extend(
+                        Move(position, target, promotion)
+                        for promotion in PROMOTION_TYPES
+                    )
+                else:
+                    legal_captures.append(Move(position, target))
+        return legal_captures
+
+    def is_king_in_check(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if the king of the given color is in check on the current board.
+
+        Args:
+            color (Color): The color of the king.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            bool: True if the king is in check, False otherwise.
+        """
+        return UniversalMovementValidation.is_king_in_check(color, board)
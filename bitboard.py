@@ -0,0 +1,577 @@
+from typing import Dict, List, Optional, Tuple
+from pieces import Piece, PieceType, Color
+from backends import BoardBackend, DictBackend
+from king_validation import KingNotFound
+from utility import MoveUndo
+from moves import Move, PROMOTION_TYPES
+from attack_tables import (
+    square_index,
+    KNIGHT_ATTACKS,
+    KING_ATTACKS,
+    PAWN_ATTACKS,
+    rook_attacks,
+    bishop_attacks,
+    BETWEEN,
+)
+
+# Index of each piece type inside the 6 masks of a color
+PIECE_INDEX: Dict[PieceType, int] = {
+    PieceType.PAWN: 0,
+    PieceType.KNIGHT: 1,
+    PieceType.BISHOP: 2,
+    PieceType.ROOK: 3,
+    PieceType.QUEEN: 4,
+    PieceType.KING: 5,
+}
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+
+FULL_BOARD = (1 << 64) - 1
+
+# Move generator for boards the backend state was not loaded from
+DICT_BACKEND = DictBackend()
+
+
+def iterate_squares(mask: int) -> List[int]:
+    """
+    Get the indexes of all set bits of a mask, lowest first.
+
+    Args:
+        mask (int): The mask to iterate over.
+
+    Returns:
+        List[int]: The indexes of the set bits.
+    """
+
+    squares = []
+    while mask:
+        lowest = mask & -mask
+        squares.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return squares
+
+
+class BitboardBackend(BoardBackend):
+    """
+    Backend storing the position as one 64-bit integer mask per piece type and color.
+
+    Bit x * 8 + y of a mask represents the position (x, y) of the dictionary board.
+
+    Inherits from BoardBackend.
+
+    Attributes:
+        pieces (List[int]): The 12 piece masks, indexed by color.value * 6 + PIECE_INDEX[piece type].
+        occupancy (List[int]): The masks of all white and all black pieces, indexed by color.value.
+        occupied (int): The mask of all pieces on the board.
+        en_passant (int): The mask of pawns that can be captured en passant.
+        loaded_board (Optional[Dict[Tuple[int, int], Piece]]): The board the masks were last loaded from.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty BitboardBackend."""
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.en_passant = 0
+        self.loaded_board: Optional[Dict[Tuple[int, int], Piece]] = None
+
+    def load(self, board: Dict[Tuple[int, int], Piece]) -> None:
+        """
+        Rebuild the piece masks from the given board.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+        """
+
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.en_passant = 0
+        self.loaded_board = board
+        for (x, y), piece in board.items():
+            if piece.type == PieceType.EMPTY:
+                continue
+            self._toggle(piece, square_index(x, y))
+            if piece.en_passantable:
+                self.en_passant |= 1 << square_index(x, y)
+
+    def _toggle(self, piece: Piece, square: int) -> None:
+        """
+        Add or remove a piece on the given square.
+
+        Args:
+            piece (Piece): The piece to add or remove.
+            square (int): The index of the square.
+        """
+
+        mask = 1 << square
+        self.pieces[piece.color.value * 6 + PIECE_INDEX[piece.type]] ^= mask
+        self.occupancy[piece.color.value] ^= mask
+        self.occupied ^= mask
+
+    def make_move(self, undo: MoveUndo) -> None:
+        """
+        Update the piece masks after a move was played on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was played.
+        """
+
+        self._toggle(undo.piece, square_index(*undo.origin))
+        if undo.captured.type != PieceType.EMPTY:
+            self._toggle(undo.captured, square_index(*undo.captured_position))
+        self._toggle(undo.promoted or undo.piece, square_index(*undo.target))
+
+        self.en_passant = (
+            1 << square_index(*undo.target) if undo.piece.en_passantable else 0
+        )
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Update the piece masks after a move was reverted on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was reverted.
+        """
+
+        self._toggle(undo.promoted or undo.piece, square_index(*undo.target))
+        if undo.captured.type != PieceType.EMPTY:
+            self._toggle(undo.captured, square_index(*undo.captured_position))
+        self._toggle(undo.piece, square_index(*undo.origin))
+
+        self.en_passant = (
+            1 << square_index(*undo.en_passant_position)
+            if undo.en_passant_position is not None
+            else 0
+        )
+
+    @staticmethod
+    def is_square_attacked(
+        square: int, attacker: int, pieces: List[int], occupied: int
+    ) -> bool:
+        """
+        Check if a square is attacked by any piece of the attacking color.
+
+        Args:
+            square (int): The index of the square to check.
+            attacker (int): The color value of the attacking side.
+            pieces (List[int]): The 12 piece masks.
+            occupied (int): The mask of all occupied squares.
+
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+
+        base = attacker * 6
+        defender = 1 - attacker
+
+        if KNIGHT_ATTACKS[square] & pieces[base + KNIGHT]:
+            return True
+        if KING_ATTACKS[square] & pieces[base + KING]:
+            return True
+        # A pawn attacks the square if a defending pawn on it would attack the pawn
+        if PAWN_ATTACKS[defender][square] & pieces[base + PAWN]:
+            return True
+
+        queens = pieces[base + QUEEN]
+        if rook_attacks(square, occupied) & (pieces[base + ROOK] | queens):
+            return True
+        if bishop_attacks(square, occupied) & (pieces[base + BISHOP] | queens):
+            return True
+
+        return False
+
+    def _get_target_mask(self, square: int, color: int, piece_index: int) -> int:
+        """
+        Get the pseudo-legal targets of a piece, ignoring en passant and whether the own king is left in check.
+
+        Args:
+            square (int): The index of the square of the piece.
+            color (int): The color value of the piece.
+            piece_index (int): The index of the piece type.
+
+        Returns:
+            int: The mask of target squares.
+        """
+
+        own = self.occupancy[color]
+
+        if piece_index == KNIGHT:
+            return KNIGHT_ATTACKS[square] & ~own
+        if piece_index == KING:
+            return KING_ATTACKS[square] & ~own
+        if piece_index == ROOK:
+            return rook_attacks(square, self.occupied) & ~own
+        if piece_index == BISHOP:
+            return bishop_attacks(square, self.occupied) & ~own
+        if piece_index == QUEEN:
+            return (
+                rook_attacks(square, self.occupied)
+                | bishop_attacks(square, self.occupied)
+            ) & ~own
+
+        # Pawns move towards x = 0 for white and x = 7 for black
+        step = -8 if color == Color.WHITE.value else 8
+        start_row = 6 if color == Color.WHITE.value else 1
+        targets = 0
+
+        forward = square + step
+        if 0 <= forward < 64 and not self.occupied & (1 << forward):
+            targets |= 1 << forward
+            double = forward + step
+            if square // 8 == start_row and not self.occupied & (1 << double):
+                targets |= 1 << double
+
+        return targets | PAWN_ATTACKS[color][square] & self.occupancy[1 - color]
+
+    def _get_en_passant_targets(self, square: int, color: int) -> int:
+        """
+        Get the en passant targets of the pawn on the given square.
+
+        Args:
+            square (int): The index of the square of the pawn.
+            color (int): The color value of the pawn.
+
+        Returns:
+            int: The mask of en passant target squares.
+        """
+
+        en_passant = self.en_passant & self.pieces[(1 - color) * 6 + PAWN]
+        if not en_passant:
+            return 0
+
+        # En passant lands behind an opposing pawn that just moved two squares
+        behind = en_passant >> 8 if color == Color.WHITE.value else en_passant << 8
+        return PAWN_ATTACKS[color][square] & behind & ~self.occupied
+
+    def _is_legal(self, origin: int, target: int, color: int, piece_index: int) -> bool:
+        """
+        Check that a move does not leave the own king in check by playing it on copied masks.
+
+        Only used for en passant, where two pieces leave the same rank and pin masks do not apply.
+
+        Args:
+            origin (int): The index of the square the piece moves from.
+            target (int): The index of the square the piece moves to.
+            color (int): The color value of the moving piece.
+            piece_index (int): The index of the moving piece type.
+
+        Returns:
+            bool: True if the move is legal, False otherwise.
+        """
+
+        origin_mask, target_mask = 1 << origin, 1 << target
+        captured_mask = target_mask
+
+        # A pawn moving diagonally onto an empty square captures en passant
+        if (
+            piece_index == PAWN
+            and (origin - target) % 8 != 0
+            and not self.occupied & target_mask
+        ):
+            captured_mask = 1 << (origin // 8 * 8 + target % 8)
+
+        pieces = self.pieces[:]
+        opposing_base = (1 - color) * 6
+        for index in range(opposing_base, opposing_base + 6):
+            pieces[index] &= ~captured_mask
+        pieces[color * 6 + piece_index] ^= origin_mask | target_mask
+
+        occupied = (self.occupied & ~origin_mask & ~captured_mask) | target_mask
+        king = pieces[color * 6 + KING]
+
+        return not self.is_square_attacked(
+            king.bit_length() - 1, 1 - color, pieces, occupied
+        )
+
+    def get_check_and_pin_masks(self, color: int) -> Tuple[int, int, Dict[int, int]]:
+        """
+        Find the checkers and pinned pieces of the given side once for the position.
+
+        Args:
+            color (int): The color value of the side to move.
+
+        Returns:
+            Tuple[int, int, Dict[int, int]]: The king square, the mask of squares that resolve
+            the check (every square when not in check, none in double check) and the ray each
+            pinned piece is allowed to move along, keyed by the square of the pinned piece.
+
+        Raises:
+            KingNotFound: If there is no king of the given color.
+        """
+
+        pieces = self.pieces
+        king = pieces[color * 6 + KING]
+        if not king:
+            raise KingNotFound(Color(color))
+        king_square = king.bit_length() - 1
+
+        base = (1 - color) * 6
+        rooks = pieces[base + ROOK] | pieces[base + QUEEN]
+        bishops = pieces[base + BISHOP] | pieces[base + QUEEN]
+
+        checkers = (
+            KNIGHT_ATTACKS[king_square] & pieces[base + KNIGHT]
+            | PAWN_ATTACKS[color][king_square] & pieces[base + PAWN]
+            | KING_ATTACKS[king_square] & pieces[base + KING]
+            | rook_attacks(king_square, self.occupied) & rooks
+            | bishop_attacks(king_square, self.occupied) & bishops
+        )
+
+        if not checkers:
+            check_mask = FULL_BOARD
+        elif checkers & (checkers - 1):
+            check_mask = 0
+        else:
+            # A single checker can be captured, or blocked if it is a sliding piece
+            checker_square = checkers.bit_length() - 1
+            check_mask = checkers | BETWEEN[king_square][checker_square]
+
+        # Sliding pieces aligned with the king with exactly one own piece in between pin it
+        pins = {}
+        snipers = rook_attacks(king_square, 0) & rooks | bishop_attacks(
+            king_square, 0
+        ) & bishops
+        for sniper in iterate_squares(snipers):
+            between = BETWEEN[king_square][sniper]
+            blockers = between & self.occupied
+            if (
+                blockers
+                and not blockers & (blockers - 1)
+                and blockers & self.occupancy[color]
+            ):
+                pins[blockers.bit_length() - 1] = between | (1 << sniper)
+
+        return king_square, check_mask, pins
+
+    def _get_legal_targets(
+        self,
+        square: int,
+        color: int,
+        piece_index: int,
+        check_and_pins: Tuple[int, int, Dict[int, int]],
+    ) -> int:
+        """
+        Get the legal targets of the piece on the given square from the check and pin masks.
+
+        Args:
+            square (int): The index of the square of the piece.
+            color (int): The color value of the piece.
+            piece_index (int): The index of the piece type.
+            check_and_pins (Tuple[int, int, Dict[int, int]]): The result of get_check_and_pin_masks.
+
+        Returns:
+            int: The mask of legal target squares.
+        """
+
+        king_square, check_mask, pins = check_and_pins
+        targets = self._get_target_mask(square, color, piece_index)
+
+        if piece_index == KING:
+            # The king is removed so sliding attackers see through its current square
+            occupied = self.occupied ^ (1 << king_square)
+            legal = 0
+            for target in iterate_squares(targets):
+                if not self.is_square_attacked(
+                    target, 1 - color, self.pieces, occupied
+                ):
+                    legal |= 1 << target
+            return legal
+
+        targets &= check_mask & pins.get(square, FULL_BOARD)
+
+        if piece_index == PAWN:
+            for target in iterate_squares(self._get_en_passant_targets(square, color)):
+                if self._is_legal(square, target, color, piece_index):
+                    targets |= 1 << target
+
+        return targets
+
+    def _generate_legal_targets(self, color: int) -> List[Tuple[int, int, int]]:
+        """
+        Get the legal targets of every piece of the given side.
+
+        Args:
+            color (int): The color value of the side to move.
+
+        Returns:
+            List[Tuple[int, int, int]]: The square, piece index and legal target mask of each piece.
+        """
+
+        check_and_pins = self.get_check_and_pin_masks(color)
+        # Only the king can move out of a double check
+        piece_indexes = range(6) if check_and_pins[1] else [KING]
+
+        legal_targets = []
+        for piece_index in piece_indexes:
+            for square in iterate_squares(self.pieces[color * 6 + piece_index]):
+                targets = self._get_legal_targets(
+                    square, color, piece_index, check_and_pins
+                )
+                legal_targets.append((square, piece_index, targets))
+        return legal_targets
+
+    def get_valid_moves(
+        self, piece: Piece, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the valid moves for the given piece from the piece masks.
+
+        Args:
+            piece (Piece): The piece for which to determine valid moves.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for the piece.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_valid_moves(piece, board)
+
+        color = piece.color.value
+        targets = self._get_legal_targets(
+            square_index(piece.x, piece.y),
+            color,
+            PIECE_INDEX[piece.type],
+            self.get_check_and_pin_masks(color),
+        )
+        return [divmod(target, 8) for target in iterate_squares(targets)]
+
+    def get_all_valid_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get all valid moves for pieces of the specified color from the piece masks.
+
+        Args:
+            color (Color): The color of pieces for which to find valid moves.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for pieces of the specified color.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_all_valid_moves(color, board)
+
+        all_valid_moves = []
+        for _, _, targets in self._generate_legal_targets(color.value):
+            all_valid_moves.extend(divmod(target, 8) for target in iterate_squares(targets))
+        return all_valid_moves
+
+    def get_legal_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get every legal move of the specified color from the piece masks.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Move]: The legal moves, with one move per promotion piece type.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_legal_moves(color, board)
+
+        last_row = 0 if color == Color.WHITE else 7
+        legal_moves = []
+        for square, piece_index, targets in self._generate_legal_targets(color.value):
+            origin = divmod(square, 8)
+            for target in iterate_squares(targets):
+                if piece_index == PAWN and target // 8 == last_row:
+                    legal_moves.extend(
+                        Move(origin, divmod(target, 8), promotion)
+                        for promotion in PROMOTION_TYPES
+                    )
+                else:
+                    legal_moves.append(Move(origin, divmod(target, 8)))
+        return legal_moves
+
+    def get_legal_captures(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get the legal captures of the specified color by masking the legal targets with the opposing pieces.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Move]: The legal captures, with one move per promotion piece type.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_legal_captures(color, board)
+
+        last_row = 0 if color == Color.WHITE else 7
+        opposing = self.occupancy[1 - color.value]
+        legal_captures = []
+        for square, piece_index, targets in self._generate_legal_targets(color.value):
+            if piece_index == PAWN:
+                # Every diagonal pawn move captures, en passant included
+                targets &= PAWN_ATTACKS[color.value][square]
+            else:
+                targets &= opposing
+            origin = divmod(square, 8)
+            for target in iterate_squares(targets):
+                if piece_index == PAWN and target // 8 == last_row:
+                    legal_captures.extend(
+                        Move(origin, divmod(target, 8), promotion)
+                        for promotion in PROMOTION_TYPES
+                    )
+                else:
+                    legal_captures.append(Move(origin, divmod(target, 8)))
+        return legal_captures
+
+    def is_position_attacked(
+        self, position: Tuple[int, int], color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if any piece of the given color attacks a square, from the backend state.
+
+        Args:
+            position (Tuple[int, int]): The position of the attacked square.
+            color (Color): The color of the attacking pieces.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.is_position_attacked(position, color, board)
+
+        return self.is_square_attacked(
+            square_index(*position), color.value, self.pieces, self.occupied
+        )
+
+    def is_king_in_check(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if the king of the given color is attacked according to the piece masks.
+
+        Args:
+            color (Color): The color of the king.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the masks were not loaded from is searched with the DictBackend.
+
+        Returns:
+            bool: True if the king is in check, False otherwise.
+
+        Raises:
+            KingNotFound: If there is no king of the given color.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.is_king_in_check(color, board)
+
+        king = self.pieces[color.value * 6 + KING]
+        if not king:
+            raise KingNotFound(color)
+        return self.is_square_attacked(
+            king.bit_length() - 1, 1 - color.value, self.pieces, self.occupied
+        )
@@ -1,8 +1,56 @@
-from typing import Dict, Tuple, List
-from pieces import Piece, PieceType, Color, FEN_MAP
-from notation import Notation
-from moves import PIECE_MOVE_MAP, UniversalMovementValidation
-from utility import BoardUtils
+from typing import Dict, Tuple, List, Optional, Type
+from pieces import Piece, PieceType, Color, FEN_MAP, EMPTY_SQUARE
+from notation import Notation, InvalidNotation, PIECE_FEN_CHAR
+from utility import BoardUtils, MoveUndo
+from moves import (
+    Move,
+    MoveError,
+    MoveResult,
+    CASTLING_WHITE_KINGSIDE,
+    CASTLING_WHITE_QUEENSIDE,
+    CASTLING_BLACK_KINGSIDE,
+    CASTLING_BLACK_QUEENSIDE,
+    CASTLING_FEN_CHARS,
+    CASTLING_ROOK_MOVES,
+)
+from king_validation import TrackedBoard
+from zobrist import Zobrist, SIDE_KEY, EN_PASSANT_KEYS, CASTLING_KEYS
+from move_cache import MoveCache
+from evaluation import Evaluation
+from backends import BoardBackend, DictBackend
+from bitboard import BitboardBackend
+from mailbox_board import MailboxBackend
+
+# dictionary of backend names as keys and BoardBackend classes as values
+BACKEND_MAP: Dict[str, Type[BoardBackend]] = {
+    "dict": DictBackend,
+    "bitboard": BitboardBackend,
+    "mailbox": MailboxBackend,
+}
+
+# Castling rights kept when a move starts or ends on each square index, the king and rook
+# squares lose the rights they belong to
+CASTLING_RIGHTS_KEPT: List[int] = [15] * 64
+CASTLING_RIGHTS_KEPT[0 * 8 + 0] = 15 & ~CASTLING_BLACK_QUEENSIDE
+CASTLING_RIGHTS_KEPT[0 * 8 + 4] = 15 & ~(CASTLING_BLACK_KINGSIDE | CASTLING_BLACK_QUEENSIDE)
+CASTLING_RIGHTS_KEPT[0 * 8 + 7] = 15 & ~CASTLING_BLACK_KINGSIDE
+CASTLING_RIGHTS_KEPT[7 * 8 + 0] = 15 & ~CASTLING_WHITE_QUEENSIDE
+CASTLING_RIGHTS_KEPT[7 * 8 + 4] = 15 & ~(CASTLING_WHITE_KINGSIDE | CASTLING_WHITE_QUEENSIDE)
+CASTLING_RIGHTS_KEPT[7 * 8 + 7] = 15 & ~CASTLING_WHITE_KINGSIDE
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Values of the FEN fields a FEN string may leave out, after the piece placement
+DEFAULT_FEN_FIELDS = ["", "w", "-", "-", "0", "1"]
+
+# dictionary of fen characters as keys and the PieceType and Color they stand for as values
+FEN_PIECES: Dict[str, Tuple[PieceType, Color]] = {
+    **{fen_char: (piece_type, Color.BLACK) for fen_char, piece_type in FEN_MAP.items()},
+    **{
+        fen_char.upper(): (piece_type, Color.WHITE)
+        for fen_char, piece_type in FEN_MAP.items()
+    },
+}
 
 
 class Board:
@@ -14,73 +62,225 @@ class Board:
         king_in_checkmate (bool): Indicates whether the game is in a checkmate state.
         moves_made (int): The number of moves made in the game.
         expected_player (Color): The color of the player expected to make the next move.
+        en_passant_position (Optional[Tuple[int, int]]): The position of the pawn that can be captured en passant, if any.
+        backend (BoardBackend): The backend used for move generation and check detection.
+        zobrist_key (int): The Zobrist key of the current position, updated on every move.
+        move_cache (MoveCache): The cache of generated moves, keyed by the Zobrist key of the position.
+        middle_game_score (int): The middle game material and piece-square score, updated on every move.
+        end_game_score (int): The end game material and piece-square score, updated on every move.
+        phase (int): The game phase from the pieces left on the board, updated on every move.
+        castling_rights (int): The bit mask of the CASTLING_* rights left.
+        halfmove_clock (int): The number of moves since the last capture or pawn move.
+        spare_pieces (Dict[Tuple[Color, PieceType], List[Piece]]): The promoted pieces taken off the board by unmake_move, reused by the next promotion to the same piece.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, backend: str = "dict", move_cache_size: int = 1024) -> None:
         """
         Initialize the Board object.
+
+        Args:
+            backend (str): The name of the move generation backend in BACKEND_MAP (defaults to "dict").
+            move_cache_size (int): The number of move lists kept in the move cache, 0 disables it (defaults to 1024).
         """
 
         self.board = self.empty_board()
         self.king_in_checkmate = False
         self.moves_made = 0
         self.expected_player = Color.WHITE
+        self.en_passant_position: Optional[Tuple[int, int]] = None
+        self.backend = BACKEND_MAP[backend]()
+        self.zobrist_key = 0
+        self.move_cache = MoveCache(move_cache_size)
+        self.middle_game_score = 0
+        self.end_game_score = 0
+        self.phase = 0
+        self.castling_rights = 0
+        self.halfmove_clock = 0
+        self.spare_pieces: Dict[Tuple[Color, PieceType], List[Piece]] = {}
 
     def empty_board(self) -> Dict[Tuple[int, int], Piece]:
         """
         Create an empty chessboard.
 
         Returns:
-            Dict[Tuple[int, int], Piece]: A dictionary representing an empty chessboard.
+            Dict[Tuple[int, int], Piece]: A TrackedBoard dictionary representing an empty chessboard.
         """
 
-        board: Dict[Tuple[int, int], Piece] = {}
+        board: Dict[Tuple[int, int], Piece] = TrackedBoard()
         for x in range(8):
             for y in range(8):
-                board[(x, y)] = Piece(x, y)
+                board[(x, y)] = EMPTY_SQUARE
         return board
 
     def process_fen(self, fen: str) -> Dict[Tuple[int, int], Piece]:
         """
         Process the FEN string and initialize the board with the specified piece positions.
 
+        The piece placement is read in a single pass over the string, and every field is
+        checked before the board is changed. It may be followed by the side to move, castling
+        rights, en passant target square, halfmove clock and fullmove number, missing fields
+        default to white to move with no castling rights, no en passant and the clocks of a
+        new game.
+
         Args:
-            fen (str): The FEN string representing the piece positions.
+            fen (str): The FEN string representing the position.
 
         Returns:
             Dict[Tuple[int, int], Piece]: A dictionary representing the board with initialized piece positions.
 
-        TODO:Does not specify whose turn it is, and if castling is still available, or if a piece has been captured
+        Raises:
+            ValueError: If the piece placement does not have exactly 8 ranks of 8 files, or another field is not valid.
         """
-        position_map: Dict[Tuple[int, int], str] = {}
+        fields = fen.split()
+        if len(fields) > len(DEFAULT_FEN_FIELDS):
+            raise ValueError(f"{fen!r} has more than {len(DEFAULT_FEN_FIELDS)} fields")
+        placement, side, castling, en_passant, halfmove, fullmove = (
+            fields + DEFAULT_FEN_FIELDS[len(fields):]
+        )
+
+        pieces = []
         x, y = 0, 0
-
-        for char in fen:
+        for char in placement:
             if char == "/":
+                if y != 8:
+                    raise ValueError(f"Rank {8 - x} of {placement!r} does not have 8 files")
                 x += 1
                 y = 0
             elif char.isdigit():
                 y += int(char)
-            else:
-                position_map[(x, y)] = char
+            elif char in FEN_PIECES:
+                piece_type, color = FEN_PIECES[char]
+                pieces.append(Piece(x, y, type=piece_type, color=color))
                 y += 1
+            else:
+                raise ValueError(f"Unexpected {char!r} in the piece placement {placement!r}")
+            if y > 8 or x > 7:
+                raise ValueError(f"{placement!r} does not have 8 ranks of 8 files")
+        if x != 7 or y != 8:
+            raise ValueError(f"{placement!r} does not have 8 ranks of 8 files")
+
+        if side not in ("w", "b"):
+            raise ValueError(f"The side to move {side!r} is not 'w' or 'b'")
+
+        castling_rights = 0
+        if castling != "-":
+            for char in castling:
+                if char not in CASTLING_FEN_CHARS or castling_rights & (
+                    1 << CASTLING_FEN_CHARS.index(char)
+                ):
+                    raise ValueError(f"The castling rights {castling!r} are not valid")
+                castling_rights |= 1 << CASTLING_FEN_CHARS.index(char)
+
+        en_passant_position = None
+        if en_passant != "-":
+            # White captures en passant on the 6th rank, black on the 3rd
+            if (
+                len(en_passant) != 2
+                or en_passant[0] not in "abcdefgh"
+                or en_passant[1] != ("6" if side == "w" else "3")
+            ):
+                raise ValueError(f"The en passant square {en_passant!r} is not valid")
+            # The pawn that just moved two squares stands in front of the target square
+            target_x, target_y = Notation.convert_to_coordinates(en_passant)
+            en_passant_position = (4 if target_x == 5 else 3, target_y)
+
+        if not halfmove.isdigit():
+            raise ValueError(f"The halfmove clock {halfmove!r} is not a number")
+        if not fullmove.isdigit() or int(fullmove) < 1:
+            raise ValueError(f"The fullmove number {fullmove!r} is not a positive number")
+
+        board = self.board
+        for position in board:
+            board[position] = EMPTY_SQUARE
+        for piece in pieces:
+            board[(piece.x, piece.y)] = piece
+
+        self.moves_made = (int(fullmove) - 1) * 2 + (side == "b")
+        self.halfmove_clock = int(halfmove)
+        self.castling_rights = castling_rights
+        self.en_passant_position = en_passant_position
+        self.refresh()
+        return board
 
-        for x in range(x, 8):
-            for y in range(y, 8):
-                if (x, y) not in position_map:
-                    position_map[(x, y)] = Piece(x, y)
-
-        for position, fen_char in position_map.items():
-            x, y = position
-            piece = Piece(
-                x,
-                y,
-                type=PieceType(FEN_MAP[fen_char.lower()]),
-                color=Color.WHITE if fen_char.isupper() else Color.BLACK,
-            )
-            self.board[position] = piece
+    def refresh(self) -> None:
+        """
+        Recompute the state derived from the pieces after the board was written directly.
+
+        Sets the expected player from moves_made, drops an en passant position without a
+        pawn, and recomputes the king positions, Zobrist key, evaluation and backend state.
+        """
+
+        board = self.board
+        board.refresh_king_positions()
+        self.set_correct_player_turn()
 
-        return self.board
+        if self.en_passant_position is not None:
+            if board[self.en_passant_position].type == PieceType.PAWN:
+                board[self.en_passant_position].en_passantable = True
+            else:
+                self.en_passant_position = None
+
+        self.zobrist_key = Zobrist.hash_board(
+            board, self.expected_player, self.en_passant_position, self.castling_rights
+        )
+        self.middle_game_score, self.end_game_score, self.phase = (
+            Evaluation.score_board(board)
+        )
+        self.backend.load(board)
+        board.modified = False
+
+    def refresh_if_modified(self) -> None:
+        """
+        Refresh the state derived from the pieces if the board was written directly since the last refresh.
+
+        The Zobrist key changes with the refresh, so move lists cached for the position before
+        the writes are no longer served.
+        """
+
+        if self.board.modified:
+            self.refresh()
+
+    def to_fen(self) -> str:
+        """
+        Write the position as a six-field FEN string that process_fen reads back.
+
+        Returns:
+            str: The FEN string of the position.
+        """
+
+        rows = []
+        for x in range(8):
+            row = ""
+            empty_squares = 0
+            for y in range(8):
+                piece = self.board[(x, y)]
+                if piece.type == PieceType.EMPTY:
+                    empty_squares += 1
+                    continue
+                if empty_squares:
+                    row += str(empty_squares)
+                    empty_squares = 0
+                fen_char = PIECE_FEN_CHAR[piece.type]
+                row += fen_char.upper() if piece.color == Color.WHITE else fen_char
+            if empty_squares:
+                row += str(empty_squares)
+            rows.append(row)
+
+        side = "w" if self.expected_player == Color.WHITE else "b"
+        castling = "".join(
+            char
+            for bit, char in enumerate(CASTLING_FEN_CHARS)
+            if self.castling_rights >> bit & 1
+        )
+        en_passant = "-"
+        if self.en_passant_position is not None:
+            # The target square is the one the pawn passed over
+            x, y = self.en_passant_position
+            en_passant = Notation.convert_to_notation((5 if x == 4 else 2, y))
+        return (
+            f"{'/'.join(rows)} {side} {castling or '-'} {en_passant} "
+            f"{self.halfmove_clock} {self.moves_made // 2 + 1}"
+        )
 
     def set_correct_player_turn(self):
         """Set the expected player based on the number of moves made."""
@@ -99,11 +299,7 @@ class Board:
         """
 
         input_color = Color.WHITE if notation[0].isupper() else Color.BLACK
-        if self.expected_player == input_color:
-            return True
-        else:
-            print(f"{self.expected_player} is expected to play")
-            return False
+        return self.expected_player == input_color
 
     def check_move_is_valid(self, notation: str) -> bool:
         """
@@ -117,52 +313,231 @@ class Board:
         """
 
         original_pos, updated_piece = Notation.interpret_notation(notation)
-        valid_moves = self.get_valid_moves(
-            self.board[original_pos]
-        )  # this line is the problem.
-        if (updated_piece.x, updated_piece.y) in valid_moves:
-            return True
-        else:
-            print(
-                f"valid moves include {self.get_all_valid_moves(self.expected_player, self.board)}"
+        valid_moves = self.get_valid_moves(self.board[original_pos])
+        return (updated_piece.x, updated_piece.y) in valid_moves
+
+    def try_move(self, notation: str) -> MoveResult:
+        """
+        Play a move given as a piece letter followed by two squares, such as "Pe2e4", if it is legal.
+
+        Nothing is read or printed, a refused move is described by the result and leaves the
+        board unchanged. A pawn reaching the last rank is promoted to a queen, unless the
+        notation ends with the letter of another piece, as written by Notation.move_to_notation.
+
+        Args:
+            notation (str): The move, with an uppercase piece letter for white and lowercase for black, such as "Pe7e8n".
+
+        Returns:
+            MoveResult: The move played and whether it gives check, checkmate or stalemate, or the reason it was refused.
+        """
+
+        legal_moves = self.get_legal_moves()
+        if not legal_moves:
+            return MoveResult(
+                None, MoveError.GAME_OVER, f"{self.expected_player.name.lower()} has no legal moves"
+            )
+        if not Notation.is_correct_format(notation):
+            return MoveResult(
+                None,
+                MoveError.INVALID_NOTATION,
+                f"{notation!r} is not a piece letter followed by two squares, such as Pe2e4 or Pe7e8n",
+            )
+        if not Notation.piece_exists_in_original_position(self.board, notation):
+            return MoveResult(
+                None, MoveError.NO_PIECE, f"{notation[0]} is not on {notation[1:3]}"
+            )
+        if not self.check_correct_player_turn(notation):
+            return MoveResult(
+                None, MoveError.WRONG_PLAYER, f"{self.expected_player.name.lower()} is expected to play"
             )
-            return False
 
-    def move_piece(self, notation: str) -> None:
-        """Updates the board object based on the specified notation."""
+        origin, updated_piece = Notation.interpret_notation(notation)
+        target = (updated_piece.x, updated_piece.y)
+        promotions = (
+            (FEN_MAP[notation[5].lower()],) if len(notation) == 6 else (None, PieceType.QUEEN)
+        )
+        move = next(
+            (
+                move
+                for move in legal_moves
+                if move.origin == origin
+                and move.target == target
+                and move.promotion in promotions
+            ),
+            None,
+        )
+        if move is None:
+            return MoveResult(
+                None, MoveError.ILLEGAL_MOVE, f"{notation[0]} can not move to {notation[3:5]}"
+            )
 
-        while True:
-            self.set_correct_player_turn()
-            if self.check_correct_player_turn(notation) and self.check_move_is_valid(
-                notation
-            ):
-                original_pos, updated_piece = Notation.interpret_notation(notation)
-                self.board[original_pos] = Piece(
-                    original_pos[0], original_pos[1], type=PieceType.EMPTY
-                )
-                new_x, new_y = updated_piece.x, updated_piece.y
-                self.board[(new_x, new_y)] = updated_piece
-                updated_piece.has_moved = True
-
-                # Special check for double pawn moves
-                if (
-                    updated_piece.type == PieceType.PAWN
-                    and abs(original_pos[0] - new_x) == 2
-                ):
-                    updated_piece.en_passantable = True
-                else:
-                    updated_piece.en_passantable = False
+        self.make_move(*move)
+        check = self.is_king_in_check(self.expected_player)
+        no_moves = not self.get_legal_moves()
+        self.king_in_checkmate = check and no_moves
+        return MoveResult(
+            move, check=check, checkmate=check and no_moves, stalemate=no_moves and not check
+        )
 
-                # Special check for pawn promotion to queen
-                self.board = BoardUtils.promote_pawn_if_available(
-                    updated_piece, self.board
-                )
+    def move_piece(self, notation: str) -> MoveResult:
+        """
+        Play a move given as a piece letter followed by two squares, such as "Pe2e4".
 
-                self.moves_made += 1
-                break
-            else:
-                print("Invalid move. Please try again.")
-                notation = input("Enter notation: ")
+        Args:
+            notation (str): The move, with an uppercase piece letter for white and lowercase for black.
+
+        Returns:
+            MoveResult: The move played and whether it gives check, checkmate or stalemate.
+
+        Raises:
+            InvalidNotation: If the move is refused, with the reason from try_move.
+        """
+
+        result = self.try_move(notation)
+        if not result.ok:
+            raise InvalidNotation(notation, result.message)
+        return result
+
+    def make_move(
+        self,
+        origin: Tuple[int, int],
+        target: Tuple[int, int],
+        promotion: Optional[PieceType] = None,
+    ) -> MoveUndo:
+        """
+        Play a move on the board in place without validating it.
+
+        Handles captures, en passant, pawn promotion, castling, castling rights and the move
+        counters. Castling is played as the two square move of the king.
+
+        Args:
+            origin (Tuple[int, int]): The position of the piece to move.
+            target (Tuple[int, int]): The position to move the piece to.
+            promotion (Optional[PieceType]): The piece type a pawn reaching the last rank is promoted to (defaults to a queen).
+
+        Returns:
+            MoveUndo: The record needed by unmake_move to revert the move.
+        """
+
+        self.refresh_if_modified()
+        key = self.zobrist_key ^ SIDE_KEY
+
+        # En passant is only available for one turn
+        previous_en_passant = self.en_passant_position
+        if previous_en_passant is not None:
+            self.board[previous_en_passant].en_passantable = False
+            self.en_passant_position = None
+            key ^= EN_PASSANT_KEYS[previous_en_passant[1]]
+
+        piece = self.board[origin]
+        key ^= Zobrist.piece_key(piece, origin)
+        undo = BoardUtils.make_move(self.board, piece, target[0], target[1])
+        undo.en_passant_position = previous_en_passant
+        undo.zobrist_key = self.zobrist_key
+        key ^= Zobrist.piece_key(undo.captured, undo.captured_position)
+        piece.has_moved = True
+
+        undo.halfmove_clock = self.halfmove_clock
+        if piece.type == PieceType.PAWN or undo.captured.type != PieceType.EMPTY:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+
+        # Moving a king or rook, or capturing a rook, gives up the matching rights
+        undo.castling_rights = self.castling_rights
+        self.castling_rights &= (
+            CASTLING_RIGHTS_KEPT[origin[0] * 8 + origin[1]]
+            & CASTLING_RIGHTS_KEPT[target[0] * 8 + target[1]]
+        )
+        key ^= CASTLING_KEYS[undo.castling_rights] ^ CASTLING_KEYS[self.castling_rights]
+
+        # Special check for double pawn moves
+        if piece.type == PieceType.PAWN and abs(origin[0] - target[0]) == 2:
+            piece.en_passantable = True
+            self.en_passant_position = target
+            key ^= EN_PASSANT_KEYS[target[1]]
+        else:
+            piece.en_passantable = False
+
+        # Special check for pawn promotion
+        BoardUtils.promote_pawn_if_available(
+            piece, self.board, promotion or PieceType.QUEEN, self.spare_pieces
+        )
+        if self.board[target] is not piece:
+            undo.promoted = self.board[target]
+
+        # Hash the piece now on the target, which is the promoted piece after a promotion
+        key ^= Zobrist.piece_key(self.board[target], target)
+
+        # Castling is played as a king move of two squares, the rook moves with it
+        rook_move = None
+        if piece.type == PieceType.KING and abs(origin[1] - target[1]) == 2:
+            rook_move = CASTLING_ROOK_MOVES[Move(origin, target)]
+            rook = self.board[rook_move.origin]
+            key ^= Zobrist.piece_key(rook, rook_move.origin)
+            undo.rook_undo = BoardUtils.make_move(self.board, rook, *rook_move.target)
+            undo.rook_undo.en_passant_position = previous_en_passant
+            rook.has_moved = True
+            key ^= Zobrist.piece_key(rook, rook_move.target)
+        self.zobrist_key = key
+
+        # Replace the evaluation terms of the moved, captured and promoted pieces
+        undo.evaluation = (self.middle_game_score, self.end_game_score, self.phase)
+        changes = [
+            (-1, piece, origin),
+            (-1, undo.captured, undo.captured_position),
+            (1, self.board[target], target),
+        ]
+        if rook_move is not None:
+            changes += [
+                (-1, undo.rook_undo.piece, rook_move.origin),
+                (1, undo.rook_undo.piece, rook_move.target),
+            ]
+        for sign, moved_piece, position in changes:
+            middle_game, end_game, weight = Evaluation.piece_scores(
+                moved_piece, position
+            )
+            self.middle_game_score += sign * middle_game
+            self.end_game_score += sign * end_game
+            self.phase += sign * weight
+
+        self.backend.make_move(undo)
+        if undo.rook_undo is not None:
+            self.backend.make_move(undo.rook_undo)
+        self.moves_made += 1
+        self.set_correct_player_turn()
+        return undo
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Revert a move played with make_move.
+
+        Args:
+            undo (MoveUndo): The record returned by make_move.
+        """
+
+        if undo.rook_undo is not None:
+            BoardUtils.unmake_move(self.board, undo.rook_undo)
+            self.backend.unmake_move(undo.rook_undo)
+        BoardUtils.unmake_move(self.board, undo)
+        self.backend.unmake_move(undo)
+
+        self.en_passant_position = undo.en_passant_position
+        if self.en_passant_position is not None:
+            self.board[self.en_passant_position].en_passantable = True
+        self.zobrist_key = undo.zobrist_key
+        self.middle_game_score, self.end_game_score, self.phase = undo.evaluation
+        self.castling_rights = undo.castling_rights
+        self.halfmove_clock = undo.halfmove_clock
+
+        # The promoted piece is off the board again, a search promotes to it many times
+        if undo.promoted is not None:
+            self.spare_pieces.setdefault(
+                (undo.promoted.color, undo.promoted.type), []
+            ).append(undo.promoted)
+
+        self.moves_made -= 1
+        self.set_correct_player_turn()
 
     def get_valid_moves(self, piece: Piece) -> List[Tuple[int, int]]:
         """
@@ -174,12 +549,26 @@ class Board:
         Returns:
             List[Tuple[int, int]]: A list of valid moves for the piece.
         """
-        pieceMovement_class = PIECE_MOVE_MAP[piece.type]
-        piece_movement_instance = pieceMovement_class(piece)
-        if piece_movement_instance:
-            return piece_movement_instance.get_valid_moves(self.board)
-        else:
-            print("Piece not recognized for movement")
+
+        self.refresh_if_modified()
+        position = (piece.x, piece.y)
+        if self.board.get(position) is not piece:
+            return self.backend.get_valid_moves(piece, self.board)
+
+        key = (self.zobrist_key, position)
+        valid_moves = self.move_cache.get(key)
+        if valid_moves is None:
+            valid_moves = self.backend.get_valid_moves(piece, self.board)
+            if piece.type == PieceType.KING and self.castling_rights:
+                valid_moves += [
+                    move.target
+                    for move in self.backend.get_castling_moves(
+                        piece.color, self.board, self.castling_rights
+                    )
+                    if move.origin == position
+                ]
+            self.move_cache.put(key, valid_moves)
+        return list(valid_moves)
 
     def get_all_valid_moves(
         self, color: Color, board: Dict[Tuple[int, int], Piece]
@@ -195,12 +584,162 @@ class Board:
             List[Tuple[int, int]]: A list of valid moves for pieces of the specified color.
         """
 
-        all_valid_moves = []
-        for position, piece in board.items():
-            if piece.color == color:
-                piece_valid_moves = self.get_valid_moves(piece)
-                all_valid_moves.extend(piece_valid_moves)
-        return all_valid_moves
+        # Only the position of this board is hashed
+        if board is not self.board:
+            return self.backend.get_all_valid_moves(color, board)
+
+        self.refresh_if_modified()
+        key = (self.zobrist_key, "all", color)
+        all_valid_moves = self.move_cache.get(key)
+        if all_valid_moves is None:
+            all_valid_moves = self.backend.get_all_valid_moves(color, board)
+            self.move_cache.put(key, all_valid_moves)
+        return list(all_valid_moves)
+
+    def get_legal_moves(self, color: Optional[Color] = None) -> List[Move]:
+        """
+        Get every legal move of the given color, with one move per promotion piece type.
+
+        Args:
+            color (Optional[Color]): The color of the side to move (defaults to the expected player).
+
+        Returns:
+            List[Move]: The legal moves, which can be played with make_move(*move).
+        """
+
+        self.refresh_if_modified()
+        key = (self.zobrist_key, "legal", color or self.expected_player)
+        legal_moves = self.move_cache.get(key)
+        if legal_moves is None:
+            legal_moves = self.generate_legal_moves(color)
+            self.move_cache.put(key, legal_moves)
+        return list(legal_moves)
+
+    def generate_legal_moves(self, color: Optional[Color] = None) -> List[Move]:
+        """
+        Generate every legal move of the given color with the backend, castling included, bypassing the move cache.
+
+        Args:
+            color (Optional[Color]): The color of the side to move (defaults to the expected player).
+
+        Returns:
+            List[Move]: The legal moves, which can be played with make_move(*move).
+        """
+
+        self.refresh_if_modified()
+        color = color or self.expected_player
+        legal_moves = self.backend.get_legal_moves(color, self.board)
+        if self.castling_rights:
+            legal_moves += self.backend.get_castling_moves(
+                color, self.board, self.castling_rights
+            )
+        return legal_moves
+
+    def san_to_move(self, san: str) -> Move:
+        """
+        Find the legal move a standard algebraic notation (SAN) move stands for.
+
+        Args:
+            san (str): The move in SAN, such as "Nf3", "exd5", "O-O" or "e8=Q+".
+
+        Returns:
+            Move: The legal move of the expected player described by the notation.
+
+        Raises:
+            InvalidNotation: If the notation does not match exactly one legal move.
+        """
+        return Notation.san_to_move(self.board, san, self.get_legal_moves())
+
+    def move_to_san(self, move: Move) -> str:
+        """
+        Write a legal move of the expected player in standard algebraic notation (SAN).
+
+        The move is played and reverted to add the check or mate suffix.
+
+        Args:
+            move (Move): The move to write.
+
+        Returns:
+            str: The move in SAN.
+        """
+
+        legal_moves = self.get_legal_moves()
+        undo = self.make_move(*move)
+        suffix = ""
+        if self.is_king_in_check(self.expected_player):
+            suffix = "+" if self.generate_legal_moves() else "#"
+        self.unmake_move(undo)
+        return Notation.move_to_san(self.board, move, legal_moves, suffix)
+
+    def perft(self, depth: int) -> int:
+        """
+        Count the leaf nodes of the legal move tree to the given depth.
+
+        Args:
+            depth (int): The number of plies to search.
+
+        Returns:
+            int: The number of positions reached after exactly depth plies.
+        """
+
+        if depth == 0:
+            return 1
+
+        # Generated directly, so the move cache can not hide move generation errors
+        legal_moves = self.generate_legal_moves()
+        # The last ply only needs to be counted, not played
+        if depth == 1:
+            return len(legal_moves)
+
+        nodes = 0
+        for move in legal_moves:
+            undo = self.make_move(*move)
+            nodes += self.perft(depth - 1)
+            self.unmake_move(undo)
+        return nodes
+
+    def divide(self, depth: int) -> Dict[Move, int]:
+        """
+        Count the perft nodes below each legal move, to locate move generation errors.
+
+        Args:
+            depth (int): The number of plies to search, including the root move.
+
+        Returns:
+            Dict[Move, int]: The number of leaf nodes reached through each root move.
+        """
+
+        nodes = {}
+        for move in self.get_legal_moves():
+            undo = self.make_move(*move)
+            nodes[move] = self.perft(depth - 1)
+            self.unmake_move(undo)
+        return nodes
+
+    @property
+    def evaluation(self) -> int:
+        """
+        Get the static evaluation of the current position, kept up to date on every move.
+
+        Returns:
+            int: The score in centipawns, positive when white is better.
+        """
+
+        self.refresh_if_modified()
+        return Evaluation.taper(self.middle_game_score, self.end_game_score, self.phase)
+
+    def is_king_in_check(self, color: Color) -> bool:
+        """
+        Check if the king of the given color is in check.
+
+        Args:
+            color (Color): The color of the king.
+
+        Returns:
+            bool: True if the king is in check, False otherwise.
+        """
+        self.refresh_if_modified()
+        return self.backend.is_king_in_check(color, self.board)
 
     def check_is_king_in_checkmate(self) -> None:
         """
@@ -208,9 +747,7 @@ class Board:
         """
 
         if (
-            UniversalMovementValidation.is_king_in_check(
-                self.expected_player, self.board
-            )
+            self.is_king_in_check(self.expected_player)
             and self.get_all_valid_moves == []
         ):
             self.king_in_checkmate = True
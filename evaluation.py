@@ -0,0 +1,291 @@
+from typing import Dict, List, Tuple
+from pieces import Piece, PieceType, Color, EMPTY_SQUARE
+from moves import Move, UniversalMovementValidation
+from king_validation import set_square
+
+# Material values in centipawns, for the middle game and the end game
+MIDDLE_GAME_VALUES: Dict[PieceType, int] = {
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 0,
+}
+END_GAME_VALUES: Dict[PieceType, int] = {
+    PieceType.PAWN: 120,
+    PieceType.KNIGHT: 300,
+    PieceType.BISHOP: 320,
+    PieceType.ROOK: 520,
+    PieceType.QUEEN: 920,
+    PieceType.KING: 0,
+}
+
+# Values used when exchanging pieces, the king is never given up
+EXCHANGE_VALUES: Dict[PieceType, int] = {
+    **MIDDLE_GAME_VALUES,
+    PieceType.EMPTY: 0,
+    PieceType.KING: 20000,
+}
+
+# Contribution of each piece to the game phase, the starting position has the full phase
+PHASE_WEIGHTS: Dict[PieceType, int] = {
+    PieceType.EMPTY: 0,
+    PieceType.PAWN: 0,
+    PieceType.KNIGHT: 1,
+    PieceType.BISHOP: 1,
+    PieceType.ROOK: 2,
+    PieceType.QUEEN: 4,
+    PieceType.KING: 0,
+}
+FULL_PHASE = 24
+
+# Piece-square bonuses for white, laid out as the board is printed (rank 8 first), so the
+# bonus of position (x, y) is at index x * 8 + y. Black uses the vertically mirrored table.
+PAWN_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    50, 50, 50, 50, 50, 50, 50, 50,
+    10, 10, 20, 30, 30, 20, 10, 10,
+    5, 5, 10, 25, 25, 10, 5, 5,
+    0, 0, 0, 20, 20, 0, 0, 0,
+    5, -5, -10, 0, 0, -10, -5, 5,
+    5, 10, 10, -20, -20, 10, 10, 5,
+    0, 0, 0, 0, 0, 0, 0, 0,
+]  # fmt: skip
+KNIGHT_TABLE = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20, 0, 0, 0, 0, -20, -40,
+    -30, 0, 10, 15, 15, 10, 0, -30,
+    -30, 5, 15, 20, 20, 15, 5, -30,
+    -30, 0, 15, 20, 20, 15, 0, -30,
+    -30, 5, 10, 15, 15, 10, 5, -30,
+    -40, -20, 0, 5, 5, 0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]  # fmt: skip
+BISHOP_TABLE = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 10, 10, 5, 0, -10,
+    -10, 5, 5, 10, 10, 5, 5, -10,
+    -10, 0, 10, 10, 10, 10, 0, -10,
+    -10, 10, 10, 10, 10, 10, 10, -10,
+    -10, 5, 0, 0, 0, 0, 5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]  # fmt: skip
+ROOK_TABLE = [
+    0, 0, 0, 0, 0, 0, 0, 0,
+    5, 10, 10, 10, 10, 10, 10, 5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    -5, 0, 0, 0, 0, 0, 0, -5,
+    0, 0, 0, 5, 5, 0, 0, 0,
+]  # fmt: skip
+QUEEN_TABLE = [
+    -20, -10, -10, -5, -5, -10, -10, -20,
+    -10, 0, 0, 0, 0, 0, 0, -10,
+    -10, 0, 5, 5, 5, 5, 0, -10,
+    -5, 0, 5, 5, 5, 5, 0, -5,
+    0, 0, 5, 5, 5, 5, 0, -5,
+    -10, 5, 5, 5, 5, 5, 0, -10,
+    -10, 0, 5, 0, 0, 0, 0, -10,
+    -20, -10, -10, -5, -5, -10, -10, -20,
+]  # fmt: skip
+KING_MIDDLE_GAME_TABLE = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+    20, 20, 0, 0, 0, 0, 20, 20,
+    20, 30, 10, 0, 0, 10, 30, 20,
+]  # fmt: skip
+KING_END_GAME_TABLE = [
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10, 0, 0, -10, -20, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 30, 40, 40, 30, -10, -30,
+    -30, -10, 20, 30, 30, 20, -10, -30,
+    -30, -30, 0, 0, 0, 0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+]  # fmt: skip
+
+MIDDLE_GAME_TABLES: Dict[PieceType, List[int]] = {
+    PieceType.PAWN: PAWN_TABLE,
+    PieceType.KNIGHT: KNIGHT_TABLE,
+    PieceType.BISHOP: BISHOP_TABLE,
+    PieceType.ROOK: ROOK_TABLE,
+    PieceType.QUEEN: QUEEN_TABLE,
+    PieceType.KING: KING_MIDDLE_GAME_TABLE,
+}
+END_GAME_TABLES: Dict[PieceType, List[int]] = {
+    **MIDDLE_GAME_TABLES,
+    PieceType.KING: KING_END_GAME_TABLE,
+}
+
+
+def build_score_table(
+    values: Dict[PieceType, int], tables: Dict[PieceType, List[int]]
+) -> Dict[Tuple[PieceType, Color], List[int]]:
+    """
+    Combine material and piece-square bonuses into one signed score per piece and square.
+
+    Args:
+        values (Dict[PieceType, int]): The material value of each piece type.
+        tables (Dict[PieceType, List[int]]): The piece-square bonuses for white of each piece type.
+
+    Returns:
+        Dict[Tuple[PieceType, Color], List[int]]: The score of each piece type and color on each
+        square index, positive for white and negative for black (0 for empty squares).
+    """
+
+    scores = {(PieceType.EMPTY, Color.NONE): [0] * 64}
+    for piece_type, table in tables.items():
+        scores[(piece_type, Color.WHITE)] = [
+            values[piece_type] + table[square] for square in range(64)
+        ]
+        scores[(piece_type, Color.BLACK)] = [
+            -values[piece_type] - table[(7 - square // 8) * 8 + square % 8]
+            for square in range(64)
+        ]
+    return scores
+
+
+MIDDLE_GAME_SCORES = build_score_table(MIDDLE_GAME_VALUES, MIDDLE_GAME_TABLES)
+END_GAME_SCORES = build_score_table(END_GAME_VALUES, END_GAME_TABLES)
+
+
+class Evaluation:
+    """
+    Utility class for the static evaluation of a position.
+
+    A position is scored by material and piece-square bonuses, summed separately for the
+    middle game and the end game and blended by the game phase. Every term belongs to a
+    single piece, so the Board keeps the sums up to date by adding and removing the terms
+    of the pieces a move changes.
+    """
+
+    @staticmethod
+    def piece_scores(piece: Piece, position: Tuple[int, int]) -> Tuple[int, int, int]:
+        """
+        Get the terms of one piece standing on the given position.
+
+        Args:
+            piece (Piece): The piece (an empty piece has no terms).
+            position (Tuple[int, int]): The position of the piece.
+
+        Returns:
+            Tuple[int, int, int]: The middle game score, end game score and phase weight of the piece.
+        """
+
+        square = position[0] * 8 + position[1]
+        kind = (piece.type, piece.color)
+        return (
+            MIDDLE_GAME_SCORES[kind][square],
+            END_GAME_SCORES[kind][square],
+            PHASE_WEIGHTS[piece.type],
+        )
+
+    @staticmethod
+    def score_board(board: Dict[Tuple[int, int], Piece]) -> Tuple[int, int, int]:
+        """
+        Sum the terms of every piece on the board from scratch.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            Tuple[int, int, int]: The middle game score, end game score and phase of the board.
+        """
+
+        middle_game, end_game, phase = 0, 0, 0
+        for position, piece in board.items():
+            piece_middle_game, piece_end_game, weight = Evaluation.piece_scores(
+                piece, position
+            )
+            middle_game += piece_middle_game
+            end_game += piece_end_game
+            phase += weight
+        return middle_game, end_game, phase
+
+    @staticmethod
+    def taper(middle_game: int, end_game: int, phase: int) -> int:
+        """
+        Blend the middle game and end game scores by the game phase.
+
+        Args:
+            middle_game (int): The middle game score.
+            end_game (int): The end game score.
+            phase (int): The game phase, FULL_PHASE with all pieces on the board and 0 with only pawns and kings.
+
+        Returns:
+            int: The score in centipawns, positive when white is better.
+        """
+
+        phase = min(phase, FULL_PHASE)
+        return (middle_game * phase + end_game * (FULL_PHASE - phase)) // FULL_PHASE
+
+    @staticmethod
+    def static_exchange(board: Dict[Tuple[int, int], Piece], move: Move) -> int:
+        """
+        Estimate the material won by a capture once every recapture on its square is played.
+
+        Both sides recapture with their least valuable attacker and may stop when going on
+        would lose material. Each capturing piece is lifted off the board while the next
+        attackers are looked up, so pieces behind it on the same ray join the exchange.
+        Pins are ignored. The board is restored before returning.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            move (Move): The capture to evaluate.
+
+        Returns:
+            int: The expected material balance of the exchange for the moving side, in centipawns.
+        """
+
+        piece = board[move.origin]
+        target = move.target
+        captured_position = target
+        # A pawn moving diagonally onto an empty square captures en passant
+        if (
+            piece.type == PieceType.PAWN
+            and board[target].type == PieceType.EMPTY
+            and move.origin[1] != target[1]
+        ):
+            captured_position = (move.origin[0], target[1])
+
+        gains = [EXCHANGE_VALUES[board[captured_position].type]]
+        on_target = EXCHANGE_VALUES[move.promotion or piece.type]
+        lifted = {move.origin: piece, captured_position: board[captured_position]}
+        set_square(board, move.origin, EMPTY_SQUARE)
+        set_square(board, captured_position, EMPTY_SQUARE)
+
+        side = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+        try:
+            while True:
+                attackers = UniversalMovementValidation.get_attackers(
+                    board, target, side
+                )
+                if not attackers:
+                    break
+                position = min(
+                    attackers,
+                    key=lambda attacker: EXCHANGE_VALUES[board[attacker].type],
+                )
+                gains.append(on_target - gains[-1])
+                on_target = EXCHANGE_VALUES[board[position].type]
+                lifted[position] = board[position]
+                set_square(board, position, EMPTY_SQUARE)
+                side = Color.BLACK if side == Color.WHITE else Color.WHITE
+        finally:
+            # The lift is never seen by the king tracking of a TrackedBoard, nor marks it as modified
+            for position, lifted_piece in lifted.items():
+                set_square(board, position, lifted_piece)
+
+        # Each side only continues the exchange when it does not lose by it
+        for index in range(len(gains) - 1, 0, -1):
+            gains[index - 1] = -max(-gains[index - 1], gains[index])
+        return gains[0]
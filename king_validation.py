@@ -15,6 +15,9 @@ class KingValidation:
         """
         Find the position of the king of the specified color on the given board.
 
+        A TrackedBoard returns its recorded king position while that square still holds the
+        king, any other board is scanned.
+
         Args:
             board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
             color (Color): The color of the king to find.
@@ -26,6 +29,20 @@ class KingValidation:
             KingNotFound: If the king of the specified color is not found on the board.
         """
 
+        # Boards that track their kings answer without scanning, unless a direct write
+        # to the board moved or removed a king since the positions were recorded
+        king_positions = getattr(board, "king_positions", None)
+        if king_positions is not None:
+            position = king_positions.get(color)
+            if position is not None:
+                piece = board.get(position)
+                if piece is not None and piece.type == PieceType.KING and piece.color == color:
+                    return position
+            board.refresh_king_positions()
+            if color not in board.king_positions:
+                raise KingNotFound(color)
+            return board.king_positions[color]
+
         king_position = (None, None)  # Initialize king position to None
 
         for piece in board.values():
@@ -40,6 +57,53 @@ class KingValidation:
         return king_position
 
 
+# Writes a square without marking a TrackedBoard as modified, for moves the caller keeps track of
+set_square = dict.__setitem__
+
+
+class TrackedBoard(dict):
+    """
+    Dictionary board that also records the position of each king.
+
+    The positions are set from scratch by refresh_king_positions and kept up to date by
+    BoardUtils.make_move and BoardUtils.unmake_move. The BoardUtils moves write with
+    set_square, any other write marks the board as modified, so the Board knows to refresh
+    the state derived from it, and KingValidation.find_king_position scans again when a
+    recorded square no longer holds its king.
+
+    Attributes:
+        king_positions (Dict[Color, Tuple[int, int]]): The position of the king of each color on the board.
+        modified (bool): Whether the board was written directly since the Board last refreshed.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the TrackedBoard and record the kings it holds."""
+        super().__init__(*args, **kwargs)
+        self.king_positions: Dict[Color, Tuple[int, int]] = {}
+        self.modified = False
+        self.refresh_king_positions()
+
+    def __setitem__(self, position: Tuple[int, int], piece: Piece) -> None:
+        """Write a square and mark the board as modified."""
+        self.modified = True
+        super().__setitem__(position, piece)
+
+    def __delitem__(self, position: Tuple[int, int]) -> None:
+        """Remove a square and mark the board as modified."""
+        self.modified = True
+        super().__delitem__(position)
+
+    def refresh_king_positions(self) -> None:
+        """
+        Record the king positions by scanning the whole board, after it was filled directly.
+        """
+
+        self.king_positions = {}
+        for position, piece in self.items():
+            if piece.type == PieceType.KING and piece.color not in self.king_positions:
+                self.king_positions[piece.color] = position
+
+
 class KingNotFound(Exception):
     """
     Exception raised when the king of a specified color is not found on the board.
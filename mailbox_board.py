@@ -0,0 +1,504 @@
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+from pieces import Piece, PieceType, Color, EMPTY_SQUARE
+from backends import BoardBackend, DictBackend
+from king_validation import KingNotFound
+from utility import MoveUndo
+from moves import Move, PROMOTION_TYPES
+
+# Piece codes, positive for white and negative for black pieces
+EMPTY, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(7)
+OFF_BOARD = 7
+
+PIECE_CODE: Dict[PieceType, int] = {
+    PieceType.EMPTY: EMPTY,
+    PieceType.PAWN: PAWN,
+    PieceType.KNIGHT: KNIGHT,
+    PieceType.BISHOP: BISHOP,
+    PieceType.ROOK: ROOK,
+    PieceType.QUEEN: QUEEN,
+    PieceType.KING: KING,
+}
+CODE_PIECE_TYPE: Dict[int, PieceType] = {
+    code: piece_type for piece_type, code in PIECE_CODE.items()
+}
+
+# Sign of the piece codes of each color, indexed by color value
+COLOR_SIGN: List[int] = [1, -1]
+
+# Square steps in the 10x12 layout, one row is 10 squares wide
+KNIGHT_OFFSETS: List[int] = [-21, -19, -12, -8, 8, 12, 19, 21]
+ROOK_OFFSETS: List[int] = [-10, -1, 1, 10]
+BISHOP_OFFSETS: List[int] = [-11, -9, 9, 11]
+KING_OFFSETS: List[int] = ROOK_OFFSETS + BISHOP_OFFSETS
+
+# Mailbox index of each position (x, y), surrounded by two sentinel rows and one sentinel column
+MAILBOX_INDEX: Dict[Tuple[int, int], int] = {
+    (x, y): (x + 2) * 10 + y + 1 for x in range(8) for y in range(8)
+}
+MAILBOX_POSITION: Dict[int, Tuple[int, int]] = {
+    index: position for position, index in MAILBOX_INDEX.items()
+}
+
+# Mailbox array of an empty board
+EMPTY_MAILBOX = array(
+    "b", [EMPTY if index in MAILBOX_POSITION else OFF_BOARD for index in range(120)]
+)
+
+# Move generator for boards the backend state was not loaded from
+DICT_BACKEND = DictBackend()
+
+
+def piece_code(piece: Piece) -> int:
+    """
+    Get the mailbox code of a piece.
+
+    Args:
+        piece (Piece): The piece to encode.
+
+    Returns:
+        int: The signed code of the piece, 0 for an empty square.
+    """
+
+    if piece.type == PieceType.EMPTY:
+        return EMPTY
+    return PIECE_CODE[piece.type] * COLOR_SIGN[piece.color.value]
+
+
+class MailboxBackend(BoardBackend):
+    """
+    Backend storing the position as a 10x12 mailbox array of small integer piece codes.
+
+    The 8x8 board is surrounded by OFF_BOARD sentinels, two rows deep so that knight jumps
+    never leave the array. Any step from a square is a single array read, and running into
+    a sentinel replaces the coordinate bounds checks of is_within_board.
+
+    Inherits from BoardBackend.
+
+    Attributes:
+        squares (array): The 120 signed piece codes, indexed by MAILBOX_INDEX.
+        king_squares (List[Optional[int]]): The mailbox index of each king, indexed by color value.
+        en_passant (Optional[int]): The mailbox index of the pawn that can be captured en passant, if any.
+        loaded_board (Optional[Dict[Tuple[int, int], Piece]]): The board the array was last loaded from.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty MailboxBackend."""
+        self.squares = array("b", EMPTY_MAILBOX)
+        self.king_squares: List[Optional[int]] = [None, None]
+        self.en_passant: Optional[int] = None
+        self.loaded_board: Optional[Dict[Tuple[int, int], Piece]] = None
+
+    def load(self, board: Dict[Tuple[int, int], Piece]) -> None:
+        """
+        Rebuild the mailbox array from the given board.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+        """
+
+        self.squares = array("b", EMPTY_MAILBOX)
+        self.king_squares = [None, None]
+        self.en_passant = None
+        self.loaded_board = board
+        for position, piece in board.items():
+            self._place(piece, MAILBOX_INDEX[position])
+            if piece.en_passantable:
+                self.en_passant = MAILBOX_INDEX[position]
+
+    def _place(self, piece: Piece, index: int) -> None:
+        """
+        Put a piece on the given square, or empty it for an empty piece.
+
+        Args:
+            piece (Piece): The piece to place.
+            index (int): The mailbox index of the square.
+        """
+
+        self.squares[index] = piece_code(piece)
+        if piece.type == PieceType.KING:
+            self.king_squares[piece.color.value] = index
+
+    def make_move(self, undo: MoveUndo) -> None:
+        """
+        Update the mailbox array after a move was played on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was played.
+        """
+
+        if undo.captured.type == PieceType.KING:
+            self.king_squares[undo.captured.color.value] = None
+        self.squares[MAILBOX_INDEX[undo.captured_position]] = EMPTY
+        self.squares[MAILBOX_INDEX[undo.origin]] = EMPTY
+        self._place(undo.promoted or undo.piece, MAILBOX_INDEX[undo.target])
+
+        self.en_passant = (
+            MAILBOX_INDEX[undo.target] if undo.piece.en_passantable else None
+        )
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Update the mailbox array after a move was reverted on the board.
+
+        Args:
+            undo (MoveUndo): The record of the move that was reverted.
+        """
+
+        self.squares[MAILBOX_INDEX[undo.target]] = EMPTY
+        self._place(undo.captured, MAILBOX_INDEX[undo.captured_position])
+        self._place(undo.piece, MAILBOX_INDEX[undo.origin])
+
+        self.en_passant = (
+            MAILBOX_INDEX[undo.en_passant_position]
+            if undo.en_passant_position is not None
+            else None
+        )
+
+    def is_square_attacked(self, index: int, sign: int) -> bool:
+        """
+        Check if a square is attacked by the pieces of one color.
+
+        Args:
+            index (int): The mailbox index of the square.
+            sign (int): The sign of the piece codes of the attacking color.
+
+        Returns:
+            bool: True if any piece of the attacking color attacks the square, False otherwise.
+        """
+
+        squares = self.squares
+
+        # White pawns attack towards lower rows, so they stand below the square
+        pawn = PAWN * sign
+        if squares[index + 9 * sign] == pawn or squares[index + 11 * sign] == pawn:
+            return True
+
+        knight = KNIGHT * sign
+        for offset in KNIGHT_OFFSETS:
+            if squares[index + offset] == knight:
+                return True
+
+        king = KING * sign
+        for offset in KING_OFFSETS:
+            if squares[index + offset] == king:
+                return True
+
+        for offsets, slider in ((ROOK_OFFSETS, ROOK), (BISHOP_OFFSETS, BISHOP)):
+            slider, queen = slider * sign, QUEEN * sign
+            for offset in offsets:
+                target = index + offset
+                while squares[target] == EMPTY:
+                    target += offset
+                if squares[target] == slider or squares[target] == queen:
+                    return True
+        return False
+
+    def _get_pseudo_legal_moves(
+        self, origin: int, sign: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Get the moves of the piece on the given square, without checking the safety of the king.
+
+        Args:
+            origin (int): The mailbox index of the piece.
+            sign (int): The sign of the piece codes of the side to move.
+
+        Returns:
+            List[Tuple[int, int, int]]: The origin, target and captured square of each move.
+        """
+
+        squares = self.squares
+        code = squares[origin] * sign
+        moves = []
+
+        if code == PAWN:
+            forward = -10 * sign
+            target = origin + forward
+            if squares[target] == EMPTY:
+                moves.append((origin, target, target))
+                # Double push from the starting row (row 8 for white, row 3 for black)
+                if origin // 10 == (8 if sign == 1 else 3) and (
+                    squares[target + forward] == EMPTY
+                ):
+                    moves.append((origin, target + forward, target + forward))
+            for side in (-1, 1):
+                target = origin + forward + side
+                captured = squares[target]
+                if captured != OFF_BOARD and captured * sign < 0:
+                    moves.append((origin, target, target))
+                elif captured == EMPTY and origin + side == self.en_passant:
+                    moves.append((origin, target, origin + side))
+
+        elif code == KNIGHT or code == KING:
+            for offset in KNIGHT_OFFSETS if code == KNIGHT else KING_OFFSETS:
+                target = origin + offset
+                captured = squares[target]
+                if captured != OFF_BOARD and captured * sign <= 0:
+                    moves.append((origin, target, target))
+
+        else:
+            if code == ROOK:
+                offsets = ROOK_OFFSETS
+            elif code == BISHOP:
+                offsets = BISHOP_OFFSETS
+            else:
+                offsets = KING_OFFSETS
+            for offset in offsets:
+                target = origin + offset
+                while squares[target] == EMPTY:
+                    moves.append((origin, target, target))
+                    target += offset
+                if squares[target] != OFF_BOARD and squares[target] * sign < 0:
+                    moves.append((origin, target, target))
+
+        return moves
+
+    def _is_legal(self, origin: int, target: int, captured: int, sign: int) -> bool:
+        """
+        Check that a move does not leave the king of the side to move in check.
+
+        The move is played on the array, the king square tested and the array restored.
+
+        Args:
+            origin (int): The mailbox index the piece moves from.
+            target (int): The mailbox index the piece moves to.
+            captured (int): The mailbox index of the captured piece (differs from target for en passant).
+            sign (int): The sign of the piece codes of the side to move.
+
+        Returns:
+            bool: True if the king is safe after the move, False otherwise.
+
+        Raises:
+            KingNotFound: If there is no king of the side to move.
+        """
+
+        squares = self.squares
+        moving = squares[origin]
+        color = Color.WHITE if sign == 1 else Color.BLACK
+        king = target if moving == KING * sign else self.king_squares[color.value]
+        if king is None:
+            raise KingNotFound(color)
+
+        captured_code = squares[captured]
+        squares[captured] = EMPTY
+        squares[origin] = EMPTY
+        squares[target] = moving
+        is_safe = not self.is_square_attacked(king, -sign)
+        squares[target] = EMPTY
+        squares[captured] = captured_code
+        squares[origin] = moving
+        return is_safe
+
+    def _generate_legal_moves(self, color: Color) -> List[Tuple[int, int]]:
+        """
+        Generate the legal moves of every piece of the given color.
+
+        Args:
+            color (Color): The color of the side to move.
+
+        Returns:
+            List[Tuple[int, int]]: The origin and target mailbox index of each legal move.
+        """
+
+        sign = COLOR_SIGN[color.value]
+        squares = self.squares
+        legal_moves = []
+        for origin in MAILBOX_POSITION:
+            if squares[origin] * sign > 0:
+                for move in self._get_pseudo_legal_moves(origin, sign):
+                    if self._is_legal(*move, sign):
+                        legal_moves.append(move[:2])
+        return legal_moves
+
+    def get_valid_moves(
+        self, piece: Piece, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the valid moves for the given piece from the mailbox array.
+
+        Args:
+            piece (Piece): The piece for which to determine valid moves.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the array was not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for the piece.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_valid_moves(piece, board)
+
+        sign = COLOR_SIGN[piece.color.value]
+        return [
+            MAILBOX_POSITION[target]
+            for origin, target, captured in self._get_pseudo_legal_moves(
+                MAILBOX_INDEX[(piece.x, piece.y)], sign
+            )
+            if self._is_legal(origin, target, captured, sign)
+        ]
+
+    def get_all_valid_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get all valid moves for pieces of the specified color from the mailbox array.
+
+        Args:
+            color (Color): The color of pieces for which to find valid moves.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the array was not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid moves for pieces of the specified color.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_all_valid_moves(color, board)
+
+        return [
+            MAILBOX_POSITION[target] for _, target in self._generate_legal_moves(color)
+        ]
+
+    def get_legal_moves(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Move]:
+        """
+        Get every legal move of the specified color from the mailbox array.
+
+        Args:
+            color (Color): The color of the side to move.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the array was not loaded from is searched with the DictBackend.
+
+        Returns:
+            List[Move]: The legal moves, with one move per promotion piece type.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.get_legal_moves(color, board)
+
+        # Row of the mailbox index of the last rank of each color
+        last_row = 2 if color == Color.WHITE else 9
+        squares = self.squares
+        legal_moves = []
+        for origin, target in self._generate_legal_moves(color):
+            if abs(squares[origin]) == PAWN and target // 10 == last_row:
+                legal_moves.extend(
+                    Move(MAILBOX_POSITION[origin], MAILBOX_POSITION[target], promotion)
+                    for promotion in PROMOTION_TYPES
+                )
+            else:
+                legal_moves.append(
+                    Move(MAILBOX_POSITION[origin], MAILBOX_POSITION[target])
+                )
+        return legal_moves
+
+    def is_position_attacked(
+        self, position: Tuple[int, int], color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if any piece of the given color attacks a square, from the backend state.
+
+        Args:
+            position (Tuple[int, int]): The position of the attacked square.
+            color (Color): The color of the attacking pieces.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the array was not loaded from is searched with the DictBackend.
+
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.is_position_attacked(position, color, board)
+
+        return self.is_square_attacked(
+            MAILBOX_INDEX[position], COLOR_SIGN[color.value]
+        )
+
+    def is_king_in_check(
+        self, color: Color, board: Dict[Tuple[int, int], Piece]
+    ) -> bool:
+        """
+        Check if the king of the given color is attacked according to the mailbox array.
+
+        Args:
+            color (Color): The color of the king.
+            board (Dict[Tuple[int, int], Piece]): The board to search, a board the array was not loaded from is searched with the DictBackend.
+
+        Returns:
+            bool: True if the king is in check, False otherwise.
+
+        Raises:
+            KingNotFound: If there is no king of the given color.
+        """
+
+        if board is not self.loaded_board:
+            return DICT_BACKEND.is_king_in_check(color, board)
+
+        king = self.king_squares[color.value]
+        if king is None:
+            raise KingNotFound(color)
+        return self.is_square_attacked(king, -COLOR_SIGN[color.value])
+
+    @property
+    def view(self) -> "MailboxView":
+        """
+        Get a read-only dictionary view of the mailbox array.
+
+        Returns:
+            MailboxView: The view, indexed by (x, y) positions like the dictionary board.
+        """
+        return MailboxView(self.squares)
+
+
+class MailboxView(Mapping):
+    """
+    Read-only adapter exposing a mailbox array with the dictionary board API.
+
+    view[(x, y)] returns a Piece built from the code of the square, so callers written for the
+    dictionary board can read a mailbox position. The pieces are new objects without the
+    has_moved and en_passantable state of the Board pieces.
+
+    Attributes:
+        squares (array): The 120 signed piece codes, indexed by MAILBOX_INDEX.
+    """
+
+    def __init__(self, squares: array) -> None:
+        """
+        Initialize the MailboxView object.
+
+        Args:
+            squares (array): The mailbox array to read.
+        """
+        self.squares = squares
+
+    def __getitem__(self, position: Tuple[int, int]) -> Piece:
+        """
+        Get the piece on the given position.
+
+        Args:
+            position (Tuple[int, int]): The (x, y) position.
+
+        Returns:
+            Piece: The piece on the position, EMPTY_SQUARE for an empty square.
+
+        Raises:
+            KeyError: If the position is not on the board.
+        """
+
+        code = self.squares[MAILBOX_INDEX[position]]
+        if code == EMPTY:
+            return EMPTY_SQUARE
+        return Piece(
+            position[0],
+            position[1],
+            color=Color.WHITE if code > 0 else Color.BLACK,
+            type=CODE_PIECE_TYPE[abs(code)],
+        )
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the 64 positions of the board."""
+        return iter(MAILBOX_INDEX)
+
+    def __len__(self) -> int:
+        """Get the number of squares of the board."""
+        return len(MAILBOX_INDEX)
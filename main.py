@@ -1,18 +1,38 @@
-from board import Board
-from notation import Notation
+from board import Board, STARTING_FEN
+from moves import MoveResult
+
+
+def read_move(board: Board) -> MoveResult:
+    """
+    Prompt the player for a move until a legal one is entered, and play it.
+
+    Args:
+        board (Board): The board to play on.
+
+    Returns:
+        MoveResult: The result of the move played.
+    """
+
+    while True:
+        result = board.try_move(input("Enter notation: "))
+        if result.ok:
+            return result
+        print(f"Invalid move: {result.message}. Please try again.")
+
 
 if __name__ == "__main__":
     board = Board()
-    starting_fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
-    board.process_fen(starting_fen)
+    board.process_fen(STARTING_FEN)
     print(board)
 
     # Gameloop
-    while not board.king_in_checkmate:
-        notation = Notation.get_valid_notation(board.board)
-        board.move_piece(notation)
+    while True:
+        result = read_move(board)
         print(board)
 
-        if board.king_in_checkmate:
-            print(f"{board.expected_player} is in checkmate")
+        if result.checkmate:
+            print(f"{board.expected_player.name.lower()} is in checkmate")
+            break
+        if result.stalemate:
+            print(f"{board.expected_player.name.lower()} is in stalemate")
             break
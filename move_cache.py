@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class MoveCache:
+    """
+    Bounded cache of move lists with least recently used eviction.
+
+    The Board keys its entries by the Zobrist key of the position, so any position reached
+    again (retries, hints, transpositions) is answered without generating moves.
+
+    Attributes:
+        maxsize (int): The maximum number of entries kept, 0 disables the cache.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that were not in the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """
+        Initialize the MoveCache object.
+
+        Args:
+            maxsize (int): The maximum number of entries kept, 0 disables the cache (defaults to 1024).
+        """
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up an entry and mark it as the most recently used.
+
+        Args:
+            key (Hashable): The key of the entry.
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is not in the cache.
+        """
+
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used one when the cache is full.
+
+        Args:
+            key (Hashable): The key of the entry.
+            value (Any): The value to store.
+        """
+
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
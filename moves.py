@@ -1,9 +1,143 @@
-from typing import List, Tuple, Dict, Type
-from copy import deepcopy
+from typing import List, Tuple, Dict, Type, NamedTuple, Optional
 from abc import ABC, abstractmethod
+from enum import Enum
 from pieces import Piece, Color, PieceType
 from king_validation import KingValidation
 from utility import BoardUtils
+from attack_tables import (
+    square_index,
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    PAWN_CAPTURE_TARGETS,
+    RAYS,
+    ROOK_DIRECTIONS,
+    BISHOP_DIRECTIONS,
+    QUEEN_DIRECTIONS,
+)
+
+
+class Move(NamedTuple):
+    """
+    Represents a move of a piece from one position to another.
+
+    Attributes:
+        origin (Tuple[int, int]): The position the piece moves from.
+        target (Tuple[int, int]): The position the piece moves to.
+        promotion (Optional[PieceType]): The piece type a pawn is promoted to, None for other moves.
+    """
+
+    origin: Tuple[int, int]
+    target: Tuple[int, int]
+    promotion: Optional[PieceType] = None
+
+
+# Piece types a pawn can be promoted to, strongest first
+PROMOTION_TYPES: List[PieceType] = [
+    PieceType.QUEEN,
+    PieceType.ROOK,
+    PieceType.BISHOP,
+    PieceType.KNIGHT,
+]
+
+# Castling rights bits, in the order of their FEN characters
+CASTLING_WHITE_KINGSIDE = 1
+CASTLING_WHITE_QUEENSIDE = 2
+CASTLING_BLACK_KINGSIDE = 4
+CASTLING_BLACK_QUEENSIDE = 8
+CASTLING_FEN_CHARS = "KQkq"
+
+
+class CastlingMove(NamedTuple):
+    """
+    The squares involved in one of the four castling moves.
+
+    Attributes:
+        right (int): The castling rights bit the move needs.
+        color (Color): The color of the castling side.
+        king (Move): The move of the king, which is the move played on the board.
+        rook (Move): The move of the rook that goes with it.
+        empty (List[Tuple[int, int]]): The squares between the king and the rook, which must be empty.
+        safe (List[Tuple[int, int]]): The squares the king starts on, crosses and reaches, which must not be attacked.
+    """
+
+    right: int
+    color: Color
+    king: Move
+    rook: Move
+    empty: List[Tuple[int, int]]
+    safe: List[Tuple[int, int]]
+
+
+CASTLING_MOVES: List[CastlingMove] = [
+    CastlingMove(
+        right,
+        color,
+        Move((row, 4), (row, 6 if kingside else 2)),
+        Move((row, 7 if kingside else 0), (row, 5 if kingside else 3)),
+        [(row, y) for y in ((5, 6) if kingside else (1, 2, 3))],
+        [(row, y) for y in ((4, 5, 6) if kingside else (4, 3, 2))],
+    )
+    for right, color, row, kingside in (
+        (CASTLING_WHITE_KINGSIDE, Color.WHITE, 7, True),
+        (CASTLING_WHITE_QUEENSIDE, Color.WHITE, 7, False),
+        (CASTLING_BLACK_KINGSIDE, Color.BLACK, 0, True),
+        (CASTLING_BLACK_QUEENSIDE, Color.BLACK, 0, False),
+    )
+]
+# Rook move of each castling king move
+CASTLING_ROOK_MOVES: Dict[Move, Move] = {
+    castling.king: castling.rook for castling in CASTLING_MOVES
+}
+
+
+class MoveError(Enum):
+    """
+    Enumeration of the reasons a move is refused.
+
+    Attributes:
+        INVALID_NOTATION (str): The notation is not a piece letter followed by two squares and an optional promotion letter, such as "Pe2e4" or "Pe7e8n".
+        NO_PIECE (str): The piece named by the notation is not on the origin square.
+        WRONG_PLAYER (str): The piece belongs to the player who is not expected to move.
+        ILLEGAL_MOVE (str): The piece can not move to the target square.
+        GAME_OVER (str): The player to move has no legal moves left.
+    """
+
+    INVALID_NOTATION = "invalid notation"
+    NO_PIECE = "no piece"
+    WRONG_PLAYER = "wrong player"
+    ILLEGAL_MOVE = "illegal move"
+    GAME_OVER = "game over"
+
+
+class MoveResult(NamedTuple):
+    """
+    The outcome of trying to play a move.
+
+    Attributes:
+        move (Optional[Move]): The move played, None if it was refused.
+        error (Optional[MoveError]): The reason the move was refused, None if it was played.
+        message (str): A description of the error for the player, empty if the move was played.
+        check (bool): Whether the move gives check.
+        checkmate (bool): Whether the move gives checkmate.
+        stalemate (bool): Whether the move leaves the opponent without legal moves and not in check.
+    """
+
+    move: Optional[Move]
+    error: Optional[MoveError] = None
+    message: str = ""
+    check: bool = False
+    checkmate: bool = False
+    stalemate: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """
+        Check if the move was played.
+
+        Returns:
+            bool: True if the move was played, False if it was refused.
+        """
+        return self.error is None
 
 
 class PieceMovement(ABC):
@@ -33,6 +167,88 @@ class PieceMovement(ABC):
         """
         pass
 
+    def get_valid_captures(
+        self, board: Dict[Tuple[int, int], Piece]
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the valid moves of the piece that capture an opposing piece, including en passant.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+
+        Returns:
+            List[Tuple[int, int]]: A list of valid capturing moves for the piece.
+        """
+
+        is_pawn = self.piece.type == PieceType.PAWN
+        return [
+            (new_x, new_y)
+            for new_x, new_y in self.get_valid_moves(board)
+            if board[(new_x, new_y)].type != PieceType.EMPTY
+            # A pawn moving diagonally onto an empty square captures en passant
+            or (is_pawn and new_y != self.piece.y)
+        ]
+
+    def is_move_safe_for_king(
+        self, board: Dict[Tuple[int, int], Piece], new_x: int, new_y: int
+    ) -> bool:
+        """
+        Check that moving the piece does not leave its own king in check.
+
+        The move is applied to the board in place, checked and reverted, so no copy of the board is made.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            new_x (int): The x-coordinate the piece moves to.
+            new_y (int): The y-coordinate the piece moves to.
+
+        Returns:
+            bool: True if the king of the moving piece is not in check after the move, False otherwise.
+        """
+
+        undo = BoardUtils.make_move(board, self.piece, new_x, new_y)
+        try:
+            return not UniversalMovementValidation.is_king_in_check(
+                color=self.piece.color, board=board
+            )
+        finally:
+            BoardUtils.unmake_move(board, undo)
+
+    def get_sliding_moves(
+        self,
+        board: Dict[Tuple[int, int], Piece],
+        directions: List[Tuple[int, int]],
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the squares the piece can slide to along the precomputed rays, ignoring pins.
+
+        Each ray stops at the first occupied square, which is included if it holds an opposing piece.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            directions (List[Tuple[int, int]]): The directions the piece slides in.
+
+        Returns:
+            List[Tuple[int, int]]: A list of reachable squares, ray by ray.
+        """
+
+        moves = []
+        square = square_index(self.piece.x, self.piece.y)
+        color = self.piece.color
+
+        for direction in directions:
+            for dir_x, dir_y in RAYS[direction][square]:
+                piece_at_position = board[(dir_x, dir_y)]
+                if piece_at_position.type == PieceType.EMPTY:
+                    moves.append((dir_x, dir_y))
+                    continue
+
+                if piece_at_position.color != color:
+                    moves.append((dir_x, dir_y))
+                break
+
+        return moves
+
 
 class KingMovement(PieceMovement):
     """
@@ -55,32 +271,14 @@ class KingMovement(PieceMovement):
         """
 
         valid_moves = []
-        x, y = self.piece.x, self.piece.y
         color = self.piece.color
 
-        # Relative directions the king can move
-        directions = [
-            (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2) if (dx, dy) != (0, 0)
-        ]
-
-        for dx, dy in directions:
-            dir_x, dir_y = x + dx, y + dy
-            if UniversalMovementValidation.is_within_board(
-                dir_x, dir_y
-            ) and UniversalMovementValidation.is_not_occupied_by_allies(
+        # Precomputed on-board squares the king can move to
+        for dir_x, dir_y in KING_TARGETS[square_index(self.piece.x, self.piece.y)]:
+            if UniversalMovementValidation.is_not_occupied_by_allies(
                 board, dir_x, dir_y, color
             ):
-                simulated_board = deepcopy(board)
-                # Simulate the move of the piece on the simulated board in available direction
-                BoardUtils.simulate_piece_move(
-                    simulated_board=simulated_board,
-                    piece=self.piece,
-                    new_x=dir_x,
-                    new_y=dir_y,
-                )
-                if not UniversalMovementValidation.is_king_in_check(
-                    color=color, board=simulated_board
-                ):
+                if self.is_move_safe_for_king(board, dir_x, dir_y):
                     valid_moves.append((dir_x, dir_y))
 
         return valid_moves
@@ -106,50 +304,13 @@ class RookMovement(PieceMovement):
             List[Tuple[int, int]]: A list of valid moves for the rook.
         """
 
-        valid_moves = []
-        x, y = self.piece.x, self.piece.y
-        color = self.piece.color
-
-        # Define directions for rook movement: up, down, left, right
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
-
-        for dx, dy in directions:
-
-            dir_x, dir_y = x + dx, y + dy
-
-            while UniversalMovementValidation.is_within_board(dir_x, dir_y):
-
-                # check original board
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, dir_x, dir_y, color
-                ):
-                    valid_moves.append((dir_x, dir_y))
-
-                    if UniversalMovementValidation.is_occupied_by_opposing(
-                        board, dir_x, dir_y, color
-                    ):
-                        break
-
-                    dir_x, dir_y = dir_x + dx, dir_y + dy
-
-                else:
-                    break
+        # Walk the precomputed rays for rook movement: up, down, left, right
+        valid_moves = self.get_sliding_moves(board, ROOK_DIRECTIONS)
 
         validated_moves = []
         for move in valid_moves:
-            simulated_board = deepcopy(board)
-            # Simulate the move of the piece on the simulated board in available direction
-            BoardUtils.simulate_piece_move(
-                simulated_board=simulated_board,
-                piece=self.piece,
-                new_x=move[0],
-                new_y=move[1],
-            )
-
-            # check using simulated board
-            if not UniversalMovementValidation.is_king_in_check(
-                color=color, board=simulated_board
-            ):
+            # Apply, check and revert the move on the original board
+            if self.is_move_safe_for_king(board, move[0], move[1]):
                 validated_moves.append(move)
 
         return validated_moves
@@ -176,47 +337,16 @@ class KnightMovement(PieceMovement):
         """
 
         valid_moves = []
-        x, y = self.piece.x, self.piece.y
         color = self.piece.color
 
-        directions = [
-            (2, 1),
-            (2, -1),
-            (-2, 1),
-            (-2, -1),
-            (1, 2),
-            (1, -2),
-            (-1, 2),
-            (-1, -2),
-        ]
-
-        for dx, dy in directions:
-            dir_x, dir_y = x + dx, y + dy
-            simulated_board = deepcopy(board)
-            # Simulate the move of the piece on the simulated board in available direction
-            BoardUtils.simulate_piece_move(
-                simulated_board=simulated_board,
-                piece=self.piece,
-                new_x=dir_x,
-                new_y=dir_y,
-            )
-
-            while UniversalMovementValidation.is_within_board(dir_x, dir_y):
-
-                # check original board
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, dir_x, dir_y, color
-                ):
-                    # check using simulated board
-                    if UniversalMovementValidation.is_king_in_check(
-                        color=color, board=simulated_board
-                    ):
-                        break
-
+        # Precomputed on-board squares the knight can jump to
+        for dir_x, dir_y in KNIGHT_TARGETS[square_index(self.piece.x, self.piece.y)]:
+            if UniversalMovementValidation.is_not_occupied_by_allies(
+                board, dir_x, dir_y, color
+            ):
+                if self.is_move_safe_for_king(board, dir_x, dir_y):
                     valid_moves.append((dir_x, dir_y))
 
-                break
-
         return valid_moves
 
 
@@ -240,50 +370,13 @@ class BishopMovement(PieceMovement):
             List[Tuple[int, int]]: A list of valid moves for the bishop.
         """
 
-        valid_moves = []
-        x, y = self.piece.x, self.piece.y
-        color = self.piece.color
-
-        # Define directions for rook movement: up, down, left, right
-        directions = [(1, 1), (-1, 1), (-1, -1), (1, -1)]
-
-        for dx, dy in directions:
-
-            dir_x, dir_y = x + dx, y + dy
-
-            while UniversalMovementValidation.is_within_board(dir_x, dir_y):
-
-                # check original board
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, dir_x, dir_y, color
-                ):
-                    valid_moves.append((dir_x, dir_y))
-
-                    if UniversalMovementValidation.is_occupied_by_opposing(
-                        board, dir_x, dir_y, color
-                    ):
-                        break
-
-                    dir_x, dir_y = dir_x + dx, dir_y + dy
-
-                else:
-                    break
+        # Walk the precomputed rays for bishop movement: the four diagonals
+        valid_moves = self.get_sliding_moves(board, BISHOP_DIRECTIONS)
 
         validated_moves = []
         for move in valid_moves:
-            simulated_board = deepcopy(board)
-            # Simulate the move of the piece on the simulated board in available direction
-            BoardUtils.simulate_piece_move(
-                simulated_board=simulated_board,
-                piece=self.piece,
-                new_x=move[0],
-                new_y=move[1],
-            )
-
-            # check using simulated board
-            if not UniversalMovementValidation.is_king_in_check(
-                color=color, board=simulated_board
-            ):
+            # Apply, check and revert the move on the original board
+            if self.is_move_safe_for_king(board, move[0], move[1]):
                 validated_moves.append(move)
 
         return validated_moves
@@ -309,51 +402,13 @@ class QueenMovement(PieceMovement):
             List[Tuple[int, int]]: A list of valid moves for the queen.
         """
 
-        valid_moves = []
-        x, y = self.piece.x, self.piece.y
-        color = self.piece.color
-
-        # Define directions for rook movement: up, down, left, right
-        directions = [
-            (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2) if (dx, dy) != (0, 0)
-        ]
-        for dx, dy in directions:
-
-            dir_x, dir_y = x + dx, y + dy
-
-            while UniversalMovementValidation.is_within_board(dir_x, dir_y):
-
-                # check original board
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, dir_x, dir_y, color
-                ):
-                    valid_moves.append((dir_x, dir_y))
-
-                    if UniversalMovementValidation.is_occupied_by_opposing(
-                        board, dir_x, dir_y, color
-                    ):
-                        break
-
-                    dir_x, dir_y = dir_x + dx, dir_y + dy
-
-                else:
-                    break
+        # Walk the precomputed rays for queen movement: straight lines and diagonals
+        valid_moves = self.get_sliding_moves(board, QUEEN_DIRECTIONS)
 
         validated_moves = []
         for move in valid_moves:
-            simulated_board = deepcopy(board)
-            # Simulate the move of the piece on the simulated board in available direction
-            BoardUtils.simulate_piece_move(
-                simulated_board=simulated_board,
-                piece=self.piece,
-                new_x=move[0],
-                new_y=move[1],
-            )
-
-            # check using simulated board
-            if not UniversalMovementValidation.is_king_in_check(
-                color=color, board=simulated_board
-            ):
+            # Apply, check and revert the move on the original board
+            if self.is_move_safe_for_king(board, move[0], move[1]):
                 validated_moves.append(move)
 
         return validated_moves
@@ -397,111 +452,42 @@ class PawnMovement(PieceMovement):
             UniversalMovementValidation.is_within_board(new_x, new_y)
             and board[new_x, new_y].type == PieceType.EMPTY
         ):
-            # Simulate the move on a temporary board
-            simulated_board = deepcopy(board)
-            simulated_board[new_x, new_y] = self.piece
-            simulated_board[x, y] = Piece(
-                x, y, PieceType.EMPTY
-            )  # Update original position
-
             # Check for pinning to own king
-            if not UniversalMovementValidation.is_king_in_check(
-                self.piece.color, simulated_board
-            ):
+            if self.is_move_safe_for_king(board, new_x, new_y):
                 valid_moves.append((new_x, new_y))
 
-                # Double move forward on first move and if there are empty squares in both squares
-                if not self.piece.has_moved:
-                    new_x, new_y = x + 2 * direction, y
-
-                    if (
-                        UniversalMovementValidation.is_within_board(new_x, new_y)
-                        and board[new_x, new_y].type == PieceType.EMPTY
-                        and board[new_x - direction, new_y].type == PieceType.EMPTY
-                    ):
-                        # Simulate the move
-                        simulated_board[new_x, new_y] = self.piece
-                        simulated_board[x, y] = Piece(
-                            x, y, PieceType.EMPTY
-                        )  # Update original position
-
-                        # Check for pinning to own king
-                        if not UniversalMovementValidation.is_king_in_check(
-                            self.piece.color, simulated_board
-                        ):
-                            valid_moves.append((new_x, new_y))
-
-        # Conditions for diagonal capture
-        for dy in [-1, 1]:
-            new_x, new_y = x + direction, y + dy
-            if UniversalMovementValidation.is_within_board(
-                new_x, new_y
-            ) and UniversalMovementValidation.is_occupied_by_opposing(
-                board, new_x, new_y, color
-            ):
-                # Simulate the move
-                simulated_board = deepcopy(board)
-                simulated_board[new_x, new_y] = self.piece
-                simulated_board[x, y] = Piece(
-                    x, y, PieceType.EMPTY
-                )  # Update original position
-
-                # Check for pinning to own king
-                if not UniversalMovementValidation.is_king_in_check(
-                    self.piece.color, simulated_board
-                ):
-                    valid_moves.append((new_x, new_y))
+            # Double move forward on first move and if there are empty squares in both squares
+            if not self.piece.has_moved:
+                new_x, new_y = x + 2 * direction, y
 
-        # Conditions for en-passant
-        dy = [1, -1]
-        if self.piece.color == Color.WHITE and self.piece.x == 3:
-            for y in dy:
                 if (
-                    (
-                        board[self.piece.x, self.piece.y + y].type == PieceType.PAWN
-                        or board[self.piece.x, self.piece.y - y].type == PieceType.PAWN
-                    )
-                    and board[self.piece.x, self.piece.y + y].color == Color.BLACK
-                    and board[self.piece.x, self.piece.y + y].en_passantable
+                    UniversalMovementValidation.is_within_board(new_x, new_y)
+                    and board[new_x, new_y].type == PieceType.EMPTY
+                    and self.is_move_safe_for_king(board, new_x, new_y)
                 ):
-                    new_x, new_y = self.piece.x + direction, self.piece.y + y
-                    # Simulate the move
-                    simulated_board = deepcopy(board)
-                    simulated_board[new_x, new_y] = self.piece
-                    simulated_board[x, y] = Piece(
-                        x, y, PieceType.EMPTY
-                    )  # Update original position
-
-                    # Check for pinning to own king
-                    if not UniversalMovementValidation.is_king_in_check(
-                        self.piece.color, simulated_board
-                    ):
+                    valid_moves.append((new_x, new_y))
 
-                        valid_moves.append((new_x, new_y))
+        # Conditions for diagonal capture, from the precomputed capture squares
+        capture_targets = PAWN_CAPTURE_TARGETS[color.value][square_index(x, y)]
+        for new_x, new_y in capture_targets:
+            if UniversalMovementValidation.is_occupied_by_opposing(
+                board, new_x, new_y, color
+            ):
+                # Check for pinning to own king
+                if self.is_move_safe_for_king(board, new_x, new_y):
+                    valid_moves.append((new_x, new_y))
 
-        elif self.piece.color == Color.BLACK and self.piece.x == 4:
-            for y in dy:
+        # Conditions for en-passant, only possible from the fifth rank of the moving side
+        if (color == Color.WHITE and x == 3) or (color == Color.BLACK and x == 4):
+            for new_x, new_y in capture_targets:
+                adjacent_piece = board[x, new_y]
                 if (
-                    (
-                        board[self.piece.x, self.piece.y + y].type == PieceType.PAWN
-                        or board[self.piece.x, self.piece.y - y].type == PieceType.PAWN
-                    )
-                    and board[self.piece.x, self.piece.y + y].color == Color.WHITE
-                    and board[self.piece.x, self.piece.y + y].en_passantable
+                    adjacent_piece.type == PieceType.PAWN
+                    and adjacent_piece.color != color
+                    and adjacent_piece.en_passantable
                 ):
-                    new_x, new_y = self.piece.x + direction, self.piece.y + y
-                    # Simulate the move
-                    simulated_board = deepcopy(board)
-                    simulated_board[new_x, new_y] = self.piece
-                    simulated_board[x, y] = Piece(
-                        x, y, PieceType.EMPTY
-                    )  # Update original position
-
-                    # Check for pinning to own king
-                    if not UniversalMovementValidation.is_king_in_check(
-                        self.piece.color, simulated_board
-                    ):
-
+                    # The captured pawn is removed while checking for pins
+                    if self.is_move_safe_for_king(board, new_x, new_y):
                         valid_moves.append((new_x, new_y))
 
         return valid_moves
@@ -578,96 +564,125 @@ class UniversalMovementValidation:
         )
 
     @staticmethod
-    def is_king_in_check(color: Color, board: Dict[Tuple[int, int], Piece]) -> bool:
+    def get_attackers(
+        board: Dict[Tuple[int, int], Piece],
+        position: Tuple[int, int],
+        color: Color,
+        first_only: bool = False,
+    ) -> List[Tuple[int, int]]:
         """
-        Check if the king of the given color is in check on the current board.
+        Get the positions of the pieces of the given color attacking a square.
+
+        Pins are ignored and sliding pieces only attack up to the first piece on each ray,
+        whatever stands on the square itself.
 
         Args:
-            color (Color): The color of the king.
             board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            position (Tuple[int, int]): The position of the attacked square.
+            color (Color): The color of the attacking pieces.
+            first_only (bool): Stop at the first attacker found (defaults to False).
 
         Returns:
-            bool: True if the king is in check, False otherwise.
+            List[Tuple[int, int]]: The positions of the attacking pieces.
         """
 
-        # Find position of king in simulated position
-        king_x, king_y = KingValidation.find_king_position(board, color)
+        attackers = []
+        square = square_index(*position)
 
-        # Check for ray pieces in all directions
-        ray_directions = [
-            (dx, dy) for dx in range(-1, 2) for dy in range(-1, 2) if (dx, dy) != (0, 0)
-        ]
-
-        knight_directions = [
-            (2, 1),
-            (2, -1),
-            (-2, 1),
-            (-2, -1),
-            (1, 2),
-            (1, -2),
-            (-1, 2),
-            (-1, -2),
-        ]
-
-        pawn_attack_directions = [
-            (-1, -1),
-            (-1, 1),  # For white king
-            (1, -1),
-            (1, 1),  # For black king
-        ]
-
-        for dx, dy in ray_directions:
-            x, y = king_x + dx, king_y + dy
+        # Check for ray pieces in all directions, up to the first piece on each ray
+        for dx, dy in QUEEN_DIRECTIONS:
+            for x, y in RAYS[(dx, dy)][square]:
+                piece_at_position = board[(x, y)]
+                if piece_at_position.type == PieceType.EMPTY:
+                    continue
 
-            while UniversalMovementValidation.is_within_board(x, y):
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, x, y, color
+                if (
+                    piece_at_position.color == color
+                    and BoardUtils.is_in_direct_contact_with_opposing_piece(
+                        piece_at_position=piece_at_position, dx=dx, dy=dy
+                    )
                 ):
-                    piece_at_position = board.get((x, y))
-
-                    # If it returns true, it can either be the opposing color or empty.
-                    if piece_at_position.type != PieceType.EMPTY:
-                        if BoardUtils.is_in_direct_contact_with_opposing_piece(
-                            piece_at_position=piece_at_position, dx=dx, dy=dy
-                        ):
-                            return True
-                        else:
-                            break
-                    else:
-                        x += dx
-                        y += dy
-                else:
-                    break
+                    attackers.append((x, y))
+                    if first_only:
+                        return attackers
+                break
 
         # Check for knight attacks
-        for dx, dy in knight_directions:
-            x, y = king_x + dx, king_y + dy
+        for x, y in KNIGHT_TARGETS[square]:
+            piece_at_position = board[(x, y)]
+            if (
+                piece_at_position.type == PieceType.KNIGHT
+                and piece_at_position.color == color
+            ):
+                attackers.append((x, y))
+                if first_only:
+                    return attackers
+
+        # Check for pawn attacks, from the squares a pawn of the other color would capture on
+        defending = Color.BLACK if color == Color.WHITE else Color.WHITE
+        for x, y in PAWN_CAPTURE_TARGETS[defending.value][square]:
+            piece_at_position = board[(x, y)]
+            if (
+                piece_at_position.type == PieceType.PAWN
+                and piece_at_position.color == color
+            ):
+                attackers.append((x, y))
+                if first_only:
+                    return attackers
+
+        # Check for the king on an adjacent square
+        for x, y in KING_TARGETS[square]:
+            piece_at_position = board[(x, y)]
+            if (
+                piece_at_position.type == PieceType.KING
+                and piece_at_position.color == color
+            ):
+                attackers.append((x, y))
+                if first_only:
+                    return attackers
 
-            if UniversalMovementValidation.is_within_board(x, y):
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, x, y, color
-                ):
-                    piece_at_position = board.get((x, y))
+        return attackers
 
-                    # If it returns true, it can either be the opposing color or empty.
-                    if piece_at_position.type == PieceType.KNIGHT:
-                        return True
+    @staticmethod
+    def is_square_attacked(
+        board: Dict[Tuple[int, int], Piece], position: Tuple[int, int], color: Color
+    ) -> bool:
+        """
+        Check if any piece of the given color attacks a square.
 
-        # Check for pawn attacks
-        for dx, dy in pawn_attack_directions:
-            x, y = king_x + dx, king_y + dy
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            position (Tuple[int, int]): The position of the attacked square.
+            color (Color): The color of the attacking pieces.
 
-            if UniversalMovementValidation.is_within_board(x, y):
-                if UniversalMovementValidation.is_not_occupied_by_allies(
-                    board, x, y, color
-                ):
-                    piece_at_position = board.get((x, y))
+        Returns:
+            bool: True if the square is attacked, False otherwise.
+        """
+        return bool(
+            UniversalMovementValidation.get_attackers(
+                board, position, color, first_only=True
+            )
+        )
 
-                    # If it returns true, it can either be the opposing color or empty.
-                    if piece_at_position.type == PieceType.PAWN:
-                        return True
+    @staticmethod
+    def is_king_in_check(color: Color, board: Dict[Tuple[int, int], Piece]) -> bool:
+        """
+        Check if the king of the given color is in check on the current board.
+
+        Args:
+            color (Color): The color of the king.
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
 
-        return False
+        Returns:
+            bool: True if the king is in check, False otherwise.
+        """
+
+        # Find position of king in simulated position
+        king_position = KingValidation.find_king_position(board, color)
+        opposing = Color.BLACK if color == Color.WHITE else Color.WHITE
+        return UniversalMovementValidation.is_square_attacked(
+            board, king_position, opposing
+        )
 
 
 PIECE_MOVE_MAP: Dict[PieceType, Type[PieceMovement]] = {
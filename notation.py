@@ -1,42 +1,42 @@
 from typing import Tuple, Dict, List
-from pieces import Piece, FEN_MAP, Color
+from pieces import Piece, FEN_MAP, Color, PieceType
+from moves import Move
 
+# FEN letters of the piece types a pawn can be promoted to, as appended by move_to_notation
+PROMOTION_FEN_CHARS = "qrbn"
 
-class Notation:
-    """
-    A utility class for handling chess algebraic notation.
+# dictionary of PieceType as keys and fen characters as values
+PIECE_FEN_CHAR: Dict[PieceType, str] = {
+    piece_type: fen_char for fen_char, piece_type in FEN_MAP.items()
+}
 
-    This class provides methods to validate and interpret chess algebraic notation,
-    ensuring that the input notation adhere to the rules of the game.
 
+class InvalidNotation(ValueError):
+    """
+    Exception raised when a notation does not describe exactly one legal move.
     """
 
-    @staticmethod
-    def get_valid_notation(board: Dict[Tuple[int, int], Piece]) -> str:
+    def __init__(self, notation: str, reason: str):
         """
-        Prompt the user for valid chess algebraic notation.
-
-        This method continuously prompts the user to enter valid chess algebraic notation
-        until a valid move is provided based on the current board state.
+        Initialize the InvalidNotation exception.
 
         Args:
-            board (Dict[Tuple[int, int], Piece]): The current state of the chess board.
-
-        Returns:
-            str: A valid chess algebraic notation representing a legal move.
-        Examples:
-            >>> board = {(6, 4): Piece(x=6, y=4, type=PieceType.PAWN, color=Color.WHITE)}
-            >>> get_valid_notation(board)
-            Enter notation: e2e4
-            'e2e4'
+            notation (str): The notation that was not understood.
+            reason (str): Why it does not describe a legal move.
         """
+        self.notation = notation
+        self.reason = reason
+        super().__init__(f"{notation}: {reason}")
 
-        while True:
-            notation = input("Enter notation: ")
-            if Notation.notation_is_valid(board, notation):
-                return notation
-            else:
-                print("Invalid move. Please try again.")
+
+class Notation:
+    """
+    A utility class for handling chess algebraic notation.
+
+    This class provides methods to validate and interpret chess algebraic notation,
+    ensuring that the input notation adhere to the rules of the game.
+
+    """
 
     @staticmethod
     def is_correct_format(notation: str) -> bool:
@@ -57,21 +57,20 @@ class Notation:
             >>> piece_exists_in_original_position(board, 'Qe2e4')
             False
         """
-        if len(notation) != 5:
-            print("invalid notation format")
-            return False  # Notation length should be exactly 5 characters
+        if len(notation) not in (5, 6):
+            return False  # Notation length should be 5 characters, 6 with a promotion
+
+        if len(notation) == 6 and notation[5].lower() not in PROMOTION_FEN_CHARS:
+            return False
 
         if notation[0].lower() not in FEN_MAP.keys():
-            print("invalid notation format")
             return False
 
         # Check if the positions are within the valid chess grid ('a1' to 'h8')
         if notation[1] not in "abcdefgh" or notation[2] not in "12345678":
-            print("invalid notation format")
             return False
 
         if notation[3] not in "abcdefgh" or notation[4] not in "12345678":
-            print("invalid notation format")
             return False
 
         return True
@@ -99,7 +98,6 @@ class Notation:
             original_piece.type != FEN_MAP[piece.lower()]
             or original_piece.color != color
         ):
-            print(f"Piece {piece} does not exist at the specified position")
             return False  # Piece at original position does not match the specified piece in the notation
 
         return True
@@ -141,17 +139,16 @@ class Notation:
         Returns:
             List: A list containing the original position and the final piece after the move.
 
+        Raises:
+            InvalidNotation: If the first character is not a piece letter.
+
         Examples:
             >>> interpret_notation('Pe2e4')
             [(6, 4), Piece(x=4, y=4, type=PieceType.PAWN, color=Color.WHITE)]
         """
-        while True:
-            try:
-                piece_type = FEN_MAP[notation[0].lower()]
-                break  # Break out of the loop if the notation is valid
-            except KeyError:
-                print("Invalid piece notation. Please enter a valid notation.")
-                notation = input("Enter a valid piece notation: ")
+        if not notation or notation[0].lower() not in FEN_MAP:
+            raise InvalidNotation(notation, "unknown piece letter")
+        piece_type = FEN_MAP[notation[0].lower()]
 
         piece_color = Color.WHITE if notation[0].isupper() else Color.BLACK
         original_pos = Notation.convert_to_coordinates(notation[1:3])
@@ -196,4 +193,265 @@ class Notation:
 
         return row, column
 
-    # convert to notation from coordinates
+    @staticmethod
+    def convert_to_notation(position: Tuple[int, int]) -> str:
+        """
+        Convert grid coordinates to algebraic chess notation.
+
+        Args:
+            position (Tuple[int, int]): The row and column coordinates.
+
+        Returns:
+            str: The algebraic notation of the square.
+
+        Examples:
+            >>> convert_to_notation((7, 0))
+            'a1'
+            >>> convert_to_notation((4, 4))
+            'e4'
+        """
+        row, column = position
+        return "abcdefgh"[column] + str(8 - row)
+
+    @staticmethod
+    def move_to_notation(piece: Piece, move: Move) -> str:
+        """
+        Convert a move of the given piece to the notation accepted by interpret_notation.
+
+        Promotions other than to a queen get the FEN letter of the promoted piece appended.
+
+        Args:
+            piece (Piece): The piece being moved.
+            move (Move): The move to convert.
+
+        Returns:
+            str: The notation of the move.
+
+        Examples:
+            >>> move_to_notation(Piece(6, 4, Color.WHITE, PieceType.PAWN), Move((6, 4), (4, 4)))
+            'Pe2e4'
+        """
+
+        fen_char = PIECE_FEN_CHAR[piece.type]
+        notation = (
+            (fen_char.upper() if piece.color == Color.WHITE else fen_char)
+            + Notation.convert_to_notation(move.origin)
+            + Notation.convert_to_notation(move.target)
+        )
+        if move.promotion not in (None, PieceType.QUEEN):
+            notation += PIECE_FEN_CHAR[move.promotion]
+        return notation
+
+    @staticmethod
+    def san_to_move(
+        board: Dict[Tuple[int, int], Piece], san: str, legal_moves: List[Move]
+    ) -> Move:
+        """
+        Find the move a standard algebraic notation (SAN) move stands for.
+
+        The notation is matched against the legal moves of the position, so the only work
+        per candidate is comparing squares. Check, mate and annotation suffixes are ignored.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chess board.
+            san (str): The move in SAN, such as "Nf3", "exd5", "O-O" or "e8=Q+".
+            legal_moves (List[Move]): The legal moves of the side to move.
+
+        Returns:
+            Move: The legal move described by the notation.
+
+        Raises:
+            InvalidNotation: If the notation is malformed or does not match exactly one legal move.
+
+        Examples:
+            >>> san_to_move(board, "Nf3", board.get_legal_moves())
+            Move(origin=(7, 6), target=(5, 5), promotion=None)
+        """
+
+        text = san.rstrip("+#!?")
+        if text in ("O-O", "0-0", "O-O-O", "0-0-0"):
+            # Castling is the king move of two squares towards the named side
+            target_y = 6 if len(text) == 3 else 2
+            for move in legal_moves:
+                if (
+                    board[move.origin].type == PieceType.KING
+                    and move.origin[1] == 4
+                    and move.target[1] == target_y
+                ):
+                    return move
+            raise InvalidNotation(san, "castling is not legal")
+
+        promotion = None
+        if len(text) > 2 and text[-2] == "=":
+            promotion_char = text[-1].lower()
+            if promotion_char not in FEN_MAP or promotion_char in "pk":
+                raise InvalidNotation(san, "invalid promotion piece")
+            promotion = FEN_MAP[promotion_char]
+            text = text[:-2]
+        elif len(text) > 2 and text[-1] in "NBRQ" and text[-2] in "18":
+            # Some writers leave out the "=" of a promotion
+            promotion = FEN_MAP[text[-1].lower()]
+            text = text[:-1]
+
+        piece_type = PieceType.PAWN
+        if text[:1] in ("N", "B", "R", "Q", "K"):
+            piece_type = FEN_MAP[text[0].lower()]
+            text = text[1:]
+
+        if (
+            len(text) < 2
+            or text[-2] not in "abcdefgh"
+            or text[-1] not in "12345678"
+        ):
+            raise InvalidNotation(san, "invalid target square")
+        target = Notation.convert_to_coordinates(text[-2:])
+
+        # What is left is the disambiguation, a file, a rank or both, and the capture mark
+        origin_file, origin_rank = None, None
+        for char in text[:-2].replace("x", ""):
+            if char in "abcdefgh":
+                origin_file = ord(char) - ord("a")
+            elif char in "12345678":
+                origin_rank = 8 - int(char)
+            else:
+                raise InvalidNotation(san, f"unexpected character {char!r}")
+
+        matches = [
+            move
+            for move in legal_moves
+            if move.target == target
+            and move.promotion == promotion
+            and board[move.origin].type == piece_type
+            and (origin_file is None or move.origin[1] == origin_file)
+            and (origin_rank is None or move.origin[0] == origin_rank)
+        ]
+        if not matches:
+            raise InvalidNotation(san, "no legal move matches")
+        if len(matches) > 1:
+            raise InvalidNotation(san, "ambiguous move")
+        return matches[0]
+
+    @staticmethod
+    def move_to_san(
+        board: Dict[Tuple[int, int], Piece],
+        move: Move,
+        legal_moves: List[Move],
+        suffix: str = "",
+    ) -> str:
+        """
+        Write a legal move in standard algebraic notation (SAN).
+
+        The origin square is only written as far as needed to tell the move apart from the
+        other legal moves of the same piece type to the same square.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chess board, before the move.
+            move (Move): The move to write.
+            legal_moves (List[Move]): The legal moves of the side to move.
+            suffix (str): "+" if the move gives check, "#" if it gives mate (defaults to none).
+
+        Returns:
+            str: The move in SAN.
+
+        Examples:
+            >>> move_to_san(board, Move((6, 4), (4, 4)), board.get_legal_moves())
+            'e4'
+        """
+
+        piece = board[move.origin]
+        target = Notation.convert_to_notation(move.target)
+        if piece.type == PieceType.KING and abs(move.origin[1] - move.target[1]) == 2:
+            return ("O-O" if move.target[1] == 6 else "O-O-O") + suffix
+
+        is_capture = board[move.target].type != PieceType.EMPTY
+        if piece.type == PieceType.PAWN:
+            # A pawn moving to another file always captures, en passant included
+            if move.origin[1] != move.target[1]:
+                san = Notation.convert_to_notation(move.origin)[0] + "x" + target
+            else:
+                san = target
+            if move.promotion is not None:
+                san += "=" + PIECE_FEN_CHAR[move.promotion].upper()
+            return san + suffix
+
+        rivals = [
+            other.origin
+            for other in legal_moves
+            if other.target == move.target
+            and other.origin != move.origin
+            and board[other.origin].type == piece.type
+        ]
+        origin = Notation.convert_to_notation(move.origin)
+        if not rivals:
+            disambiguation = ""
+        elif all(rival[1] != move.origin[1] for rival in rivals):
+            disambiguation = origin[0]
+        elif all(rival[0] != move.origin[0] for rival in rivals):
+            disambiguation = origin[1]
+        else:
+            disambiguation = origin
+
+        return (
+            PIECE_FEN_CHAR[piece.type].upper()
+            + disambiguation
+            + ("x" if is_capture else "")
+            + target
+            + suffix
+        )
+
+    @staticmethod
+    def move_to_uci(move: Move) -> str:
+        """
+        Write a move in the long algebraic notation of the UCI protocol.
+
+        Args:
+            move (Move): The move to write.
+
+        Returns:
+            str: The origin and target squares, followed by the promotion piece letter if any.
+
+        Examples:
+            >>> move_to_uci(Move((1, 4), (0, 4), PieceType.QUEEN))
+            'e7e8q'
+        """
+
+        uci = Notation.convert_to_notation(move.origin) + Notation.convert_to_notation(
+            move.target
+        )
+        if move.promotion is not None:
+            uci += PIECE_FEN_CHAR[move.promotion]
+        return uci
+
+    @staticmethod
+    def uci_to_move(uci: str, legal_moves: List[Move]) -> Move:
+        """
+        Find the legal move written in the long algebraic notation of the UCI protocol.
+
+        Args:
+            uci (str): The move, such as "e2e4", "e1g1" or "e7e8q".
+            legal_moves (List[Move]): The legal moves of the side to move.
+
+        Returns:
+            Move: The legal move.
+
+        Raises:
+            InvalidNotation: If the notation is malformed or the move is not legal.
+        """
+
+        if len(uci) not in (4, 5):
+            raise InvalidNotation(uci, "invalid format")
+        try:
+            origin = Notation.convert_to_coordinates(uci[:2])
+            target = Notation.convert_to_coordinates(uci[2:4])
+        except ValueError:
+            raise InvalidNotation(uci, "invalid square") from None
+        promotion = None
+        if len(uci) == 5:
+            if uci[4] not in PROMOTION_FEN_CHARS:
+                raise InvalidNotation(uci, "invalid promotion piece")
+            promotion = FEN_MAP[uci[4]]
+
+        move = Move(origin, target, promotion)
+        if move not in legal_moves:
+            raise InvalidNotation(uci, "no legal move matches")
+        return move
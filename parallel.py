@@ -0,0 +1,312 @@
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from board import Board, BACKEND_MAP, STARTING_FEN
+from moves import Move
+from notation import Notation
+from search import Search, SearchResult, MATE_THRESHOLD
+from transposition import TranspositionTable, SharedTranspositionTable
+from position_encoding import encode_position, decode_position
+
+# Positions are sent to the workers packed by encode_position, so only 32 bytes and a Move are pickled
+
+# State of a Lazy SMP helper process, set once by _init_helper
+_helper_table: Optional[SharedTranspositionTable] = None
+_helper_stop = None
+
+
+def get_backend_name(board: Board) -> str:
+    """
+    Get the name in BACKEND_MAP of the backend of a board, so workers can rebuild it.
+
+    Args:
+        board (Board): The board.
+
+    Returns:
+        str: The name of the backend.
+    """
+    return next(
+        name
+        for name, backend_class in BACKEND_MAP.items()
+        if type(board.backend) is backend_class
+    )
+
+
+def _load_after_move(position: bytes, backend: str, move: Move) -> Board:
+    """
+    Rebuild a board from its packed position and play a root move on it.
+
+    Args:
+        position (bytes): The packed root position.
+        backend (str): The name of the Board backend to use.
+        move (Move): The root move to play.
+
+    Returns:
+        Board: The board after the move.
+    """
+
+    board = decode_position(position, board=Board(backend=backend, move_cache_size=0))
+    board.make_move(*move)
+    return board
+
+
+def _perft_worker(task: Tuple[bytes, str, Move, int]) -> int:
+    """
+    Count the perft nodes below one root move, in a worker process.
+
+    Args:
+        task (Tuple[bytes, str, Move, int]): The packed root position, backend name, root move and depth below the move.
+
+    Returns:
+        int: The number of leaf nodes below the move.
+    """
+
+    position, backend, move, depth = task
+    return _load_after_move(position, backend, move).perft(depth)
+
+
+def _search_worker(task: Tuple[bytes, str, Move, int, float]) -> SearchResult:
+    """
+    Search the position after one root move, in a worker process.
+
+    Args:
+        task (Tuple[bytes, str, Move, int, float]): The packed root position, backend name, root move, depth below the move and table size in MB.
+
+    Returns:
+        SearchResult: The result of the search, from the side to move after the root move.
+    """
+
+    position, backend, move, depth, table_mb = task
+    board = _load_after_move(position, backend, move)
+    return Search(board, TranspositionTable(table_mb)).search(depth)
+
+
+def parallel_divide(
+    board: Board, depth: int, workers: Optional[int] = None
+) -> Dict[Move, int]:
+    """
+    Count the perft nodes below each root move, with the root moves split across processes.
+
+    Args:
+        board (Board): The board to count from, which is not changed.
+        depth (int): The number of plies to search, including the root move.
+        workers (Optional[int]): The number of worker processes (defaults to the number of CPUs).
+
+    Returns:
+        Dict[Move, int]: The number of leaf nodes reached through each root move.
+    """
+
+    position = encode_position(board)
+    backend = get_backend_name(board)
+    moves = board.get_legal_moves()
+    tasks = [(position, backend, move, depth - 1) for move in moves]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(_perft_worker, tasks)
+        return dict(zip(moves, counts))
+
+
+def parallel_perft(board: Board, depth: int, workers: Optional[int] = None) -> int:
+    """
+    Count the leaf nodes of the legal move tree, with the root moves split across processes.
+
+    Args:
+        board (Board): The board to count from, which is not changed.
+        depth (int): The number of plies to search.
+        workers (Optional[int]): The number of worker processes (defaults to the number of CPUs).
+
+    Returns:
+        int: The number of positions reached after exactly depth plies.
+    """
+
+    if depth <= 1:
+        return board.perft(depth)
+    return sum(parallel_divide(board, depth, workers).values())
+
+
+def parallel_search(
+    board: Board,
+    depth: int,
+    workers: Optional[int] = None,
+    table_mb: float = 16,
+) -> SearchResult:
+    """
+    Search the position to a fixed depth, with each root move searched in its own task.
+
+    Every root move is searched with a full window by a fresh Search in a worker process,
+    so the workers share no bounds or table and search more nodes in total than a single
+    Search, in exchange for running on every core.
+
+    Args:
+        board (Board): The board to search, which is not changed.
+        depth (int): The depth in plies, including the root move.
+        workers (Optional[int]): The number of worker processes (defaults to the number of CPUs).
+        table_mb (float): The transposition table size of each worker in megabytes (defaults to 16).
+
+    Returns:
+        SearchResult: The best move with its score and principal variation, and the nodes of every worker.
+    """
+
+    moves = board.get_legal_moves()
+    if depth <= 1 or not moves:
+        return Search(board).search(depth)
+
+    start = time.perf_counter()
+    position = encode_position(board)
+    backend = get_backend_name(board)
+    tasks = [(position, backend, move, depth - 1, table_mb) for move in moves]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results: List[SearchResult] = list(executor.map(_search_worker, tasks))
+
+    best_score, best_move, best_result = None, None, None
+    for move, result in zip(moves, results):
+        score = -result.score
+        # Mate scores count one more ply from the root
+        if score > MATE_THRESHOLD:
+            score -= 1
+        elif score < -MATE_THRESHOLD:
+            score += 1
+        if best_score is None or score > best_score:
+            best_score, best_move, best_result = score, move, result
+
+    notation = Notation.move_to_notation(board.board[best_move.origin], best_move)
+    return SearchResult(
+        best_move=best_move,
+        notation=notation,
+        score=best_score,
+        depth=depth,
+        nodes=sum(result.nodes for result in results) + 1,
+        seconds=time.perf_counter() - start,
+        pv=[notation] + best_result.pv,
+        pv_moves=(best_move,) + best_result.pv_moves,
+    )
+
+
+def _init_helper(table_name: str, table_mb: float, stop_event) -> None:
+    """
+    Attach a Lazy SMP helper process to the shared table and stop event.
+
+    Args:
+        table_name (str): The name of the shared memory block of the table.
+        table_mb (float): The size of the table in megabytes.
+        stop_event (multiprocessing.Event): Set when the helpers should stop searching.
+    """
+
+    global _helper_table, _helper_stop
+    _helper_table = SharedTranspositionTable(table_mb, name=table_name)
+    _helper_stop = stop_event
+
+
+def _helper_worker(task: Tuple[bytes, str, int]) -> SearchResult:
+    """
+    Search the root position with the shared table, in a Lazy SMP helper process.
+
+    Args:
+        task (Tuple[bytes, str, int]): The packed root position, backend name and depth.
+
+    Returns:
+        SearchResult: The result of the last iteration the helper completed.
+    """
+
+    position, backend, depth = task
+    board = decode_position(position, board=Board(backend=backend, move_cache_size=0))
+    return Search(board, _helper_table).search(
+        depth, should_stop=_helper_stop.is_set
+    )
+
+
+def lazy_smp_search(
+    board: Board,
+    depth: int,
+    workers: Optional[int] = None,
+    table_mb: float = 16,
+    time_limit: Optional[float] = None,
+) -> SearchResult:
+    """
+    Search the position with helper processes sharing one transposition table (Lazy SMP).
+
+    The main search runs in this process while every helper searches the same position,
+    every second one a ply deeper. The helpers share no state but the table, which fills
+    up with positions and best moves the main search then finds instead of searching.
+    The helpers are stopped once the main search returns, and the deepest completed result
+    is kept.
+
+    Args:
+        board (Board): The board to search, which is not changed.
+        depth (int): The depth of the main search in plies.
+        workers (Optional[int]): The number of helper processes (defaults to one less than the number of CPUs, at least 1).
+        table_mb (float): The size of the shared transposition table in megabytes (defaults to 16).
+        time_limit (Optional[float]): The maximum time of the main search in seconds, if any.
+
+    Returns:
+        SearchResult: The best move with its score and principal variation, and the nodes of every process.
+    """
+
+    if workers is None:
+        workers = max(1, (multiprocessing.cpu_count() or 1) - 1)
+    start = time.perf_counter()
+    position = encode_position(board)
+    backend = get_backend_name(board)
+    table = SharedTranspositionTable(table_mb)
+    stop_event = multiprocessing.Event()
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_helper,
+            initargs=(table.name, table_mb, stop_event),
+        ) as executor:
+            helpers = [
+                executor.submit(_helper_worker, (position, backend, depth + index % 2))
+                for index in range(1, workers + 1)
+            ]
+            result = Search(board, table).search(depth, time_limit=time_limit)
+            stop_event.set()
+            helper_results = [helper.result() for helper in helpers]
+    finally:
+        table.close()
+
+    nodes = result.nodes + sum(helper.nodes for helper in helper_results)
+    for helper in helper_results:
+        if helper.depth > result.depth and helper.best_move is not None:
+            result = helper
+    return result._replace(nodes=nodes, seconds=time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run perft or a search with the root moves split across processes."
+    )
+    parser.add_argument(
+        "--fen",
+        default=STARTING_FEN,
+        help="position to use (defaults to the starting position)",
+    )
+    parser.add_argument("--depth", type=int, default=4, help="depth in plies")
+    parser.add_argument("--workers", type=int, help="number of worker processes")
+    parser.add_argument("--search", action="store_true", help="search instead of perft")
+    parser.add_argument(
+        "--smp", action="store_true", help="search with Lazy SMP instead of root splitting"
+    )
+    parser.add_argument(
+        "--backend", choices=sorted(BACKEND_MAP), default="bitboard"
+    )
+    args = parser.parse_args()
+
+    board = Board(backend=args.backend)
+    board.process_fen(args.fen)
+    if args.search or args.smp:
+        if args.smp:
+            result = lazy_smp_search(board, args.depth, args.workers)
+        else:
+            result = parallel_search(board, args.depth, args.workers)
+        print(
+            f"bestmove {result.notation}  score {result.score}  pv {' '.join(result.pv)}  "
+            f"{result.nodes} nodes  {result.seconds:.3f}s  {result.nodes_per_second:.0f} nps"
+        )
+    else:
+        start = time.perf_counter()
+        nodes = parallel_perft(board, args.depth, args.workers)
+        seconds = time.perf_counter() - start
+        print(f"depth {args.depth}: {nodes} nodes {seconds:.3f}s {nodes / seconds:.0f} nps")
@@ -0,0 +1,195 @@
+import argparse
+import sys
+import time
+from typing import Dict, List, NamedTuple, Optional
+
+from board import Board, BACKEND_MAP
+from notation import Notation
+
+
+class PerftPosition(NamedTuple):
+    """
+    A position with known perft node counts.
+
+    Attributes:
+        name (str): The name the position is known by.
+        fen (str): The FEN string of the position.
+        nodes (Dict[int, int]): The known node count for each depth.
+    """
+
+    name: str
+    fen: str
+    nodes: Dict[int, int]
+
+
+# Reference counts from https://www.chessprogramming.org/Perft_Results
+PERFT_POSITIONS: List[PerftPosition] = [
+    PerftPosition(
+        "start",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        {1: 20, 2: 400, 3: 8902, 4: 197281, 5: 4865609},
+    ),
+    PerftPosition(
+        "kiwipete",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        {1: 48, 2: 2039, 3: 97862, 4: 4085603},
+    ),
+    PerftPosition(
+        "position3",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        {1: 14, 2: 191, 3: 2812, 4: 43238, 5: 674624},
+    ),
+    PerftPosition(
+        "position4",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        {1: 6, 2: 264, 3: 9467, 4: 422333},
+    ),
+    PerftPosition(
+        "position5",
+        "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+        {1: 44, 2: 1486, 3: 62379, 4: 2103487},
+    ),
+    PerftPosition(
+        "position6",
+        "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+        {1: 46, 2: 2079, 3: 89890, 4: 3894594},
+    ),
+]
+
+
+class PerftResult(NamedTuple):
+    """
+    The outcome of one perft run.
+
+    Attributes:
+        nodes (int): The number of leaf nodes counted.
+        seconds (float): The time the run took.
+        expected (Optional[int]): The known node count, if any.
+    """
+
+    nodes: int
+    seconds: float
+    expected: Optional[int] = None
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        Get the move generation throughput of the run.
+
+        Returns:
+            float: The number of leaf nodes counted per second.
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def passed(self) -> bool:
+        """
+        Check the node count against the known value.
+
+        Returns:
+            bool: True if the count matches or no count is known, False otherwise.
+        """
+        return self.expected is None or self.nodes == self.expected
+
+
+def run_perft(
+    fen: str, depth: int, backend: str = "bitboard", expected: Optional[int] = None
+) -> PerftResult:
+    """
+    Time a perft run of the given position.
+
+    Args:
+        fen (str): The FEN string of the position.
+        depth (int): The number of plies to search.
+        backend (str): The name of the Board backend to use.
+        expected (Optional[int]): The known node count, if any.
+
+    Returns:
+        PerftResult: The node count and timing of the run.
+    """
+
+    board = Board(backend=backend)
+    board.process_fen(fen)
+
+    start = time.perf_counter()
+    nodes = board.perft(depth)
+    return PerftResult(nodes, time.perf_counter() - start, expected)
+
+
+def run_perft_suite(max_depth: int, backend: str = "bitboard") -> bool:
+    """
+    Run every reference position up to the given depth and print a report.
+
+    Args:
+        max_depth (int): The deepest depth to run for each position.
+        backend (str): The name of the Board backend to use.
+
+    Returns:
+        bool: True if every node count matched, False otherwise.
+    """
+
+    all_passed = True
+    total_nodes, total_seconds = 0, 0.0
+
+    for position in PERFT_POSITIONS:
+        for depth, expected in sorted(position.nodes.items()):
+            if depth > max_depth:
+                break
+            result = run_perft(position.fen, depth, backend, expected)
+            total_nodes += result.nodes
+            total_seconds += result.seconds
+            all_passed = all_passed and result.passed
+            print(
+                f"{position.name:<10} depth {depth}: {result.nodes:>9} nodes "
+                f"{result.seconds:8.3f}s {result.nodes_per_second:>10.0f} nps "
+                f"{'ok' if result.passed else f'FAIL (expected {expected})'}"
+            )
+
+    if total_seconds > 0:
+        print(f"total: {total_nodes} nodes, {total_nodes / total_seconds:.0f} nps")
+    return all_passed
+
+
+def print_divide(fen: str, depth: int, backend: str = "bitboard") -> None:
+    """
+    Print the perft node count below each root move.
+
+    Args:
+        fen (str): The FEN string of the position.
+        depth (int): The number of plies to search, including the root move.
+        backend (str): The name of the Board backend to use.
+    """
+
+    board = Board(backend=backend)
+    board.process_fen(fen)
+
+    nodes = board.divide(depth)
+    for move, count in nodes.items():
+        print(f"{Notation.move_to_notation(board.board[move.origin], move)}: {count}")
+    print(f"total: {sum(nodes.values())}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Check move generation against known perft node counts."
+    )
+    parser.add_argument("--depth", type=int, default=3, help="maximum depth to run")
+    parser.add_argument("--fen", help="run a single position instead of the suite")
+    parser.add_argument(
+        "--divide", action="store_true", help="print node counts per root move"
+    )
+    parser.add_argument(
+        "--backend", choices=sorted(BACKEND_MAP), default="bitboard"
+    )
+    args = parser.parse_args()
+
+    if args.fen and args.divide:
+        print_divide(args.fen, args.depth, args.backend)
+    elif args.fen:
+        result = run_perft(args.fen, args.depth, args.backend)
+        print(
+            f"depth {args.depth}: {result.nodes} nodes "
+            f"{result.seconds:.3f}s {result.nodes_per_second:.0f} nps"
+        )
+    else:
+        sys.exit(0 if run_perft_suite(args.depth, args.backend) else 1)
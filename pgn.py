@@ -0,0 +1,278 @@
+import argparse
+import re
+import time
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO
+
+from board import Board, BACKEND_MAP, STARTING_FEN
+from moves import Move
+from king_validation import KingNotFound
+
+RESULTS = {"1-0", "0-1", "1/2-1/2", "*"}
+
+# Size of the reads from a PGN file, games are parsed line by line from the buffer
+CHUNK_SIZE = 1 << 20
+
+TAG_RE = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# Comments, variation marks, numeric annotation glyphs and everything up to the next separator
+TOKEN_RE = re.compile(r"\{[^}]*\}?|;.*|[()]|\$\d+|[^\s{}();$]+")
+# Move numbers such as "12." or "12...", which keeps the zeros of castling written as 0-0
+MOVE_NUMBER_RE = re.compile(r"^\d+\.+")
+# Optional en passant annotation, written after the move or as a token of its own
+EN_PASSANT_SUFFIX = "e.p."
+
+
+class PgnGame(NamedTuple):
+    """
+    A game read from a PGN file.
+
+    Attributes:
+        headers (Dict[str, str]): The tag pairs of the game, such as "White" or "FEN".
+        moves (List[str]): The moves of the main line in SAN, without move numbers, comments or variations.
+        result (str): The game termination marker, "1-0", "0-1", "1/2-1/2" or "*".
+    """
+
+    headers: Dict[str, str]
+    moves: List[str]
+    result: str
+
+
+class PgnStats(NamedTuple):
+    """
+    The outcome of replaying a PGN file.
+
+    Attributes:
+        games (int): The number of games read.
+        moves (int): The number of moves replayed.
+        errors (int): The number of games stopped by a move that is not legal or not understood, or a position that can not be set up.
+        seconds (float): The time the replay took.
+    """
+
+    games: int
+    moves: int
+    errors: int
+    seconds: float
+
+    @property
+    def games_per_second(self) -> float:
+        """
+        Get the game throughput.
+
+        Returns:
+            float: The number of games read per second.
+        """
+        return self.games / self.seconds if self.seconds > 0 else float("inf")
+
+    @property
+    def moves_per_second(self) -> float:
+        """
+        Get the move throughput.
+
+        Returns:
+            float: The number of moves replayed per second.
+        """
+        return self.moves / self.seconds if self.seconds > 0 else float("inf")
+
+
+def read_games(file: TextIO) -> Iterator[PgnGame]:
+    """
+    Read the games of a PGN file one at a time.
+
+    Only the game being read is held in memory, so any file size is read with constant
+    memory. Comments, variations and numeric annotation glyphs are skipped.
+
+    Args:
+        file (TextIO): The open PGN file, or any iterable of its lines.
+
+    Yields:
+        PgnGame: Each game in the file.
+    """
+
+    headers: Dict[str, str] = {}
+    moves: List[str] = []
+    in_comment = False
+    variation_depth = 0
+
+    for line in file:
+        if in_comment:
+            end = line.find("}")
+            if end < 0:
+                continue
+            in_comment = False
+            line = line[end + 1:]
+
+        stripped = line.strip()
+        if not stripped or stripped[0] == "%":
+            continue
+        if stripped[0] == "[" and not variation_depth:
+            # Tags after moves start the next game, when its result marker is missing
+            if moves:
+                yield PgnGame(headers, moves, headers.get("Result", "*"))
+                headers, moves = {}, []
+            tag = TAG_RE.match(stripped)
+            if tag is not None:
+                headers[tag.group(1)] = tag.group(2).replace('\\"', '"')
+            continue
+
+        for token in TOKEN_RE.findall(stripped):
+            first = token[0]
+            if first == "{":
+                in_comment = not token.endswith("}")
+            elif first == "(":
+                variation_depth += 1
+            elif first == ")":
+                variation_depth = max(0, variation_depth - 1)
+            elif first in ";$" or variation_depth:
+                continue
+            elif token in RESULTS:
+                yield PgnGame(headers, moves, token)
+                headers, moves = {}, []
+            else:
+                move = MOVE_NUMBER_RE.sub("", token).removesuffix(EN_PASSANT_SUFFIX)
+                if move:
+                    moves.append(move)
+
+    if headers or moves:
+        yield PgnGame(headers, moves, headers.get("Result", "*"))
+
+
+def replay_game(game: PgnGame, board: Board) -> Iterator[Move]:
+    """
+    Play the moves of a game on a board, checking each against the legal moves.
+
+    The board is set to the starting position of the game, and each move is yielded once
+    it is played, so the caller can look at every position of the game on the board.
+
+    Args:
+        game (PgnGame): The game to replay.
+        board (Board): The board to play on.
+
+    Yields:
+        Move: Each move, after it is played on the board.
+
+    Raises:
+        InvalidNotation: If a move is not legal or not understood, the board is left before it.
+        ValueError: If the FEN tag of the game is not valid.
+    """
+
+    board.process_fen(game.headers.get("FEN", STARTING_FEN))
+    for san in game.moves:
+        move = board.san_to_move(san)
+        board.make_move(*move)
+        yield move
+
+
+def moves_to_san(board: Board, moves: Iterable[Move]) -> List[str]:
+    """
+    Play moves on a board and write each in SAN, for exporting a game.
+
+    Args:
+        board (Board): The board in the position before the first move, left after the last move.
+        moves (Iterable[Move]): The legal moves to play.
+
+    Returns:
+        List[str]: The moves in SAN.
+    """
+
+    sans = []
+    for move in moves:
+        sans.append(board.move_to_san(move))
+        board.make_move(*move)
+    return sans
+
+
+def format_game(game: PgnGame, line_length: int = 80) -> str:
+    """
+    Write a game in PGN, with the tag pairs followed by the numbered moves.
+
+    Args:
+        game (PgnGame): The game to write.
+        line_length (int): The maximum length of the move text lines (defaults to 80).
+
+    Returns:
+        str: The game in PGN, ending with an empty line.
+    """
+
+    lines = []
+    for name, value in game.headers.items():
+        escaped = value.replace('"', '\\"')
+        lines.append(f'[{name} "{escaped}"]')
+    lines.append("")
+
+    fields = game.headers.get("FEN", STARTING_FEN).split()
+    move_number = int(fields[5]) if len(fields) > 5 else 1
+    black_to_move = len(fields) > 1 and fields[1] == "b"
+
+    tokens = []
+    for san in game.moves:
+        if not black_to_move:
+            tokens.append(f"{move_number}. {san}")
+        elif not tokens:
+            tokens.append(f"{move_number}... {san}")
+        else:
+            tokens.append(san)
+        if black_to_move:
+            move_number += 1
+        black_to_move = not black_to_move
+    tokens.append(game.result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > line_length:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+    return "\n".join(lines) + "\n\n"
+
+
+def replay_file(
+    path: str, backend: str = "bitboard", limit: Optional[int] = None
+) -> PgnStats:
+    """
+    Read and replay the games of a PGN file, measuring the throughput.
+
+    Args:
+        path (str): The path of the PGN file.
+        backend (str): The name of the Board backend used to check the moves (defaults to "bitboard").
+        limit (Optional[int]): The maximum number of games to replay, if any.
+
+    Returns:
+        PgnStats: The number of games, moves and errors and the time taken.
+    """
+
+    board = Board(backend=backend, move_cache_size=0)
+    games, moves, errors = 0, 0, 0
+    start = time.perf_counter()
+    with open(path, encoding="utf-8", errors="replace", buffering=CHUNK_SIZE) as file:
+        for game in read_games(file):
+            if games == limit:
+                break
+            games += 1
+            try:
+                for _ in replay_game(game, board):
+                    moves += 1
+            except (ValueError, KeyError, IndexError, KingNotFound):
+                # A move that is not legal (InvalidNotation), a malformed FEN tag or a
+                # position without a king only skips the rest of this game
+                errors += 1
+    return PgnStats(games, moves, errors, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Replay the games of a PGN file and report the throughput."
+    )
+    parser.add_argument("path", help="PGN file to read")
+    parser.add_argument(
+        "--backend", choices=sorted(BACKEND_MAP), default="bitboard"
+    )
+    parser.add_argument("--limit", type=int, help="maximum number of games")
+    args = parser.parse_args()
+
+    stats = replay_file(args.path, args.backend, args.limit)
+    print(
+        f"{stats.games} games  {stats.moves} moves  {stats.errors} errors  "
+        f"{stats.seconds:.3f}s  {stats.games_per_second:.1f} games/s  "
+        f"{stats.moves_per_second:.0f} moves/s"
+    )
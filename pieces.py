@@ -1,5 +1,5 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Tuple
 
 
@@ -66,11 +66,14 @@ PIECE_STR: Dict[PieceType, Tuple[str, str]] = {
 Position = Tuple[int, int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Piece:
     """
     Represents a chess piece.
 
+    Pieces are slotted to keep them small. Empty squares are all filled with the shared
+    EMPTY_SQUARE, which can not be modified.
+
     Attributes:
         x (int): The x-coordinate of the piece on the chessboard.
         y (int): The y-coordinate of the piece on the chessboard.
@@ -84,8 +87,10 @@ class Piece:
     y: int
     color: Color = Color.NONE
     type: PieceType = PieceType.EMPTY
-    has_moved = False
-    en_passantable = False  # only True for pawn that moved 2 spaces, and returns to False after 1 turn by opposite color
+    has_moved: bool = field(default=False, compare=False)
+    en_passantable: bool = field(
+        default=False, compare=False
+    )  # only True for pawn that moved 2 spaces, and returns to False after 1 turn by opposite color
 
     @property
     def repr(self) -> str:
@@ -121,3 +126,38 @@ class Piece:
         color = Color.WHITE if fen.isupper() else Color.BLACK
         type = FEN_MAP[fen.lower()]
         return Piece(x, y, color, type)
+
+
+class _EmptySquare(Piece):
+    """
+    The piece shared by every empty square of every board, which can not be modified.
+
+    Inherits from Piece. Setting any attribute raises AttributeError, as a change would show
+    up on every empty square at once.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Initialize the empty square, it is not on the board itself so it has no position."""
+        for name, value in (
+            ("x", -1),
+            ("y", -1),
+            ("color", Color.NONE),
+            ("type", PieceType.EMPTY),
+            ("has_moved", False),
+            ("en_passantable", False),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Refuse every change to the shared empty square."""
+        raise AttributeError(f"EMPTY_SQUARE is shared and its {name} can not be set")
+
+    def __reduce__(self) -> str:
+        """Copy and unpickle to the shared EMPTY_SQUARE itself."""
+        return "EMPTY_SQUARE"
+
+
+# Shared piece for every empty square
+EMPTY_SQUARE = _EmptySquare()
@@ -0,0 +1,229 @@
+import mmap
+import struct
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from board import Board
+from moves import Move
+from position_encoding import POSITION_SIZE, encode_position, decode_position
+from transposition import encode_move, decode_move
+
+# Layout of a database file: a header followed by fixed-size records sorted by Zobrist key
+#   header (16 bytes): MAGIC, the format version (4 bytes) and the number of records (4 bytes)
+#   record (48 bytes): Zobrist key (8 bytes), packed position (32 bytes), score (4 bytes),
+#       move packed by encode_move (2 bytes), depth (1 byte), 1 byte of padding
+MAGIC = b"CHESSPDB"
+VERSION = 1
+HEADER_STRUCT = struct.Struct("<8sII")
+RECORD_STRUCT = struct.Struct(f"<Q{POSITION_SIZE}siHBx")
+KEY_STRUCT = struct.Struct("<Q")
+HEADER_SIZE = HEADER_STRUCT.size
+RECORD_SIZE = RECORD_STRUCT.size
+
+# Bytes of a packed position that identify it, the clocks after them are not compared
+IDENTITY_SIZE = 26
+
+
+class PositionRecord(NamedTuple):
+    """
+    A position stored in the database.
+
+    Attributes:
+        key (int): The Zobrist key of the position.
+        position (bytes): The position packed by encode_position.
+        score (int): The stored score in centipawns.
+        move (Optional[Move]): The stored best move, if any.
+        depth (int): The depth the position was analysed to.
+    """
+
+    key: int
+    position: bytes
+    score: int
+    move: Optional[Move]
+    depth: int
+
+    def to_board(self, backend: str = "dict") -> Board:
+        """
+        Unpack the stored position.
+
+        Args:
+            backend (str): The name of the Board backend (defaults to "dict").
+
+        Returns:
+            Board: A new board holding the position.
+        """
+        return decode_position(self.position, board=Board(backend=backend))
+
+
+def write_database(
+    path: str, entries: Iterable[Tuple[Board, int, Optional[Move], int]]
+) -> int:
+    """
+    Write positions to a database file, replacing the file.
+
+    The records are sorted by Zobrist key, a position given more than once keeps its last entry.
+
+    Args:
+        path (str): The path of the file.
+        entries (Iterable[Tuple[Board, int, Optional[Move], int]]): The board, score, best move and depth of each position.
+
+    Returns:
+        int: The number of records written.
+    """
+
+    records = {}
+    for board, score, move, depth in entries:
+        records[board.zobrist_key] = RECORD_STRUCT.pack(
+            board.zobrist_key, encode_position(board), score, encode_move(move), depth
+        )
+
+    with open(path, "wb") as file:
+        file.write(HEADER_STRUCT.pack(MAGIC, VERSION, len(records)))
+        for key in sorted(records):
+            file.write(records[key])
+    return len(records)
+
+
+class PositionDatabase:
+    """
+    Read-only database of positions on disk, looked up by Zobrist key.
+
+    The file is memory mapped, so only the pages a lookup touches are read. A lookup is a
+    binary search over the sorted record keys, O(log n) reads of 8 bytes.
+
+    Attributes:
+        path (str): The path of the file.
+        count (int): The number of records.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initialize the PositionDatabase object by mapping the file.
+
+        Args:
+            path (str): The path of a file written by write_database.
+
+        Raises:
+            ValueError: If the file is not a position database of this version.
+        """
+
+        self.path = path
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._map) < HEADER_SIZE:
+            self._map.close()
+            raise ValueError(f"{path} is not a position database")
+        magic, version, self.count = HEADER_STRUCT.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} position database")
+        if len(self._map) != HEADER_SIZE + self.count * RECORD_SIZE:
+            self._map.close()
+            raise ValueError(f"{path} is truncated")
+
+    def __len__(self) -> int:
+        """
+        Get the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.count
+
+    def __iter__(self) -> Iterator[PositionRecord]:
+        """
+        Iterate over the records in key order.
+
+        Yields:
+            PositionRecord: Each record.
+        """
+
+        for index in range(self.count):
+            yield self._read_record(index)
+
+    def __contains__(self, board: Board) -> bool:
+        """
+        Check if the position of a board is stored.
+
+        Args:
+            board (Board): The board.
+
+        Returns:
+            bool: True if the position is stored.
+        """
+        return self.lookup(board) is not None
+
+    def find(self, key: int) -> Optional[PositionRecord]:
+        """
+        Look up a record by Zobrist key.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[PositionRecord]: The record, or None if the key is not stored.
+        """
+
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            stored = KEY_STRUCT.unpack_from(
+                self._map, HEADER_SIZE + middle * RECORD_SIZE
+            )[0]
+            if stored < key:
+                low = middle + 1
+            elif stored > key:
+                high = middle
+            else:
+                return self._read_record(middle)
+        return None
+
+    def lookup(self, board: Board) -> Optional[PositionRecord]:
+        """
+        Look up the position of a board.
+
+        The stored position is compared with the board, so a Zobrist key collision is not
+        mistaken for the position.
+
+        Args:
+            board (Board): The board.
+
+        Returns:
+            Optional[PositionRecord]: The record, or None if the position is not stored.
+        """
+
+        record = self.find(board.zobrist_key)
+        if record is None:
+            return None
+        if record.position[:IDENTITY_SIZE] != encode_position(board)[:IDENTITY_SIZE]:
+            return None
+        return record
+
+    def close(self) -> None:
+        """Unmap the file."""
+
+        self._map.close()
+
+    def __enter__(self) -> "PositionDatabase":
+        """Use the database as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Unmap the file when leaving the context."""
+        self.close()
+
+    def _read_record(self, index: int) -> PositionRecord:
+        """
+        Read the record at the given index.
+
+        Args:
+            index (int): The index of the record in key order.
+
+        Returns:
+            PositionRecord: The record.
+        """
+
+        key, position, score, move, depth = RECORD_STRUCT.unpack_from(
+            self._map, HEADER_SIZE + index * RECORD_SIZE
+        )
+        return PositionRecord(key, position, score, decode_move(move), depth)
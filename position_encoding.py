@@ -0,0 +1,150 @@
+import struct
+from typing import Iterable, Iterator, Optional, Union
+
+from board import Board
+from pieces import Piece, Color, EMPTY_SQUARE
+from mailbox_board import PIECE_CODE, CODE_PIECE_TYPE, EMPTY, KING
+
+# Layout of an encoded position, 32 bytes:
+#   occupancy (8 bytes): bit x * 8 + y is set for every occupied square
+#   pieces (16 bytes): one nibble per occupied square in square order, the mailbox piece
+#       code with bit 3 set for black, the first square in the low nibble
+#   flags (1 byte): bit 0 set when black is to move, bits 1-4 the castling rights
+#   en passant (1 byte): the file of the pawn that can be captured en passant plus one, 0 for none
+#   halfmove clock (1 byte, kept at 255 past it), fullmove number (2 bytes), 3 bytes of padding
+POSITION_STRUCT = struct.Struct("<Q16sBBBH3x")
+POSITION_SIZE = POSITION_STRUCT.size
+
+# The nibbles hold at most this many pieces
+MAX_PIECES = 32
+
+BLACK_BIT = 8
+# PieceType and Color of each nibble value, None for values no piece packs to
+NIBBLE_PIECE = [
+    (CODE_PIECE_TYPE[nibble & 7], Color.BLACK if nibble & BLACK_BIT else Color.WHITE)
+    if EMPTY < nibble & 7 <= KING
+    else None
+    for nibble in range(16)
+]
+
+
+def encode_position(board: Board) -> bytes:
+    """
+    Pack a position into POSITION_SIZE bytes.
+
+    Args:
+        board (Board): The board to pack.
+
+    Returns:
+        bytes: The packed position.
+
+    Raises:
+        ValueError: If the board has more than MAX_PIECES pieces.
+    """
+
+    occupancy = 0
+    nibbles = 0
+    count = 0
+    squares = board.board
+    for square in range(64):
+        piece = squares[divmod(square, 8)]
+        if piece.color == Color.NONE:
+            continue
+        if count == MAX_PIECES:
+            raise ValueError(f"Can not pack more than {MAX_PIECES} pieces")
+        occupancy |= 1 << square
+        nibble = PIECE_CODE[piece.type] | (BLACK_BIT if piece.color == Color.BLACK else 0)
+        nibbles |= nibble << 4 * count
+        count += 1
+
+    en_passant = board.en_passant_position
+    return POSITION_STRUCT.pack(
+        occupancy,
+        nibbles.to_bytes(16, "little"),
+        (board.expected_player == Color.BLACK) | board.castling_rights << 1,
+        0 if en_passant is None else en_passant[1] + 1,
+        min(board.halfmove_clock, 255),
+        board.moves_made // 2 + 1,
+    )
+
+
+def decode_position(
+    data: Union[bytes, memoryview], offset: int = 0, board: Optional[Board] = None
+) -> Board:
+    """
+    Unpack a position packed by encode_position.
+
+    Args:
+        data (Union[bytes, memoryview]): The buffer holding the packed position.
+        offset (int): The index of the first byte of the position in the buffer (defaults to 0).
+        board (Optional[Board]): The board to load the position into (defaults to a new Board).
+
+    Returns:
+        Board: The board holding the position.
+    """
+
+    occupancy, nibble_bytes, flags, en_passant_file, halfmove, fullmove = (
+        POSITION_STRUCT.unpack_from(data, offset)
+    )
+    if board is None:
+        board = Board()
+
+    nibbles = int.from_bytes(nibble_bytes, "little")
+    squares = board.board
+    for square in range(64):
+        position = divmod(square, 8)
+        if occupancy >> square & 1:
+            piece_type, color = NIBBLE_PIECE[nibbles & 15]
+            nibbles >>= 4
+            squares[position] = Piece(*position, type=piece_type, color=color)
+        else:
+            squares[position] = EMPTY_SQUARE
+
+    black_to_move = flags & 1
+    board.moves_made = (fullmove - 1) * 2 + black_to_move
+    board.castling_rights = flags >> 1 & 15
+    board.halfmove_clock = halfmove
+    # The pawn that can be captured en passant belongs to the side that just moved
+    board.en_passant_position = (
+        (4 if black_to_move else 3, en_passant_file - 1) if en_passant_file else None
+    )
+    board.refresh()
+    return board
+
+
+def encode_positions(boards: Iterable[Board]) -> bytes:
+    """
+    Pack positions one after the other into a single buffer.
+
+    Args:
+        boards (Iterable[Board]): The boards to pack.
+
+    Returns:
+        bytes: The packed positions, POSITION_SIZE bytes each.
+    """
+    return b"".join(encode_position(board) for board in boards)
+
+
+def decode_positions(
+    data: Union[bytes, memoryview], backend: str = "dict"
+) -> Iterator[Board]:
+    """
+    Unpack positions packed by encode_positions, without copying the buffer.
+
+    Args:
+        data (Union[bytes, memoryview]): The buffer holding the packed positions.
+        backend (str): The name of the Board backend of the boards (defaults to "dict").
+
+    Yields:
+        Board: A new board for each packed position.
+
+    Raises:
+        ValueError: If the buffer size is not a multiple of POSITION_SIZE.
+    """
+
+    if len(data) % POSITION_SIZE:
+        raise ValueError(
+            f"Buffer of {len(data)} bytes does not hold whole {POSITION_SIZE} byte positions"
+        )
+    for offset in range(0, len(data), POSITION_SIZE):
+        yield decode_position(data, offset, Board(backend=backend))
@@ -0,0 +1,661 @@
+import argparse
+import sys
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from board import Board, BACKEND_MAP, STARTING_FEN
+from moves import Move
+from notation import Notation
+from pieces import Color, PieceType
+from evaluation import Evaluation, EXCHANGE_VALUES
+from transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+
+# Score of a checkmate at the root, mates further away score less
+MATE_SCORE = 100000
+INFINITY = MATE_SCORE + 1
+# Scores beyond this are mate scores, stored in the table relative to the node
+MATE_THRESHOLD = MATE_SCORE - 256
+
+# Number of nodes searched between two checks of the time limit
+CHECK_INTERVAL = 1024
+
+# Deepest ply with killer moves, beyond any iteration the search reaches
+MAX_PLY = 128
+
+# Ordering scores of each kind of move, the best kind is searched first
+FIRST_MOVE_SCORE = 3_000_000
+GOOD_CAPTURE_SCORE = 2_000_000
+PROMOTION_SCORE = 1_900_000
+KILLER_SCORE = 1_000_000
+# Quiet moves score their history, which is never negative, so only losing captures score below 0
+LOSING_CAPTURE_SCORE = -1_000_000
+
+# Positions searched by the benchmark, from quiet openings to tactical middle games
+BENCH_POSITIONS: List[str] = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+    "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+    "r1bqkb1r/pppp1ppp/2n2n2/4p2Q/2B1P3/8/PPPP1PPP/RNB1K1NR w KQkq - 4 4",
+    "2r3k1/pp3ppp/2n1b3/q2pP3/3P4/P1PB1N2/5PPP/R2Q1RK1 b - - 0 18",
+]
+
+
+class SearchStopped(Exception):
+    """Raised inside the search when its time or node limit is reached."""
+
+    pass
+
+
+class SearchResult(NamedTuple):
+    """
+    The outcome of a search.
+
+    Attributes:
+        best_move (Optional[Move]): The best move found, None if the side to move has no legal move.
+        notation (Optional[str]): The best move in the project notation, e.g. "Pe2e4".
+        score (int): The score of the best move in centipawns, from the side to move.
+        depth (int): The depth of the last completed iteration.
+        nodes (int): The number of nodes searched.
+        seconds (float): The time the search took.
+        pv (List[str]): The principal variation in the project notation.
+        pv_moves (Tuple[Move, ...]): The moves of the principal variation.
+    """
+
+    best_move: Optional[Move]
+    notation: Optional[str]
+    score: int
+    depth: int
+    nodes: int
+    seconds: float
+    pv: List[str]
+    pv_moves: Tuple[Move, ...] = ()
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        Get the search throughput.
+
+        Returns:
+            float: The number of nodes searched per second.
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else float("inf")
+
+
+class Search:
+    """
+    Negamax alpha-beta search with iterative deepening over a Board.
+
+    Moves are generated by the backend of the board, so a Board created with the
+    "bitboard" backend searches fastest. The board is played on in place and left
+    unchanged when the search returns. Searched positions are stored in a transposition
+    table, which is kept between searches.
+
+    Moves are ordered with the transposition table or principal variation move first,
+    then captures by most valuable victim and least valuable attacker, promotions, killer
+    moves and quiet moves by history. Captures the static exchange evaluation shows to lose
+    material come last. At depth 0 a quiescence search plays out the captures.
+
+    Attributes:
+        board (Board): The board to search, with the side to move as its expected player.
+        table (TranspositionTable): The table of searched positions.
+        ordering (bool): Whether the moves of the main search are ordered, or searched in generation order.
+        use_quiescence (bool): Whether captures are searched past depth 0.
+        nodes (int): The number of nodes searched by the current search, quiescence nodes included.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        table: Optional[TranspositionTable] = None,
+        ordering: bool = True,
+        use_quiescence: bool = True,
+    ) -> None:
+        """
+        Initialize the Search object.
+
+        Args:
+            board (Board): The board to search.
+            table (Optional[TranspositionTable]): The table of searched positions (defaults to a new 16 MB table).
+            ordering (bool): Whether the moves of the main search are ordered (defaults to True).
+            use_quiescence (bool): Whether captures are searched past depth 0 (defaults to True).
+        """
+
+        self.board = board
+        self.table = table if table is not None else TranspositionTable()
+        self.ordering = ordering
+        self.use_quiescence = use_quiescence
+        self.nodes = 0
+        self._killers: List[List[Optional[Move]]] = []
+        self._history: List[List[int]] = []
+        self._deadline: Optional[float] = None
+        self._node_limit: Optional[int] = None
+        self._should_stop: Optional[Callable[[], bool]] = None
+        self._pv_table: List[List[Move]] = []
+
+    def evaluate(self) -> int:
+        """
+        Evaluate the position from the evaluation the board keeps up to date.
+
+        Returns:
+            int: The score in centipawns, from the side to move.
+        """
+
+        score = self.board.evaluation
+        return score if self.board.expected_player == Color.WHITE else -score
+
+    def search(
+        self,
+        depth: int = 64,
+        time_limit: Optional[float] = None,
+        node_limit: Optional[int] = None,
+        on_iteration: Optional[Callable[[SearchResult], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> SearchResult:
+        """
+        Search the position with iterative deepening until a limit is reached.
+
+        Every iteration searches the previous principal variation first, then the best move
+        stored in the transposition table. When a limit stops an iteration, the result of the last completed iteration is returned.
+
+        Args:
+            depth (int): The maximum depth in plies (defaults to 64).
+            time_limit (Optional[float]): The maximum time in seconds, if any.
+            node_limit (Optional[int]): The maximum number of nodes, if any.
+            on_iteration (Optional[Callable[[SearchResult], None]]): Called with the result of each completed iteration.
+            should_stop (Optional[Callable[[], bool]]): Polled with the time limit, the search stops when it returns True.
+
+        Returns:
+            SearchResult: The best move, score and principal variation with the search statistics.
+        """
+
+        start = time.perf_counter()
+        self.nodes = 0
+        self._killers = [[None, None] for _ in range(MAX_PLY)]
+        # Indexed by color value, then origin and target square index
+        self._history = [[0] * 4096, [0] * 4096]
+        self._deadline = start + time_limit if time_limit is not None else None
+        self._node_limit = node_limit
+        self._should_stop = should_stop
+
+        root_moves = self._get_legal_moves()
+        result = self._make_result(root_moves[:1], 0, 0, start)
+        if not root_moves:
+            if self.board.is_king_in_check(self.board.expected_player):
+                return result._replace(score=-MATE_SCORE)
+            return result
+
+        pv: List[Move] = []
+        for iteration_depth in range(1, depth + 1):
+            self._pv_table = [[] for _ in range(iteration_depth + 1)]
+            try:
+                score = self.negamax(iteration_depth, -INFINITY, INFINITY, 0, pv)
+            except SearchStopped:
+                break
+
+            pv = self._pv_table[0]
+            result = self._make_result(pv, score, iteration_depth, start)
+            if on_iteration is not None:
+                on_iteration(result)
+            # A forced mate can not be improved by searching deeper
+            if abs(score) >= MATE_SCORE - iteration_depth:
+                break
+
+        return result._replace(
+            nodes=self.nodes, seconds=time.perf_counter() - start
+        )
+
+    def negamax(
+        self, depth: int, alpha: int, beta: int, ply: int, pv: List[Move]
+    ) -> int:
+        """
+        Score the position with a fail-hard alpha-beta negamax search.
+
+        Positions already searched to at least the remaining depth are answered from the
+        transposition table, except at the root.
+
+        Args:
+            depth (int): The remaining depth in plies.
+            alpha (int): The score the side to move is already guaranteed.
+            beta (int): The score above which the opponent avoids this position.
+            ply (int): The distance from the root.
+            pv (List[Move]): The principal variation of the previous iteration from this node, searched first.
+
+        Returns:
+            int: The score of the position from the side to move.
+
+        Raises:
+            SearchStopped: If the time or node limit is reached.
+        """
+
+        self._count_node()
+
+        self._pv_table[ply] = []
+        if depth == 0:
+            if self.use_quiescence:
+                return self.quiescence(alpha, beta, ply)
+            return self.evaluate()
+
+        board = self.board
+        key = board.zobrist_key
+        entry = self.table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry.move
+            if ply > 0 and entry.depth >= depth:
+                score = score_from_table(entry.score, ply)
+                if entry.bound == EXACT:
+                    return score
+                if entry.bound == LOWER_BOUND and score >= beta:
+                    return beta
+                if entry.bound == UPPER_BOUND and score <= alpha:
+                    return alpha
+
+        legal_moves = self._get_legal_moves()
+        if not legal_moves:
+            if board.is_king_in_check(board.expected_player):
+                return -MATE_SCORE + ply
+            return 0
+
+        first_move = pv[0] if pv else table_move
+        if self.ordering:
+            legal_moves = self.order_moves(legal_moves, first_move, ply)
+        elif first_move is not None and first_move in legal_moves:
+            legal_moves.remove(first_move)
+            legal_moves.insert(0, first_move)
+
+        original_alpha = alpha
+        best_move = None
+        for move in legal_moves:
+            undo = board.make_move(*move)
+            try:
+                score = -self.negamax(
+                    depth - 1,
+                    -beta,
+                    -alpha,
+                    ply + 1,
+                    pv[1:] if pv and move == pv[0] else [],
+                )
+            finally:
+                board.unmake_move(undo)
+
+            if score >= beta:
+                self.table.store(
+                    key, depth, score_to_table(beta, ply), LOWER_BOUND, move
+                )
+                if not self._is_capture(move):
+                    self._record_quiet_cutoff(move, depth, ply)
+                return beta
+            if score > alpha:
+                alpha = score
+                best_move = move
+                self._pv_table[ply] = [move] + self._pv_table[ply + 1]
+
+        bound = EXACT if alpha > original_alpha else UPPER_BOUND
+        self.table.store(key, depth, score_to_table(alpha, ply), bound, best_move)
+        return alpha
+
+    def quiescence(self, alpha: int, beta: int, ply: int) -> int:
+        """
+        Score the position once the captures on the board have been played out.
+
+        The side to move may stand pat on the static evaluation or try its captures.
+        Captures are always ordered by most valuable victim and least valuable attacker,
+        without which the capture sequences explode. Underpromotions and captures losing
+        material by static exchange evaluation are not searched.
+
+        Args:
+            alpha (int): The score the side to move is already guaranteed.
+            beta (int): The score above which the opponent avoids this position.
+            ply (int): The distance from the root.
+
+        Returns:
+            int: The score of the position from the side to move.
+
+        Raises:
+            SearchStopped: If the time or node limit is reached.
+        """
+
+        self._count_node()
+
+        stand_pat = self.evaluate()
+        if stand_pat >= beta:
+            return beta
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        board = self.board
+        captures = [
+            move
+            for move in board.backend.get_legal_captures(
+                board.expected_player, board.board
+            )
+            if move.promotion in (None, PieceType.QUEEN)
+        ]
+        scored = [
+            (self._get_ordering_score(move, None, ply), move) for move in captures
+        ]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        captures = [move for score, move in scored if score >= 0]
+
+        for move in captures:
+            undo = board.make_move(*move)
+            try:
+                score = -self.quiescence(-beta, -alpha, ply + 1)
+            finally:
+                board.unmake_move(undo)
+
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def order_moves(
+        self, moves: List[Move], first_move: Optional[Move], ply: int
+    ) -> List[Move]:
+        """
+        Sort moves so the ones most likely to cause a cutoff are searched first.
+
+        Args:
+            moves (List[Move]): The moves to sort.
+            first_move (Optional[Move]): The move from the transposition table or principal variation, if any.
+            ply (int): The distance from the root.
+
+        Returns:
+            List[Move]: The moves, best first.
+        """
+        return sorted(
+            moves,
+            key=lambda move: self._get_ordering_score(move, first_move, ply),
+            reverse=True,
+        )
+
+    def _get_ordering_score(
+        self, move: Move, first_move: Optional[Move], ply: int
+    ) -> int:
+        """
+        Score a move for move ordering.
+
+        Args:
+            move (Move): The move to score.
+            first_move (Optional[Move]): The move to search first, if any.
+            ply (int): The distance from the root.
+
+        Returns:
+            int: The ordering score, higher is searched first.
+        """
+
+        if move == first_move:
+            return FIRST_MOVE_SCORE
+
+        board = self.board.board
+        if self._is_capture(move):
+            # Most valuable victim, least valuable attacker (en passant captures a pawn)
+            victim = EXCHANGE_VALUES[board[move.target].type] or EXCHANGE_VALUES[
+                PieceType.PAWN
+            ]
+            attacker = EXCHANGE_VALUES[board[move.origin].type]
+            score = victim * 10 - attacker // 10
+            # Only a capture by a more valuable piece can lose material
+            if victim < attacker and Evaluation.static_exchange(board, move) < 0:
+                return LOSING_CAPTURE_SCORE + score
+            return GOOD_CAPTURE_SCORE + score
+
+        if move.promotion == PieceType.QUEEN:
+            return PROMOTION_SCORE
+        if ply < MAX_PLY and move in self._killers[ply]:
+            return KILLER_SCORE
+        (origin_x, origin_y), (target_x, target_y), _ = move
+        return self._history[self.board.expected_player.value][
+            (origin_x * 8 + origin_y) * 64 + target_x * 8 + target_y
+        ]
+
+    def _is_capture(self, move: Move) -> bool:
+        """
+        Check if a move captures a piece, including en passant.
+
+        Args:
+            move (Move): The move to check.
+
+        Returns:
+            bool: True if the move captures, False otherwise.
+        """
+
+        board = self.board.board
+        return board[move.target].type != PieceType.EMPTY or (
+            board[move.origin].type == PieceType.PAWN
+            and move.origin[1] != move.target[1]
+        )
+
+    def _record_quiet_cutoff(self, move: Move, depth: int, ply: int) -> None:
+        """
+        Remember a quiet move that caused a beta cutoff as a killer and in the history.
+
+        Args:
+            move (Move): The move that caused the cutoff.
+            depth (int): The remaining depth of the node.
+            ply (int): The distance from the root.
+        """
+
+        killers = self._killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        (origin_x, origin_y), (target_x, target_y), _ = move
+        self._history[self.board.expected_player.value][
+            (origin_x * 8 + origin_y) * 64 + target_x * 8 + target_y
+        ] += depth * depth
+
+    def _count_node(self) -> None:
+        """
+        Count a searched node and stop the search when a limit is reached.
+
+        Raises:
+            SearchStopped: If the time or node limit is reached.
+        """
+
+        if self.nodes == self._node_limit:
+            raise SearchStopped()
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self._check_time()
+
+    def _get_legal_moves(self) -> List[Move]:
+        """
+        Generate the legal moves of the side to move, without the move cache of the board.
+
+        Returns:
+            List[Move]: The legal moves.
+        """
+        return self.board.generate_legal_moves()
+
+    def _check_time(self) -> None:
+        """
+        Stop the search when its time limit is reached or it is asked to stop.
+
+        Raises:
+            SearchStopped: If the time limit is reached or should_stop returns True.
+        """
+
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchStopped()
+        if self._should_stop is not None and self._should_stop():
+            raise SearchStopped()
+
+    def _make_result(
+        self, pv: List[Move], score: int, depth: int, start: float
+    ) -> SearchResult:
+        """
+        Build the result of an iteration, converting its principal variation to notation.
+
+        Args:
+            pv (List[Move]): The principal variation, best move first.
+            score (int): The score of the iteration.
+            depth (int): The depth of the iteration.
+            start (float): The perf_counter time the search started at.
+
+        Returns:
+            SearchResult: The result of the iteration.
+        """
+
+        notations = []
+        undos = []
+        for move in pv:
+            notations.append(
+                Notation.move_to_notation(self.board.board[move.origin], move)
+            )
+            undos.append(self.board.make_move(*move))
+        for undo in reversed(undos):
+            self.board.unmake_move(undo)
+
+        return SearchResult(
+            best_move=pv[0] if pv else None,
+            notation=notations[0] if notations else None,
+            score=score,
+            depth=depth,
+            nodes=self.nodes,
+            seconds=time.perf_counter() - start,
+            pv=notations,
+            pv_moves=tuple(pv),
+        )
+
+
+def score_to_table(score: int, ply: int) -> int:
+    """
+    Convert a mate score from distance to the root into distance to the node, for storing.
+
+    Args:
+        score (int): The score from the search.
+        ply (int): The distance of the node from the root.
+
+    Returns:
+        int: The score to store in the transposition table.
+    """
+
+    if score > MATE_THRESHOLD:
+        return score + ply
+    if score < -MATE_THRESHOLD:
+        return score - ply
+    return score
+
+
+def score_from_table(score: int, ply: int) -> int:
+    """
+    Convert a stored mate score back into distance to the root.
+
+    Args:
+        score (int): The score stored in the transposition table.
+        ply (int): The distance of the node from the root.
+
+    Returns:
+        int: The score for the search.
+    """
+
+    if score > MATE_THRESHOLD:
+        return score - ply
+    if score < -MATE_THRESHOLD:
+        return score + ply
+    return score
+
+
+def run_bench(
+    depth: int, backend: str = "bitboard", ordering: bool = True
+) -> List[SearchResult]:
+    """
+    Search every benchmark position to a fixed depth with a fresh search.
+
+    Args:
+        depth (int): The depth to search each position to.
+        backend (str): The name of the Board backend to use.
+        ordering (bool): Whether moves are ordered.
+
+    Returns:
+        List[SearchResult]: The result of each position of BENCH_POSITIONS.
+    """
+
+    results = []
+    for fen in BENCH_POSITIONS:
+        board = Board(backend=backend)
+        board.process_fen(fen)
+        search = Search(board, TranspositionTable(size_mb=4), ordering=ordering)
+        results.append(search.search(depth))
+    return results
+
+
+def print_bench(depth: int, backend: str = "bitboard") -> None:
+    """
+    Print the nodes searched on the benchmark positions without and with move ordering in the main search.
+
+    Args:
+        depth (int): The depth to search each position to.
+        backend (str): The name of the Board backend to use.
+    """
+
+    unordered = run_bench(depth, backend, ordering=False)
+    ordered = run_bench(depth, backend, ordering=True)
+    for fen, before, after in zip(BENCH_POSITIONS, unordered, ordered):
+        print(f"{before.nodes:9d} -> {after.nodes:9d} nodes  {fen}")
+
+    total_before = sum(result.nodes for result in unordered)
+    total_after = sum(result.nodes for result in ordered)
+    seconds = sum(result.seconds for result in ordered)
+    print(
+        f"total: {total_before} -> {total_after} nodes "
+        f"({1 - total_after / total_before:.1%} fewer), "
+        f"{total_after / seconds:.0f} nps ordered"
+    )
+
+
+def print_iteration(result: SearchResult) -> None:
+    """
+    Print the statistics and principal variation of a completed iteration.
+
+    Args:
+        result (SearchResult): The result of the iteration.
+    """
+
+    print(
+        f"depth {result.depth:2d}  score {result.score:6d}  nodes {result.nodes:9d}  "
+        f"{result.seconds:7.3f}s  {result.nodes_per_second:8.0f} nps  "
+        f"pv {' '.join(result.pv)}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search a position for the best move.")
+    parser.add_argument(
+        "--fen",
+        default=STARTING_FEN,
+        help="position to search (defaults to the starting position)",
+    )
+    parser.add_argument("--depth", type=int, default=4, help="maximum depth in plies")
+    parser.add_argument("--time", type=float, help="maximum time in seconds")
+    parser.add_argument("--nodes", type=int, help="maximum number of nodes")
+    parser.add_argument(
+        "--backend", choices=sorted(BACKEND_MAP), default="bitboard"
+    )
+    parser.add_argument(
+        "--hash", type=float, default=16, help="transposition table size in MB"
+    )
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="compare node counts without and with move ordering on fixed positions",
+    )
+    args = parser.parse_args()
+
+    if args.bench:
+        print_bench(args.depth, args.backend)
+        sys.exit(0)
+
+    board = Board(backend=args.backend)
+    board.process_fen(args.fen)
+    search = Search(board, TranspositionTable(args.hash))
+    result = search.search(args.depth, args.time, args.nodes, print_iteration)
+    print(
+        f"bestmove {result.notation}  {result.nodes} nodes  "
+        f"{result.nodes_per_second:.0f} nps  "
+        f"table hit rate {search.table.hit_rate:.1%}"
+    )
@@ -0,0 +1,513 @@
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from concurrent.futures import Executor
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from board import Board, BACKEND_MAP, STARTING_FEN
+from notation import Notation, InvalidNotation
+from pieces import Color, PieceType
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Moves of each session board kept in its move cache, enough for the move and the replies after it
+SESSION_MOVE_CACHE_SIZE = 16
+FIFTY_MOVE_PLIES = 100
+
+UCI_RE = re.compile(r"^[a-h][1-8][a-h][1-8][qrbn]?$")
+
+T = TypeVar("T")
+
+
+class GameSession:
+    """
+    A game hosted by the server.
+
+    Attributes:
+        board (Board): The position of the game.
+        result (str): The game termination marker, "*" while the game is in progress.
+        termination (Optional[str]): How the game ended, "checkmate", "stalemate" or "fifty-move rule".
+        lock (asyncio.Lock): Held while the board is used in the executor, so moves of one game run one at a time.
+    """
+
+    def __init__(self, fen: str, backend: str) -> None:
+        """
+        Initialize the GameSession object.
+
+        Args:
+            fen (str): The starting position of the game.
+            backend (str): The name of the Board backend.
+
+        Raises:
+            ValueError: If the FEN is not valid or does not have exactly one king of each color.
+        """
+
+        self.board = Board(backend=backend, move_cache_size=SESSION_MOVE_CACHE_SIZE)
+        self.result = "*"
+        self.termination: Optional[str] = None
+        self.lock = asyncio.Lock()
+        try:
+            self.board.process_fen(fen)
+        except (KeyError, IndexError, ValueError) as error:
+            raise ValueError(f"invalid FEN {fen!r}") from error
+        kings = [
+            piece.color for piece in self.board.board.values() if piece.type == PieceType.KING
+        ]
+        if kings.count(Color.WHITE) != 1 or kings.count(Color.BLACK) != 1:
+            raise ValueError(f"invalid FEN {fen!r}: each side needs exactly one king")
+        self.update_result()
+
+    def update_result(self) -> None:
+        """Set the result and termination from the position."""
+
+        board = self.board
+        if not board.get_legal_moves():
+            if board.is_king_in_check(board.expected_player):
+                self.result = "0-1" if board.expected_player == Color.WHITE else "1-0"
+                self.termination = "checkmate"
+            else:
+                self.result, self.termination = "1/2-1/2", "stalemate"
+        elif board.halfmove_clock >= FIFTY_MOVE_PLIES:
+            self.result, self.termination = "1/2-1/2", "fifty-move rule"
+
+    def state(self) -> Dict[str, object]:
+        """
+        Describe the position and the moves that can be played.
+
+        Returns:
+            Dict[str, object]: The FEN, the side to move, the result and the legal moves in UCI notation.
+        """
+
+        board = self.board
+        legal_moves = board.get_legal_moves() if self.result == "*" else []
+        return {
+            "fen": board.to_fen(),
+            "turn": "white" if board.expected_player == Color.WHITE else "black",
+            "check": board.is_king_in_check(board.expected_player),
+            "result": self.result,
+            "termination": self.termination,
+            "legal": [Notation.move_to_uci(move) for move in legal_moves],
+        }
+
+    def play(self, notation: str) -> Dict[str, object]:
+        """
+        Play a move given in UCI notation or SAN.
+
+        Runs in the executor, as generating the legal moves is the CPU-heavy part of a request.
+
+        Args:
+            notation (str): The move, such as "e2e4", "e7e8q", "Nf3" or "O-O".
+
+        Returns:
+            Dict[str, object]: The move in UCI notation and SAN followed by the new state.
+
+        Raises:
+            InvalidNotation: If the game is over or the move is not legal.
+        """
+
+        if self.result != "*":
+            raise InvalidNotation(notation, f"the game is over ({self.result})")
+        board = self.board
+        if UCI_RE.match(notation):
+            move = Notation.uci_to_move(notation, board.get_legal_moves())
+        else:
+            move = board.san_to_move(notation)
+        san = board.move_to_san(move)
+        board.make_move(*move)
+        self.update_result()
+        return {"move": Notation.move_to_uci(move), "san": san, **self.state()}
+
+
+class GameServer:
+    """
+    Server hosting many games over a line-based JSON protocol.
+
+    Each request is a JSON object on one line with an "op" field, and is answered with one
+    JSON object line holding "ok" and either the result or an "error". An "id" field in the
+    request is copied to the response. The requests of one connection are answered in order,
+    while connections are served concurrently.
+
+    Operations:
+        {"op": "new", "fen": <optional FEN>}: Start a game, answered with its "game" number and state.
+        {"op": "move", "game": <number>, "move": <UCI or SAN>}: Play a move, answered with the new state.
+        {"op": "state", "game": <number>}: Get the state of a game.
+        {"op": "close", "game": <number>}: Forget a game.
+
+    Setting up a game and move validation run in an executor, the default thread pool of
+    the loop unless one is given, so a position with many moves to generate does not hold
+    up the other games. A request that fails for any reason is answered with an error, and
+    the connection stays open.
+
+    Attributes:
+        games (Dict[int, GameSession]): The games in progress, by number.
+        backend (str): The name of the Board backend of new games.
+        executor (Optional[Executor]): The executor move validation runs in, None for the loop default.
+    """
+
+    def __init__(self, backend: str = "bitboard", executor: Optional[Executor] = None) -> None:
+        """
+        Initialize the GameServer object.
+
+        Args:
+            backend (str): The name of the Board backend of new games (defaults to "bitboard").
+            executor (Optional[Executor]): The executor move validation runs in (defaults to the loop default).
+        """
+
+        self.games: Dict[int, GameSession] = {}
+        self.backend = backend
+        self.executor = executor
+        self._next_game = 1
+        self.operations: Dict[str, Callable[[dict], Awaitable[Dict[str, object]]]] = {
+            "new": self.new_game,
+            "move": self.move,
+            "state": self.state,
+            "close": self.close_game,
+        }
+
+    async def new_game(self, request: dict) -> Dict[str, object]:
+        """Start a game from the starting position or the given FEN."""
+
+        fen = request.get("fen", STARTING_FEN)
+        if not isinstance(fen, str):
+            raise ValueError("fen is not a string")
+        session = await self._run(GameSession, fen, self.backend)
+        game = self._next_game
+        self._next_game += 1
+        self.games[game] = session
+        return {"game": game, **await self._run(session.state)}
+
+    async def move(self, request: dict) -> Dict[str, object]:
+        """Play a move in a game."""
+
+        session = self._get_session(request)
+        notation = request.get("move")
+        if not isinstance(notation, str):
+            raise ValueError("missing move")
+        async with session.lock:
+            return await self._run(session.play, notation)
+
+    async def state(self, request: dict) -> Dict[str, object]:
+        """Get the state of a game."""
+
+        session = self._get_session(request)
+        async with session.lock:
+            return await self._run(session.state)
+
+    async def close_game(self, request: dict) -> Dict[str, object]:
+        """Forget a game."""
+
+        self._get_session(request)
+        del self.games[request["game"]]
+        return {}
+
+    async def _run(self, function: Callable[..., T], *args) -> T:
+        """
+        Run CPU-heavy work in the executor, so the loop keeps serving other connections.
+
+        Args:
+            function (Callable[..., T]): The function to call.
+            *args: The arguments of the call.
+
+        Returns:
+            T: The return value of the call.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, function, *args
+        )
+
+    async def handle_request(self, line: bytes) -> Dict[str, object]:
+        """
+        Answer one request line.
+
+        Args:
+            line (bytes): The JSON request.
+
+        Returns:
+            Dict[str, object]: The response, with "ok" false and an "error" if the request failed.
+        """
+
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("request is not an object")
+        except ValueError as error:
+            return {"ok": False, "error": f"invalid request: {error}"}
+
+        try:
+            op = request.get("op")
+            operation = self.operations.get(op) if isinstance(op, str) else None
+            if operation is None:
+                raise ValueError(f"unknown op {op!r}")
+            response = {"ok": True, **await operation(request)}
+        except ValueError as error:
+            # InvalidNotation is a ValueError, its message names the move and the reason
+            response = {"ok": False, "error": str(error)}
+        except Exception as error:
+            # Any other failure is the server's, it is reported so the connection stays usable
+            response = {"ok": False, "error": f"internal error: {type(error).__name__}: {error}"}
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """
+        Answer the requests of one connection until it is closed.
+
+        Args:
+            reader (asyncio.StreamReader): The stream the requests are read from.
+            writer (asyncio.StreamWriter): The stream the responses are written to.
+        """
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                response = await self.handle_request(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _get_session(self, request: dict) -> GameSession:
+        """
+        Get the game a request refers to.
+
+        Args:
+            request (dict): The request, with the game number in "game".
+
+        Returns:
+            GameSession: The game.
+
+        Raises:
+            ValueError: If the game number is missing, not an integer or there is no such game.
+        """
+
+        game = request.get("game")
+        if not isinstance(game, int) or isinstance(game, bool):
+            raise ValueError(f"game must be an integer, not {game!r}")
+        session = self.games.get(game)
+        if session is None:
+            raise ValueError(f"unknown game {request.get('game')!r}")
+        return session
+
+
+async def start_server(
+    server: GameServer,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+) -> asyncio.AbstractServer:
+    """
+    Start listening for connections on a TCP port or a Unix socket.
+
+    Args:
+        server (GameServer): The server answering the requests.
+        host (str): The TCP host (defaults to DEFAULT_HOST).
+        port (int): The TCP port, 0 for any free port (defaults to DEFAULT_PORT).
+        unix_path (Optional[str]): The path of a Unix socket to listen on instead of TCP, if any.
+
+    Returns:
+        asyncio.AbstractServer: The listening server.
+    """
+
+    if unix_path is not None:
+        return await asyncio.start_unix_server(server.handle_connection, unix_path)
+    return await asyncio.start_server(server.handle_connection, host, port)
+
+
+class LoadTestStats(NamedTuple):
+    """
+    The outcome of a load test.
+
+    Attributes:
+        games (int): The number of games played.
+        moves (int): The number of moves played.
+        errors (int): The number of requests answered with an error.
+        seconds (float): The time the load test took.
+        latencies (List[float]): The round trip time of each move request in seconds.
+    """
+
+    games: int
+    moves: int
+    errors: int
+    seconds: float
+    latencies: List[float]
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Get a move latency percentile, by the nearest rank.
+
+        Args:
+            fraction (float): The percentile as a fraction, such as 0.99.
+
+        Returns:
+            float: The latency in seconds, 0 if no move was played.
+        """
+
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    @property
+    def moves_per_second(self) -> float:
+        """
+        Get the move throughput.
+
+        Returns:
+            float: The number of moves played per second.
+        """
+        return self.moves / self.seconds if self.seconds > 0 else float("inf")
+
+
+async def _play_random_game(
+    connect: Callable[[], Awaitable[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]],
+    plies: int,
+    seed: int,
+    latencies: List[float],
+) -> Tuple[int, int]:
+    """
+    Play one game of random legal moves over its own connection.
+
+    Args:
+        connect (Callable[[], Awaitable[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]]): Opens a connection to the server.
+        plies (int): The maximum number of moves to play.
+        seed (int): The seed of the move choices.
+        latencies (List[float]): The list the round trip time of each move is appended to.
+
+    Returns:
+        Tuple[int, int]: The number of moves played and of errors.
+    """
+
+    reader, writer = await connect()
+    rng = random.Random(seed)
+
+    async def request(message: dict) -> dict:
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    moves, errors = 0, 0
+    try:
+        state = await request({"op": "new"})
+        game = state["game"]
+        while moves < plies and state.get("legal"):
+            start = time.perf_counter()
+            response = await request(
+                {"op": "move", "game": game, "move": rng.choice(state["legal"])}
+            )
+            latencies.append(time.perf_counter() - start)
+            if not response["ok"]:
+                errors += 1
+                break
+            state = response
+            moves += 1
+        await request({"op": "close", "game": game})
+    finally:
+        writer.close()
+    return moves, errors
+
+
+async def load_test(
+    games: int = 100,
+    plies: int = 60,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    unix_path: Optional[str] = None,
+    seed: int = 0,
+) -> LoadTestStats:
+    """
+    Play many games of random legal moves against a running server at once, timing every move.
+
+    Args:
+        games (int): The number of games played at the same time, each over its own connection (defaults to 100).
+        plies (int): The maximum number of moves of each game (defaults to 60).
+        host (str): The TCP host of the server (defaults to DEFAULT_HOST).
+        port (int): The TCP port of the server (defaults to DEFAULT_PORT).
+        unix_path (Optional[str]): The path of the Unix socket of the server instead of TCP, if any.
+        seed (int): The seed of the move choices (defaults to 0).
+
+    Returns:
+        LoadTestStats: The moves played, the errors and the latency of every move.
+    """
+
+    def connect():
+        if unix_path is not None:
+            return asyncio.open_unix_connection(unix_path)
+        return asyncio.open_connection(host, port)
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(_play_random_game(connect, plies, seed + game, latencies) for game in range(games))
+    )
+    return LoadTestStats(
+        games=games,
+        moves=sum(moves for moves, _ in outcomes),
+        errors=sum(errors for _, errors in outcomes),
+        seconds=time.perf_counter() - start,
+        latencies=latencies,
+    )
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the server, or a load test against it, from the command line arguments."""
+
+    if args.load_test and args.connect:
+        stats = await load_test(args.games, args.plies, args.host, args.port, args.unix)
+    else:
+        listener = await start_server(
+            GameServer(args.backend),
+            args.host,
+            0 if args.load_test else args.port,
+            args.unix,
+        )
+        if not args.load_test:
+            print(f"serving on {', '.join(str(s.getsockname()) for s in listener.sockets)}")
+            async with listener:
+                await listener.serve_forever()
+            return
+        async with listener:
+            port = listener.sockets[0].getsockname()[1] if args.unix is None else 0
+            stats = await load_test(args.games, args.plies, args.host, port, args.unix)
+
+    print(
+        f"{stats.games} games  {stats.moves} moves  {stats.errors} errors  "
+        f"{stats.seconds:.3f}s  {stats.moves_per_second:.0f} moves/s  "
+        f"p50 {stats.percentile(0.5) * 1000:.2f}ms  p99 {stats.percentile(0.99) * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Host many games over a JSON lines protocol, or load test the server."
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="Unix socket path to use instead of TCP")
+    parser.add_argument(
+        "--backend", choices=sorted(BACKEND_MAP), default="bitboard"
+    )
+    parser.add_argument(
+        "--load-test",
+        action="store_true",
+        help="play random games against an in-process server and report the move latency",
+    )
+    parser.add_argument(
+        "--connect",
+        action="store_true",
+        help="with --load-test, use the server already running at --host/--port or --unix",
+    )
+    parser.add_argument("--games", type=int, default=100, help="concurrent games of the load test")
+    parser.add_argument("--plies", type=int, default=60, help="maximum moves of each load test game")
+    args = parser.parse_args()
+
+    asyncio.run(_serve(args))
@@ -0,0 +1,273 @@
+from array import array
+from multiprocessing import shared_memory
+from typing import List, NamedTuple, Optional
+from moves import Move, PROMOTION_TYPES
+
+# Bound types of a stored score
+EXACT, LOWER_BOUND, UPPER_BOUND = range(3)
+
+# Bytes used by one entry, a 64-bit key and 64 bits of packed data
+ENTRY_SIZE = 16
+# Entries sharing one index, the first is depth-preferred and the second always replaced
+BUCKET_SIZE = 2
+
+# Layout of the packed data: move (16 bits), bound (2 bits), depth (8 bits), score (18 bits)
+MOVE_BITS, BOUND_BITS, DEPTH_BITS = 16, 2, 8
+BOUND_SHIFT = MOVE_BITS
+DEPTH_SHIFT = BOUND_SHIFT + BOUND_BITS
+SCORE_SHIFT = DEPTH_SHIFT + DEPTH_BITS
+# Scores are stored with this offset so they are never negative and an entry is never 0
+SCORE_OFFSET = 1 << 17
+
+
+class TableEntry(NamedTuple):
+    """
+    A position stored in the transposition table.
+
+    Attributes:
+        depth (int): The depth the position was searched to.
+        score (int): The score found by the search.
+        bound (int): Whether the score is EXACT, a LOWER_BOUND or an UPPER_BOUND.
+        move (Optional[Move]): The best move found, if any.
+    """
+
+    depth: int
+    score: int
+    bound: int
+    move: Optional[Move]
+
+
+def encode_move(move: Optional[Move]) -> int:
+    """
+    Pack a move into 16 bits.
+
+    Bit 15 marks that a move is present, followed by the origin and target square
+    indexes (6 bits each) and the promotion (3 bits, 0 for none).
+
+    Args:
+        move (Optional[Move]): The move to pack.
+
+    Returns:
+        int: The packed move, 0 for no move.
+    """
+
+    if move is None:
+        return 0
+    (origin_x, origin_y), (target_x, target_y), promotion = move
+    promotion_code = 0 if promotion is None else PROMOTION_TYPES.index(promotion) + 1
+    return (
+        1 << 15
+        | (origin_x * 8 + origin_y) << 9
+        | (target_x * 8 + target_y) << 3
+        | promotion_code
+    )
+
+
+def decode_move(code: int) -> Optional[Move]:
+    """
+    Unpack a move packed by encode_move.
+
+    Args:
+        code (int): The packed move.
+
+    Returns:
+        Optional[Move]: The move, None if no move was packed.
+    """
+
+    if not code:
+        return None
+    promotion_code = code & 7
+    return Move(
+        divmod(code >> 9 & 63, 8),
+        divmod(code >> 3 & 63, 8),
+        PROMOTION_TYPES[promotion_code - 1] if promotion_code else None,
+    )
+
+
+class TranspositionTable:
+    """
+    Fixed-size table of searched positions keyed by their 64-bit Zobrist key.
+
+    Entries are stored in two preallocated arrays of 64-bit integers, one for the keys and
+    one for the packed depth, score, bound and move, instead of a dictionary of objects.
+    A key selects a bucket of two entries: the first keeps the deepest search and the second
+    takes every other store.
+
+    The key of an entry is stored XORed with its data, so an entry is only found when both
+    words belong to the same store. This lets processes sharing the table write without
+    locks, an entry torn by two writers reads as a miss.
+
+    Attributes:
+        size (int): The number of buckets in the table.
+        keys (array): The key of each entry XORed with its data.
+        data (array): The packed depth, score, bound and move of each entry, 0 for an empty entry.
+        probes (int): The number of lookups.
+        hits (int): The number of lookups that found the position.
+        stores (int): The number of entries written.
+    """
+
+    def __init__(self, size_mb: float = 16) -> None:
+        """
+        Initialize the TranspositionTable object.
+
+        Args:
+            size_mb (float): The memory used by the entries in megabytes (defaults to 16).
+        """
+
+        self.size = max(1, int(size_mb * (1 << 20)) // (ENTRY_SIZE * BUCKET_SIZE))
+        self.keys = array("Q", [0]) * (self.size * BUCKET_SIZE)
+        self.data = array("Q", [0]) * (self.size * BUCKET_SIZE)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def probe(self, key: int) -> Optional[TableEntry]:
+        """
+        Look up a position.
+
+        Args:
+            key (int): The Zobrist key of the position.
+
+        Returns:
+            Optional[TableEntry]: The stored entry, or None if the position is not in the table.
+        """
+
+        self.probes += 1
+        index = key % self.size * BUCKET_SIZE
+        for slot in range(index, index + BUCKET_SIZE):
+            data = self.data[slot]
+            if data and self.keys[slot] ^ data == key:
+                self.hits += 1
+                return TableEntry(
+                    depth=data >> DEPTH_SHIFT & (1 << DEPTH_BITS) - 1,
+                    score=(data >> SCORE_SHIFT) - SCORE_OFFSET,
+                    bound=data >> BOUND_SHIFT & (1 << BOUND_BITS) - 1,
+                    move=decode_move(data & (1 << MOVE_BITS) - 1),
+                )
+        return None
+
+    def store(
+        self, key: int, depth: int, score: int, bound: int, move: Optional[Move]
+    ) -> None:
+        """
+        Store the result of searching a position.
+
+        The depth-preferred entry is replaced when it holds the same position or a search
+        that is not deeper, otherwise the result goes to the always-replace entry.
+
+        Args:
+            key (int): The Zobrist key of the position.
+            depth (int): The depth the position was searched to.
+            score (int): The score found by the search.
+            bound (int): Whether the score is EXACT, a LOWER_BOUND or an UPPER_BOUND.
+            move (Optional[Move]): The best move found, if any.
+        """
+
+        self.stores += 1
+        index = key % self.size * BUCKET_SIZE
+        preferred = self.data[index]
+        if (
+            not preferred
+            or self.keys[index] ^ preferred == key
+            or depth >= preferred >> DEPTH_SHIFT & (1 << DEPTH_BITS) - 1
+        ):
+            slot = index
+        else:
+            slot = index + 1
+
+        data = (
+            score + SCORE_OFFSET << SCORE_SHIFT
+            | min(depth, (1 << DEPTH_BITS) - 1) << DEPTH_SHIFT
+            | bound << BOUND_SHIFT
+            | encode_move(move)
+        )
+        self.keys[slot] = key ^ data
+        self.data[slot] = data
+
+    def clear(self) -> None:
+        """Empty every entry and reset the statistics."""
+
+        self.keys = array("Q", [0]) * len(self.keys)
+        self.data = array("Q", [0]) * len(self.data)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Get the share of lookups that found the position.
+
+        Returns:
+            float: The number of hits divided by the number of probes, 0 without probes.
+        """
+        return self.hits / self.probes if self.probes else 0.0
+
+    def usage(self, sample: int = 1000) -> float:
+        """
+        Estimate the share of filled entries from the first entries of the table.
+
+        Args:
+            sample (int): The number of entries to look at (defaults to 1000).
+
+        Returns:
+            float: The share of the sampled entries that are filled.
+        """
+
+        entries: List[int] = self.data[:sample].tolist()
+        return sum(1 for data in entries if data) / len(entries)
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """
+    Transposition table whose entries live in shared memory, for searches in several processes.
+
+    The process that creates the table owns the shared memory block, other processes attach
+    to it by name. Every process keeps its own probe, hit and store counters.
+
+    Attributes:
+        name (str): The name of the shared memory block, used to attach to the table.
+        owner (bool): Whether this process created the block and unlinks it on close.
+    """
+
+    def __init__(self, size_mb: float = 16, name: Optional[str] = None) -> None:
+        """
+        Initialize the SharedTranspositionTable object.
+
+        Args:
+            size_mb (float): The memory used by the entries in megabytes, the same in every process (defaults to 16).
+            name (Optional[str]): The name of the block to attach to, None to create a new one.
+        """
+
+        self.size = max(1, int(size_mb * (1 << 20)) // (ENTRY_SIZE * BUCKET_SIZE))
+        entries = self.size * BUCKET_SIZE
+        self.owner = name is None
+        self._memory = shared_memory.SharedMemory(
+            name=name, create=self.owner, size=entries * ENTRY_SIZE
+        )
+        self.name = self._memory.name
+        # A new block is zero filled, which is an empty table
+        self.keys = self._memory.buf[: entries * 8].cast("Q")
+        self.data = self._memory.buf[entries * 8:entries * ENTRY_SIZE].cast("Q")
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def clear(self) -> None:
+        """Empty every entry, in every attached process, and reset the statistics."""
+
+        self._memory.buf[: len(self.keys) * ENTRY_SIZE] = bytes(
+            len(self.keys) * ENTRY_SIZE
+        )
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def close(self) -> None:
+        """Detach from the shared memory block, and free it if this process created it."""
+
+        self.keys.release()
+        self.data.release()
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
@@ -0,0 +1,316 @@
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, TextIO
+
+from board import Board, STARTING_FEN
+from pieces import Color
+from notation import Notation, InvalidNotation
+from search import Search, SearchResult, MATE_SCORE, MATE_THRESHOLD
+from transposition import TranspositionTable
+
+ENGINE_NAME = "Terminal chess"
+ENGINE_AUTHOR = "ditdotz"
+
+DEFAULT_HASH_MB = 16
+MAX_HASH_MB = 1024
+# Share of the remaining clock spent on one move when no move time is given
+MOVES_TO_GO = 30
+# Time kept back for the protocol overhead of each move, in seconds
+MOVE_OVERHEAD = 0.05
+
+
+def format_score(score: int) -> str:
+    """
+    Write a search score as the score field of a UCI info line.
+
+    Args:
+        score (int): The score in centipawns, from the side to move.
+
+    Returns:
+        str: "cp <centipawns>", or "mate <moves>" for a forced mate, negative when the side to move is mated.
+    """
+
+    if abs(score) < MATE_THRESHOLD:
+        return f"cp {score}"
+    plies = MATE_SCORE - abs(score)
+    moves = (plies + 1) // 2
+    return f"mate {moves if score > 0 else -moves}"
+
+
+class UciEngine:
+    """
+    Engine speaking the Universal Chess Interface (UCI) protocol over text lines.
+
+    Commands are handled as they arrive. A search runs in its own thread, so "stop",
+    "isready" and "quit" are answered while it runs, and "stop" ends it through the
+    should_stop hook of the search.
+
+    Attributes:
+        board (Board): The position set by the last "position" command.
+        table (TranspositionTable): The transposition table, kept between searches.
+        output (TextIO): The stream the responses are written to.
+        commands (Dict[str, Callable[[List[str]], None]]): The handler of each command, by name.
+    """
+
+    def __init__(self, output: TextIO = sys.stdout, backend: str = "bitboard") -> None:
+        """
+        Initialize the UciEngine object.
+
+        Args:
+            output (TextIO): The stream the responses are written to (defaults to stdout).
+            backend (str): The name of the Board backend to search with (defaults to "bitboard").
+        """
+
+        self.board = Board(backend=backend)
+        self.board.process_fen(STARTING_FEN)
+        self.table = TranspositionTable(DEFAULT_HASH_MB)
+        self.output = output
+        self.commands: Dict[str, Callable[[List[str]], None]] = {
+            "uci": self.uci,
+            "isready": self.isready,
+            "setoption": self.setoption,
+            "ucinewgame": self.ucinewgame,
+            "position": self.position,
+            "go": self.go,
+            "stop": self.stop,
+        }
+        self._output_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._search_thread: Optional[threading.Thread] = None
+
+    def send(self, line: str) -> None:
+        """
+        Write one response line and flush it, from any thread.
+
+        Args:
+            line (str): The line to write.
+        """
+
+        with self._output_lock:
+            self.output.write(line + "\n")
+            self.output.flush()
+
+    def handle(self, line: str) -> bool:
+        """
+        Handle one command line.
+
+        Args:
+            line (str): The command and its arguments.
+
+        Returns:
+            bool: False once the "quit" command was received, True otherwise.
+        """
+
+        tokens = line.split()
+        if not tokens:
+            return True
+        if tokens[0] == "quit":
+            self.stop([])
+            return False
+
+        handler = self.commands.get(tokens[0])
+        if handler is None:
+            self.send(f"info string unknown command {tokens[0]}")
+        else:
+            handler(tokens[1:])
+        return True
+
+    def uci(self, arguments: List[str]) -> None:
+        """Identify the engine and its options."""
+
+        self.send(f"id name {ENGINE_NAME}")
+        self.send(f"id author {ENGINE_AUTHOR}")
+        self.send(
+            f"option name Hash type spin default {DEFAULT_HASH_MB} min 1 max {MAX_HASH_MB}"
+        )
+        self.send("uciok")
+
+    def isready(self, arguments: List[str]) -> None:
+        """Answer that the engine is ready, also while searching."""
+
+        self.send("readyok")
+
+    def setoption(self, arguments: List[str]) -> None:
+        """
+        Set an option, given as "name <name> value <value>".
+
+        Args:
+            arguments (List[str]): The words after the command.
+        """
+
+        text = " ".join(arguments)
+        name, _, value = text.partition(" value ")
+        name = name.removeprefix("name ").strip()
+        if name.lower() == "hash" and value.strip().isdigit():
+            self._stop_search()
+            self.table = TranspositionTable(
+                min(max(int(value), 1), MAX_HASH_MB)
+            )
+        else:
+            self.send(f"info string unknown option {name}")
+
+    def ucinewgame(self, arguments: List[str]) -> None:
+        """Forget the searched positions of the previous game."""
+
+        self._stop_search()
+        self.table.clear()
+
+    def position(self, arguments: List[str]) -> None:
+        """
+        Set the position, given as "startpos" or "fen <fen>", optionally followed by "moves <moves>".
+
+        Args:
+            arguments (List[str]): The words after the command.
+        """
+
+        self._stop_search()
+        if "moves" in arguments:
+            split = arguments.index("moves")
+            setup, moves = arguments[:split], arguments[split + 1:]
+        else:
+            setup, moves = arguments, []
+
+        fen = " ".join(setup[1:]) if setup[:1] == ["fen"] else STARTING_FEN
+        try:
+            self.board.process_fen(fen)
+        except ValueError:
+            self.send(f"info string invalid fen {fen}")
+            self.board.process_fen(STARTING_FEN)
+            return
+
+        for uci in moves:
+            try:
+                move = Notation.uci_to_move(uci, self.board.get_legal_moves())
+            except InvalidNotation:
+                self.send(f"info string illegal move {uci}")
+                return
+            self.board.make_move(*move)
+
+    def go(self, arguments: List[str]) -> None:
+        """
+        Start searching the position in a background thread.
+
+        Understands "depth", "nodes", "movetime", "infinite" and the clock parameters
+        "wtime", "btime", "winc", "binc" and "movestogo".
+
+        Args:
+            arguments (List[str]): The words after the command.
+        """
+
+        self._stop_search()
+        parameters: Dict[str, int] = {}
+        for name, value in zip(arguments, arguments[1:]):
+            if value.lstrip("-").isdigit():
+                parameters[name] = int(value)
+        infinite = "infinite" in arguments
+
+        time_limit = None
+        if "movetime" in parameters:
+            time_limit = parameters["movetime"] / 1000
+        elif not infinite:
+            side = "w" if self.board.expected_player == Color.WHITE else "b"
+            if f"{side}time" in parameters:
+                remaining = parameters[f"{side}time"] / 1000
+                increment = parameters.get(f"{side}inc", 0) / 1000
+                moves_to_go = parameters.get("movestogo", MOVES_TO_GO)
+                time_limit = max(
+                    0.01,
+                    min(
+                        remaining / moves_to_go + increment / 2,
+                        remaining - MOVE_OVERHEAD,
+                    ),
+                )
+
+        self._stop_event.clear()
+        self._search_thread = threading.Thread(
+            target=self._search,
+            args=(parameters.get("depth", 64), time_limit, parameters.get("nodes"), infinite),
+            daemon=True,
+        )
+        self._search_thread.start()
+
+    def stop(self, arguments: List[str]) -> None:
+        """Stop the running search, which then reports its best move."""
+
+        self._stop_search()
+
+    def _stop_search(self) -> None:
+        """
+        Stop the running search, if any, and wait until it has reported its best move.
+
+        Commands that change the position, table or options stop the search first, as an
+        infinite search would otherwise wait for "stop" forever.
+        """
+
+        if self._search_thread is not None:
+            self._stop_event.set()
+            self._search_thread.join()
+            self._search_thread = None
+
+    def _search(
+        self,
+        depth: int,
+        time_limit: Optional[float],
+        node_limit: Optional[int],
+        infinite: bool,
+    ) -> None:
+        """
+        Search the position and report each iteration and the best move.
+
+        Args:
+            depth (int): The maximum depth in plies.
+            time_limit (Optional[float]): The maximum time in seconds, if any.
+            node_limit (Optional[int]): The maximum number of nodes, if any.
+            infinite (bool): Whether the best move waits for "stop", even when the search ends earlier.
+        """
+
+        result = Search(self.board, self.table).search(
+            depth,
+            time_limit=time_limit,
+            node_limit=node_limit,
+            on_iteration=self._send_info,
+            should_stop=self._stop_event.is_set,
+        )
+        if infinite:
+            self._stop_event.wait()
+
+        if result.best_move is None:
+            self.send("bestmove 0000")
+        else:
+            self.send(f"bestmove {Notation.move_to_uci(result.best_move)}")
+
+    def _send_info(self, result: SearchResult) -> None:
+        """
+        Report a completed iteration.
+
+        Args:
+            result (SearchResult): The result of the iteration.
+        """
+
+        milliseconds = int(result.seconds * 1000)
+        nodes_per_second = int(result.nodes / result.seconds) if result.seconds > 0 else 0
+        pv = " ".join(Notation.move_to_uci(move) for move in result.pv_moves)
+        self.send(
+            f"info depth {result.depth} score {format_score(result.score)} "
+            f"nodes {result.nodes} nps {nodes_per_second} time {milliseconds} pv {pv}"
+        )
+
+
+def run(input_stream: TextIO = sys.stdin, output: TextIO = sys.stdout) -> None:
+    """
+    Read UCI commands line by line until "quit" or the end of the input.
+
+    Args:
+        input_stream (TextIO): The stream the commands are read from (defaults to stdin).
+        output (TextIO): The stream the responses are written to (defaults to stdout).
+    """
+
+    engine = UciEngine(output)
+    for line in input_stream:
+        if not engine.handle(line):
+            return
+    engine.stop([])
+
+
+if __name__ == "__main__":
+    run()
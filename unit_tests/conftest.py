@@ -0,0 +1,19 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+
+
+@pytest.fixture
+def make_board():
+    """Build a Board from a FEN string, searched with the bitboard backend unless another is given."""
+
+    def make(fen: str, backend: str = "bitboard") -> Board:
+        board = Board(backend=backend)
+        board.process_fen(fen)
+        return board
+
+    return make
@@ -0,0 +1,77 @@
+import os
+import sys
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from attack_tables import (
+    square_index,
+    KNIGHT_TARGETS,
+    KING_TARGETS,
+    PAWN_CAPTURE_TARGETS,
+    KNIGHT_ATTACKS,
+    PAWN_ATTACKS,
+    RAYS,
+    ROOK_DIRECTIONS,
+    BISHOP_DIRECTIONS,
+    rook_attacks,
+    bishop_attacks,
+)
+from pieces import Color
+
+
+def test_knight_targets_in_corner():
+    assert KNIGHT_TARGETS[square_index(7, 0)] == [(5, 1), (6, 2)]
+    assert KNIGHT_ATTACKS[square_index(7, 0)] == (1 << square_index(5, 1)) | (
+        1 << square_index(6, 2)
+    )
+
+
+def test_knight_targets_in_center():
+    assert len(KNIGHT_TARGETS[square_index(4, 4)]) == 8
+
+
+def test_king_targets_keep_direction_order():
+    assert KING_TARGETS[square_index(0, 0)] == [(0, 1), (1, 0), (1, 1)]
+    assert len(KING_TARGETS[square_index(3, 3)]) == 8
+
+
+def test_pawn_capture_targets_by_color():
+    assert PAWN_CAPTURE_TARGETS[Color.WHITE.value][square_index(6, 4)] == [
+        (5, 3),
+        (5, 5),
+    ]
+    assert PAWN_CAPTURE_TARGETS[Color.BLACK.value][square_index(1, 0)] == [(2, 1)]
+    assert PAWN_ATTACKS[Color.WHITE.value][square_index(0, 3)] == 0
+
+
+def walk_rays(square, occupied, directions):
+    attacks = 0
+    for direction in directions:
+        for x, y in RAYS[direction][square]:
+            attacks |= 1 << square_index(x, y)
+            if occupied & (1 << square_index(x, y)):
+                break
+    return attacks
+
+
+def test_rays_nearest_first():
+    assert RAYS[(-1, 0)][square_index(2, 5)] == [(1, 5), (0, 5)]
+    assert RAYS[(1, 1)][square_index(7, 7)] == []
+
+
+def test_rook_attacks_empty_board():
+    assert bin(rook_attacks(square_index(7, 0), 0)).count("1") == 14
+
+
+def test_slider_lookup_matches_ray_walk():
+    random_generator = random.Random(7)
+    for _ in range(200):
+        occupied = random_generator.getrandbits(64) & random_generator.getrandbits(64)
+        square = random_generator.randrange(64)
+        assert rook_attacks(square, occupied) == walk_rays(
+            square, occupied, ROOK_DIRECTIONS
+        )
+        assert bishop_attacks(square, occupied) == walk_rays(
+            square, occupied, BISHOP_DIRECTIONS
+        )
@@ -0,0 +1,180 @@
+import pytest
+import random
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from pieces import Color, PieceType
+from bitboard import BitboardBackend, square_index, iterate_squares
+from king_validation import KingNotFound
+
+POSITIONS = [
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", Color.WHITE),
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", Color.BLACK),
+    ("3r4/8/8/8/q7/5N2/R7/3K4", Color.WHITE),
+    ("4r3/8/1q5b/8/3RRR2/4K3/4R3/4n3", Color.WHITE),
+    ("4r3/8/1q5b/8/3QQQ2/4K3/4Q3/4n3", Color.WHITE),
+    ("4r3/8/1q5b/8/3NNN2/4K3/4N3/4n3", Color.WHITE),
+    ("4k3/3p1p2/4P3/pP5B/6pP/3b4/2P2P2/1K6", Color.WHITE),
+    ("4k3/3p1p2/4P3/pP5B/6pP/3b4/2P2P2/1K6", Color.BLACK),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R", Color.WHITE),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R", Color.BLACK),
+]
+
+
+def test_iterate_squares():
+    assert iterate_squares(0) == []
+    assert iterate_squares((1 << 3) | (1 << 63)) == [3, 63]
+
+
+def test_load_starting_position_masks():
+    board = Board(backend="bitboard")
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR")
+    backend = board.backend
+    assert isinstance(backend, BitboardBackend)
+    assert backend.occupancy[Color.BLACK.value] == (1 << 16) - 1
+    assert backend.occupancy[Color.WHITE.value] == ((1 << 16) - 1) << 48
+    assert backend.pieces[Color.WHITE.value * 6 + 5] == 1 << square_index(7, 4)
+
+
+@pytest.mark.parametrize("fen, color", POSITIONS)
+def test_bitboard_matches_dict_backend(fen, color):
+    dict_board = Board()
+    dict_board.process_fen(fen)
+    bitboard_board = Board(backend="bitboard")
+    bitboard_board.process_fen(fen)
+
+    for position, piece in dict_board.board.items():
+        if piece.color == color:
+            assert sorted(dict_board.get_valid_moves(piece)) == sorted(
+                bitboard_board.get_valid_moves(bitboard_board.board[position])
+            )
+
+
+def test_bitboard_is_king_in_check():
+    board = Board(backend="bitboard")
+    board.process_fen("2k5/8/4B3/8/8/8/8/8")
+    assert board.is_king_in_check(Color.BLACK) == True
+
+    board = Board(backend="bitboard")
+    board.process_fen("1r6/8/8/5b2/8/8/PPP5/1K6")
+    assert board.is_king_in_check(Color.WHITE) == False
+
+    with pytest.raises(KingNotFound):
+        board.is_king_in_check(Color.BLACK)
+
+
+def test_bitboard_en_passant():
+    board = Board(backend="bitboard")
+    board.process_fen("4k3/3p4/8/4P3/8/8/8/4K3")
+    board.moves_made = 1
+    board.make_move((1, 3), (3, 3))
+    assert (2, 3) in board.get_valid_moves(board.board[(3, 4)])
+
+    board.make_move((3, 4), (2, 3))
+    assert board.board[(3, 3)].type == PieceType.EMPTY
+    assert board.backend.occupancy[Color.BLACK.value] == 1 << square_index(0, 4)
+
+
+def test_bitboard_make_and_unmake_keep_masks_in_step():
+    board = Board(backend="bitboard")
+    board.process_fen("4k3/P7/8/8/8/8/1p6/R3K3")
+    original = list(board.backend.pieces)
+
+    first = board.make_move((1, 0), (0, 0), promotion=PieceType.ROOK)
+    second = board.make_move((6, 1), (7, 0))
+    assert board.backend.pieces[Color.WHITE.value * 6 + 3] == 1 << square_index(0, 0)
+
+    board.unmake_move(second)
+    board.unmake_move(first)
+    assert board.backend.pieces == original
+
+
+def test_check_and_pin_masks():
+    board = Board(backend="bitboard")
+    board.process_fen("4r3/8/1q5b/8/3RRR2/4K3/4R3/4n3")
+    king_square, check_mask, pins = board.backend.get_check_and_pin_masks(
+        Color.WHITE.value
+    )
+    assert king_square == square_index(5, 4)
+    assert check_mask == (1 << 64) - 1
+    # d4, e4 and f4 are pinned by the queen on b6, the rook on e8 and the bishop on h6
+    assert set(pins) == {square_index(4, 3), square_index(4, 4), square_index(4, 5)}
+    assert pins[square_index(4, 4)] == sum(1 << square_index(x, 4) for x in range(5))
+
+
+def test_double_check_only_king_moves():
+    board = Board(backend="bitboard")
+    board.process_fen("3r4/8/8/8/q7/5N2/R7/3K4")
+    assert {move.origin for move in board.get_legal_moves(Color.WHITE)} == {(7, 3)}
+
+
+def test_en_passant_exposing_king_on_rank_is_illegal():
+    board = Board(backend="bitboard")
+    board.process_fen("8/8/8/K2pP2r/8/8/8/7k")
+    board.board[(3, 3)].en_passantable = True
+    board.backend.load(board.board)
+    assert (2, 3) not in board.get_valid_moves(board.board[(3, 4)])
+
+
+def test_get_legal_moves_includes_every_promotion():
+    board = Board(backend="bitboard")
+    board.process_fen("4k3/1P6/8/8/8/8/8/4K3")
+    promotions = [
+        move.promotion for move in board.get_legal_moves() if move.origin == (1, 1)
+    ]
+    assert promotions == [
+        PieceType.QUEEN,
+        PieceType.ROOK,
+        PieceType.BISHOP,
+        PieceType.KNIGHT,
+    ]
+
+
+def test_legal_moves_match_dict_backend_during_random_games():
+    random_generator = random.Random(3)
+    for _ in range(3):
+        dict_board = Board()
+        dict_board.process_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R")
+        bitboard_board = Board(backend="bitboard")
+        bitboard_board.process_fen(
+            "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R"
+        )
+        for _ in range(40):
+            legal_moves = bitboard_board.get_legal_moves()
+            assert set(legal_moves) == set(dict_board.get_legal_moves())
+            if not legal_moves:
+                break
+            move = random_generator.choice(legal_moves)
+            dict_board.make_move(*move)
+            bitboard_board.make_move(*move)
+
+
+@pytest.mark.parametrize("fen, color", POSITIONS)
+def test_legal_captures_match_dict_backend(fen, color):
+    dict_board = Board()
+    dict_board.process_fen(fen)
+    bitboard_board = Board(backend="bitboard")
+    bitboard_board.process_fen(fen)
+
+    captures = set(bitboard_board.backend.get_legal_captures(color, bitboard_board.board))
+    assert captures == set(dict_board.backend.get_legal_captures(color, dict_board.board))
+    assert captures <= set(bitboard_board.get_legal_moves(color))
+
+
+def test_other_boards_are_searched_with_the_dict_backend():
+    board = Board(backend="bitboard")
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR")
+    other = Board()
+    other.process_fen("4k3/8/8/8/8/8/8/R3K3")
+    backend = board.backend
+    assert set(backend.get_all_valid_moves(Color.WHITE, other.board)) == set(
+        other.backend.get_all_valid_moves(Color.WHITE, other.board)
+    )
+    assert set(backend.get_legal_moves(Color.WHITE, other.board)) == set(
+        other.backend.get_legal_moves(Color.WHITE, other.board)
+    )
+    assert not backend.is_king_in_check(Color.BLACK, other.board)
+    assert backend.is_position_attacked((0, 0), Color.WHITE, other.board)
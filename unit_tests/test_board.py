@@ -1,11 +1,13 @@
-# import pytest
+import pytest
 import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from board import Board
-from pieces import Color, Piece
+from board import Board, STARTING_FEN
+from pieces import Color, Piece, PieceType
+from moves import Move, MoveError
+from notation import Notation, InvalidNotation
 
 
 def test_board_init():
@@ -83,3 +85,292 @@ def test_is_king_in_checkmate_yes():
     board.expected_player = Color.BLACK
     board.check_is_king_in_checkmate()
     assert board.king_in_checkmate == False
+
+
+def test_make_move_and_unmake_move_restore_board():
+    board = Board()
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
+    board.process_fen(fen)
+    original = {position: (piece.type, piece.color) for position, piece in board.board.items()}
+
+    undo = board.make_move((6, 4), (4, 4))
+    assert board.board[(4, 4)].type == PieceType.PAWN
+    assert board.board[(6, 4)].type == PieceType.EMPTY
+    assert board.en_passant_position == (4, 4)
+    assert board.expected_player == Color.BLACK
+
+    board.unmake_move(undo)
+    restored = {position: (piece.type, piece.color) for position, piece in board.board.items()}
+    assert restored == original
+    assert board.en_passant_position is None
+    assert board.moves_made == 0
+    assert board.expected_player == Color.WHITE
+
+
+def test_make_move_en_passant_removes_captured_pawn():
+    board = Board()
+    fen = "4k3/3p4/8/4P3/8/8/8/4K3"
+    board.process_fen(fen)
+    board.make_move((7, 4), (7, 3))  # white king move to hand the turn to black
+    board.make_move((1, 3), (3, 3))
+    assert board.board[(3, 3)].en_passantable
+
+    undo = board.make_move((3, 4), (2, 3))
+    assert board.board[(3, 3)].type == PieceType.EMPTY
+    assert board.board[(2, 3)].color == Color.WHITE
+
+    board.unmake_move(undo)
+    assert board.board[(3, 3)].type == PieceType.PAWN
+    assert board.board[(3, 3)].en_passantable
+    assert board.board[(2, 3)].type == PieceType.EMPTY
+
+
+def test_en_passantable_only_lasts_one_turn():
+    board = Board()
+    fen = "4k3/3p4/8/4P3/8/8/8/4K3"
+    board.process_fen(fen)
+    board.moves_made = 1
+    board.make_move((1, 3), (3, 3))
+    board.make_move((7, 4), (7, 3))
+    assert not board.board[(3, 3)].en_passantable
+    assert board.en_passant_position is None
+
+
+def test_make_move_promotion_is_reverted():
+    board = Board()
+    fen = "4k3/P7/8/8/8/8/8/4K3"
+    board.process_fen(fen)
+    undo = board.make_move((1, 0), (0, 0), promotion=PieceType.KNIGHT)
+    assert board.board[(0, 0)].type == PieceType.KNIGHT
+
+    board.unmake_move(undo)
+    assert board.board[(1, 0)].type == PieceType.PAWN
+    assert board.board[(0, 0)].type == PieceType.EMPTY
+
+
+def test_unmade_promotions_reuse_the_promoted_piece():
+    board = Board()
+    board.process_fen("4k3/PP6/8/8/8/8/8/4K3")
+    undo = board.make_move((1, 1), (0, 1), promotion=PieceType.QUEEN)
+    queen = undo.promoted
+    board.unmake_move(undo)
+    undo = board.make_move((1, 1), (0, 1), promotion=PieceType.KNIGHT)
+    knight = undo.promoted
+    assert knight is not queen
+    board.unmake_move(undo)
+
+    undo = board.make_move((1, 1), (0, 1), promotion=PieceType.QUEEN)
+    assert undo.promoted is queen
+    board.unmake_move(undo)
+    # The spare knight is moved to the square of the next knight promotion
+    board.make_move((1, 0), (0, 0), promotion=PieceType.KNIGHT)
+    assert board.board[(0, 0)] is knight
+    assert (knight.x, knight.y) == (0, 0)
+
+
+def test_process_fen_reads_side_to_move_and_en_passant():
+    board = Board()
+    board.process_fen("rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b - e3 0 3")
+    assert board.expected_player == Color.BLACK
+    assert board.en_passant_position == (4, 4)
+    assert board.board[(4, 4)].en_passantable
+    assert (5, 4) in board.get_valid_moves(board.board[(4, 3)])
+
+
+def test_process_fen_reads_castling_and_clocks():
+    board = Board()
+    board.process_fen("r3k2r/8/8/8/8/8/8/R3K2R b Kq - 7 21")
+    assert board.castling_rights == 0b1001
+    assert board.halfmove_clock == 7
+    assert board.moves_made == 41
+    assert board.expected_player == Color.BLACK
+
+
+def test_process_fen_defaults_missing_fields():
+    board = Board()
+    board.process_fen("4k3/8/8/8/8/8/8/4K3 b")
+    assert board.expected_player == Color.BLACK
+    assert (board.castling_rights, board.halfmove_clock) == (0, 0)
+    assert board.to_fen() == "4k3/8/8/8/8/8/8/4K3 b - - 0 1"
+
+
+def test_to_fen_round_trip():
+    for fen in [
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b Qk e3 0 3",
+        "8/8/8/8/8/8/8/K6k b - - 12 40",
+    ]:
+        board = Board()
+        board.process_fen(fen)
+        assert board.to_fen() == fen
+
+
+def test_to_fen_round_trip_after_a_move(make_board):
+    board = make_board(STARTING_FEN)
+    board.make_move((6, 4), (4, 4))
+    copy = make_board(board.to_fen())
+    assert copy.to_fen() == board.to_fen()
+    assert copy.zobrist_key == board.zobrist_key
+
+
+def test_make_move_updates_castling_and_clocks():
+    board = Board()
+    board.process_fen("r3k2r/p7/8/8/8/8/8/R3K2R w KQkq - 5 9")
+    king_move = board.make_move((7, 4), (7, 3))
+    assert board.to_fen() == "r3k2r/p7/8/8/8/8/8/R2K3R b kq - 6 9"
+    pawn_move = board.make_move((1, 0), (2, 0))
+    assert board.to_fen() == "r3k2r/8/p7/8/8/8/8/R2K3R w kq - 0 10"
+
+    board.unmake_move(pawn_move)
+    board.unmake_move(king_move)
+    assert board.to_fen() == "r3k2r/p7/8/8/8/8/8/R3K2R w KQkq - 5 9"
+
+
+def test_castling_moves_the_rook_and_is_reverted():
+    board = Board()
+    board.process_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    assert Move((7, 4), (7, 6)) in board.get_legal_moves()
+    assert (7, 2) in board.get_valid_moves(board.board[(7, 4)])
+
+    undo = board.make_move((7, 4), (7, 6))
+    assert board.to_fen() == "r3k2r/8/8/8/8/8/8/R4RK1 b kq - 1 1"
+    assert board.board.king_positions[Color.WHITE] == (7, 6)
+    board.unmake_move(undo)
+    assert board.to_fen() == "r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1"
+
+
+def test_castling_needs_safe_and_empty_squares():
+    board = Board()
+    # The f1 square is attacked and the queenside rook is blocked
+    board.process_fen("r3k2r/8/8/8/8/8/5r2/RN2K2R w KQ - 0 1")
+    king_moves = [move for move in board.get_legal_moves() if move.origin == (7, 4)]
+    assert Move((7, 4), (7, 6)) not in king_moves
+    assert Move((7, 4), (7, 2)) not in king_moves
+
+
+def test_king_positions_tracked_through_fen_and_moves():
+    board = Board()
+    board.process_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert board.board.king_positions == {Color.WHITE: (7, 4), Color.BLACK: (0, 4)}
+
+    undo = board.make_move((7, 4), (6, 3))
+    assert board.board.king_positions[Color.WHITE] == (6, 3)
+    board.unmake_move(undo)
+    assert board.board.king_positions[Color.WHITE] == (7, 4)
+
+
+def test_try_move_plays_a_legal_move():
+    board = Board()
+    board.process_fen(STARTING_FEN)
+    result = board.try_move("Pe2e4")
+    assert result.ok and result.move == Move((6, 4), (4, 4))
+    assert not (result.check or result.checkmate or result.stalemate)
+    assert board.expected_player == Color.BLACK
+
+
+@pytest.mark.parametrize(
+    "notation, error, message",
+    [
+        ("e2e4", MoveError.INVALID_NOTATION, "'e2e4' is not a piece letter followed by two squares, such as Pe2e4 or Pe7e8n"),
+        ("Ne2e4", MoveError.NO_PIECE, "N is not on e2"),
+        ("pe7e5", MoveError.WRONG_PLAYER, "white is expected to play"),
+        ("Pe2e5", MoveError.ILLEGAL_MOVE, "P can not move to e5"),
+        ("Pe2e5q", MoveError.ILLEGAL_MOVE, "P can not move to e5"),
+    ],
+)
+def test_try_move_refuses_without_changing_the_board(notation, error, message):
+    board = Board()
+    board.process_fen(STARTING_FEN)
+    result = board.try_move(notation)
+    assert not result.ok and result.move is None
+    assert (result.error, result.message) == (error, message)
+    assert board.to_fen() == STARTING_FEN
+
+
+def test_try_move_reports_checkmate():
+    board = Board()
+    board.process_fen(STARTING_FEN)
+    for notation in ("Pf2f3", "pe7e5", "Pg2g4"):
+        assert board.try_move(notation).ok
+    result = board.try_move("qd8h4")
+    assert result.check and result.checkmate and board.king_in_checkmate
+    result = board.try_move("Pa2a3")
+    assert (result.error, result.message) == (MoveError.GAME_OVER, "white has no legal moves")
+
+
+def test_move_piece_raises_on_refused_move():
+    board = Board()
+    board.process_fen(STARTING_FEN)
+    with pytest.raises(InvalidNotation, match="expected to play"):
+        board.move_piece("pe7e5")
+
+
+def test_direct_writes_keep_kings_found():
+    board = Board()
+    board.board[(7, 4)] = Piece(7, 4, type=PieceType.KING, color=Color.WHITE)
+    board.board[(0, 4)] = Piece(0, 4, type=PieceType.KING, color=Color.BLACK)
+    assert board.get_valid_moves(board.board[(7, 4)])
+
+    # Moving the king by direct writes keeps the rook between it and the attacker pinned
+    board.process_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    board.board[(7, 4)] = Piece(7, 4)
+    board.board[(7, 0)] = Piece(7, 0, type=PieceType.KING, color=Color.WHITE)
+    board.board[(1, 0)] = Piece(1, 0, type=PieceType.ROOK, color=Color.BLACK)
+    board.board[(6, 0)] = Piece(6, 0, type=PieceType.ROOK, color=Color.WHITE)
+    assert all(y == 0 for _, y in board.get_valid_moves(board.board[(6, 0)]))
+
+
+@pytest.mark.parametrize(
+    "placement", ["ppppppppp", "4k3/8/8/8", "4k3/8/8/8/8/8/8/4K3/8", "4k3/7/8/8/8/8/8/4K3", "4k3/8/8/8/8/8/8/4X3"]
+)
+def test_process_fen_rejects_bad_placement(placement):
+    board = Board(backend="mailbox")
+    board.process_fen(STARTING_FEN)
+    with pytest.raises(ValueError):
+        board.process_fen(placement)
+    assert len(board.board) == 64
+    assert board.to_fen() == STARTING_FEN
+
+
+@pytest.mark.parametrize(
+    "fen, message",
+    [
+        ("4k3/8/8/8/8/8/8/4K3 x - - 0 1", "side to move"),
+        ("4k3/8/8/8/8/8/8/4K3 w KX - 0 1", "castling rights"),
+        ("4k3/8/8/8/8/8/8/4K3 w KK - 0 1", "castling rights"),
+        ("4k3/8/8/8/8/8/8/4K3 w - e9 0 1", "en passant square"),
+        ("4k3/8/8/8/8/8/8/4K3 w - e3 0 1", "en passant square"),
+        ("4k3/8/8/8/8/8/8/4K3 w - - x 1", "halfmove clock"),
+        ("4k3/8/8/8/8/8/8/4K3 w - - 0 0", "fullmove number"),
+        ("4k3/8/8/8/8/8/8/4K3 w - - 0 1 1", "more than 6 fields"),
+    ],
+)
+def test_process_fen_rejects_bad_fields(fen, message):
+    board = Board(backend="mailbox")
+    board.process_fen(STARTING_FEN)
+    with pytest.raises(ValueError, match=message):
+        board.process_fen(fen)
+    assert board.to_fen() == STARTING_FEN
+    assert len(board.get_legal_moves()) == 20
+
+
+def test_process_fen_replaces_every_square():
+    board = Board()
+    board.process_fen(STARTING_FEN)
+    board.process_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert board.to_fen() == "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+    assert board.evaluation == 0
+
+
+def test_try_move_underpromotes():
+    board = Board()
+    board.process_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+    knight = Move((1, 1), (0, 1), PieceType.KNIGHT)
+    notation = Notation.move_to_notation(board.board[(1, 1)], knight)
+    assert notation == "Pb7b8n"
+
+    result = board.try_move(notation)
+    assert result.ok and result.move == knight
+    assert board.board[(0, 1)].type == PieceType.KNIGHT
+    assert board.try_move("ke8e7q").error == MoveError.ILLEGAL_MOVE
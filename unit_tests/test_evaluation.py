@@ -0,0 +1,84 @@
+import os
+import sys
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from evaluation import Evaluation, FULL_PHASE
+from pieces import PieceType
+from moves import Move
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+def test_starting_position_is_balanced():
+    board = Board()
+    board.process_fen(START_FEN)
+    assert board.phase == FULL_PHASE
+    assert board.evaluation == 0
+
+
+def test_mirrored_positions_have_opposite_scores():
+    white = Board()
+    white.process_fen("4k3/8/8/8/4P3/2N5/8/4K3 w - - 0 1")
+    black = Board()
+    black.process_fen("4k3/8/2n5/4p3/8/8/8/4K3 b - - 0 1")
+    assert white.evaluation > 0
+    assert white.evaluation == -black.evaluation
+
+
+def test_taper_blends_by_phase():
+    assert Evaluation.taper(100, 300, FULL_PHASE) == 100
+    assert Evaluation.taper(100, 300, 0) == 300
+    assert Evaluation.taper(100, 300, FULL_PHASE // 2) == 200
+    # Extra pieces from promotions do not push the phase past the middle game
+    assert Evaluation.taper(100, 300, FULL_PHASE + 4) == 100
+
+
+def test_promotion_updates_evaluation():
+    board = Board()
+    board.process_fen("4k3/P7/8/8/8/8/8/4K3 w - - 0 1")
+    before = board.evaluation
+    undo = board.make_move((1, 0), (0, 0), promotion=PieceType.QUEEN)
+    assert board.evaluation > before + 700
+    assert (board.middle_game_score, board.end_game_score, board.phase) == (
+        Evaluation.score_board(board.board)
+    )
+    board.unmake_move(undo)
+    assert board.evaluation == before
+
+
+def test_incremental_evaluation_matches_full_score_in_random_games():
+    rng = random.Random(14)
+    for _ in range(5):
+        board = Board(backend="bitboard")
+        board.process_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w - - 0 1")
+        undos = []
+        for _ in range(60):
+            moves = board.get_legal_moves()
+            if not moves:
+                break
+            undos.append(board.make_move(*rng.choice(moves)))
+            assert (board.middle_game_score, board.end_game_score, board.phase) == (
+                Evaluation.score_board(board.board)
+            )
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+        assert (board.middle_game_score, board.end_game_score, board.phase) == (
+            Evaluation.score_board(board.board)
+        )
+
+
+def test_static_exchange():
+    board = Board()
+    board.process_fen("4k3/4r3/8/4p3/8/8/4R3/4R1K1 w - - 0 1")
+    before = dict(board.board)
+    # Rook takes pawn, rook recaptures, the rook behind recaptures: one pawn up
+    assert Evaluation.static_exchange(board.board, Move((6, 4), (3, 4))) == 100
+    assert board.board == before
+
+    board = Board()
+    board.process_fen("4k3/8/3p4/4p3/8/8/7Q/4K3 w - - 0 1")
+    # The queen is lost to the pawn on d6
+    assert Evaluation.static_exchange(board.board, Move((6, 7), (3, 4))) == -800
@@ -5,7 +5,8 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from pieces import Piece, Color, PieceType
-from king_validation import KingValidation, KingNotFound
+from king_validation import KingValidation, KingNotFound, TrackedBoard
+from utility import BoardUtils
 
 
 def test_find_king_position():
@@ -35,3 +36,40 @@ def test_find_king_position_no_kings_found():
 
     with pytest.raises(KingNotFound):
         KingValidation.find_king_position(board, Color.BLACK)
+
+
+def test_find_king_position_tracked_board():
+
+    board = TrackedBoard(
+        {
+            (0, 0): Piece(0, 0, type=PieceType.KING, color=Color.WHITE),
+            (0, 1): Piece(0, 1),
+            (7, 7): Piece(7, 7, type=PieceType.KING, color=Color.BLACK),
+        }
+    )
+    assert board.king_positions == {Color.WHITE: (0, 0), Color.BLACK: (7, 7)}
+
+    # The king position follows the king through a move and back
+    undo = BoardUtils.make_move(board, board[(0, 0)], 0, 1)
+    assert KingValidation.find_king_position(board, Color.WHITE) == (0, 1)
+    BoardUtils.unmake_move(board, undo)
+    assert KingValidation.find_king_position(board, Color.WHITE) == (0, 0)
+
+
+def test_find_king_position_tracked_board_no_kings_found():
+
+    board = TrackedBoard({(0, 0): Piece(0, 0)})
+    with pytest.raises(KingNotFound):
+        KingValidation.find_king_position(board, Color.WHITE)
+
+
+def test_find_king_position_tracked_board_direct_writes():
+
+    board = TrackedBoard({(0, 0): Piece(0, 0), (7, 7): Piece(7, 7)})
+    board[(7, 7)] = Piece(7, 7, type=PieceType.KING, color=Color.WHITE)
+    assert KingValidation.find_king_position(board, Color.WHITE) == (7, 7)
+
+    # A king moved by direct writes is found on its new square
+    board[(7, 7)] = Piece(7, 7)
+    board[(0, 0)] = Piece(0, 0, type=PieceType.KING, color=Color.WHITE)
+    assert KingValidation.find_king_position(board, Color.WHITE) == (0, 0)
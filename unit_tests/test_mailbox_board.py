@@ -0,0 +1,127 @@
+import pytest
+import random
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from pieces import Color, PieceType, EMPTY_SQUARE
+from mailbox_board import (
+    MailboxBackend,
+    MAILBOX_INDEX,
+    OFF_BOARD,
+    KING,
+    ROOK,
+    EMPTY,
+)
+from king_validation import KingNotFound
+
+POSITIONS = [
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", Color.WHITE),
+    ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR", Color.BLACK),
+    ("3r4/8/8/8/q7/5N2/R7/3K4", Color.WHITE),
+    ("4r3/8/1q5b/8/3RRR2/4K3/4R3/4n3", Color.WHITE),
+    ("4k3/3p1p2/4P3/pP5B/6pP/3b4/2P2P2/1K6", Color.BLACK),
+    ("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R", Color.WHITE),
+]
+
+
+def test_load_places_codes_inside_sentinels():
+    board = Board(backend="mailbox")
+    board.process_fen("4k3/8/8/8/8/8/8/R3K3")
+    assert isinstance(board.backend, MailboxBackend)
+    squares = board.backend.squares
+    assert len(squares) == 120
+    assert squares[MAILBOX_INDEX[(7, 4)]] == KING
+    assert squares[MAILBOX_INDEX[(0, 4)]] == -KING
+    assert squares[MAILBOX_INDEX[(7, 0)]] == ROOK
+    assert squares[MAILBOX_INDEX[(7, 0)] - 1] == OFF_BOARD
+    assert squares[MAILBOX_INDEX[(7, 0)] + 20] == OFF_BOARD
+    assert board.backend.king_squares == [MAILBOX_INDEX[(7, 4)], MAILBOX_INDEX[(0, 4)]]
+
+
+@pytest.mark.parametrize("fen, color", POSITIONS)
+def test_mailbox_matches_dict_backend(fen, color):
+    dict_board = Board()
+    dict_board.process_fen(fen)
+    mailbox_board = Board(backend="mailbox")
+    mailbox_board.process_fen(fen)
+
+    for position, piece in dict_board.board.items():
+        if piece.color == color:
+            assert sorted(dict_board.get_valid_moves(piece)) == sorted(
+                mailbox_board.get_valid_moves(mailbox_board.board[position])
+            )
+
+
+def test_mailbox_is_king_in_check():
+    board = Board(backend="mailbox")
+    board.process_fen("2k5/8/4B3/8/8/8/8/8")
+    assert board.is_king_in_check(Color.BLACK) == True
+
+    with pytest.raises(KingNotFound):
+        board.is_king_in_check(Color.WHITE)
+
+
+def test_mailbox_en_passant_and_unmake():
+    board = Board(backend="mailbox")
+    board.process_fen("4k3/3p4/8/4P3/8/8/8/4K3 b - - 0 1")
+    original = list(board.backend.squares)
+
+    first = board.make_move((1, 3), (3, 3))
+    assert (2, 3) in board.get_valid_moves(board.board[(3, 4)])
+    second = board.make_move((3, 4), (2, 3))
+    assert board.backend.squares[MAILBOX_INDEX[(3, 3)]] == EMPTY
+
+    board.unmake_move(second)
+    board.unmake_move(first)
+    assert list(board.backend.squares) == original
+
+
+def test_mailbox_view_reads_like_dictionary_board():
+    board = Board(backend="mailbox")
+    board.process_fen("4k3/8/8/8/8/8/8/R3K3")
+    view = board.backend.view
+    assert len(view) == 64
+    assert view[(7, 0)].type == PieceType.ROOK
+    assert view[(7, 0)].color == Color.WHITE
+    assert (view[(7, 0)].x, view[(7, 0)].y) == (7, 0)
+    assert view[(4, 4)] is EMPTY_SQUARE
+    assert [view[position].type for position in view] == [
+        board.board[position].type for position in view
+    ]
+
+
+def test_legal_moves_match_dict_backend_during_random_games():
+    random_generator = random.Random(11)
+    fen = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R"
+    for _ in range(3):
+        dict_board = Board()
+        dict_board.process_fen(fen)
+        mailbox_board = Board(backend="mailbox")
+        mailbox_board.process_fen(fen)
+        for _ in range(40):
+            legal_moves = mailbox_board.get_legal_moves()
+            assert set(legal_moves) == set(dict_board.get_legal_moves())
+            if not legal_moves:
+                break
+            move = random_generator.choice(legal_moves)
+            dict_board.make_move(*move)
+            mailbox_board.make_move(*move)
+
+
+def test_other_boards_are_searched_with_the_dict_backend():
+    board = Board(backend="mailbox")
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR")
+    other = Board()
+    other.process_fen("4k3/8/8/8/8/8/8/R3K3")
+    backend = board.backend
+    assert set(backend.get_all_valid_moves(Color.WHITE, other.board)) == set(
+        other.backend.get_all_valid_moves(Color.WHITE, other.board)
+    )
+    assert set(backend.get_legal_moves(Color.WHITE, other.board)) == set(
+        other.backend.get_legal_moves(Color.WHITE, other.board)
+    )
+    assert not backend.is_king_in_check(Color.BLACK, other.board)
+    assert backend.is_position_attacked((0, 0), Color.WHITE, other.board)
@@ -0,0 +1,73 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from move_cache import MoveCache
+from pieces import Piece, PieceType, Color
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+def test_move_cache_evicts_least_recently_used():
+    cache = MoveCache(maxsize=2)
+    cache.put("a", [1])
+    cache.put("b", [2])
+    assert cache.get("a") == [1]  # "b" is now the least recently used
+    cache.put("c", [3])
+
+    assert cache.get("b") is None
+    assert cache.get("c") == [3]
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_move_cache_size_zero_disables_cache():
+    cache = MoveCache(maxsize=0)
+    cache.put("a", [1])
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_board_reuses_cached_legal_moves():
+    board = Board()
+    board.process_fen(START_FEN)
+    first = board.get_legal_moves()
+    assert board.move_cache.misses == 1
+
+    # Moving a knight out and back reaches the same position
+    knight_moves = [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((5, 5), (7, 6)), ((2, 5), (0, 6))]
+    for origin, target in knight_moves:
+        board.make_move(origin, target)
+    assert board.get_legal_moves() == first
+    assert board.move_cache.hits == 1
+
+
+def test_board_cached_valid_moves_follow_position():
+    board = Board()
+    board.process_fen(START_FEN)
+    assert len(board.get_valid_moves(board.board[(6, 4)])) == 2
+    assert len(board.get_all_valid_moves(board.expected_player, board.board)) == 20
+
+    board.make_move((6, 4), (4, 4))
+    board.make_move((1, 4), (3, 4))
+    # The blocked pawn has no moves in the new position
+    assert board.get_valid_moves(board.board[(4, 4)]) == []
+    assert len(board.get_all_valid_moves(board.expected_player, board.board)) == 29
+
+
+@pytest.mark.parametrize("backend", ["dict", "bitboard", "mailbox"])
+def test_direct_writes_invalidate_cached_moves(backend):
+    board = Board(backend=backend)
+    board.process_fen("4k3/8/8/8/8/8/8/R3K3 w - - 0 1")
+    rook = board.board[(7, 0)]
+    assert len(board.get_valid_moves(rook)) == 10
+    assert len(board.get_legal_moves()) == 15
+
+    # A knight written straight onto a4 blocks the file of the rook
+    board.board[(4, 0)] = Piece(x=4, y=0, type=PieceType.KNIGHT, color=Color.WHITE)
+    assert len(board.get_valid_moves(rook)) == 5
+    assert len(board.get_legal_moves()) == 15 - 5 + 4
+    assert not board.board.modified
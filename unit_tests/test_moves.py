@@ -587,3 +587,54 @@ def test_is_king_in_check_no_checks():
         )
         == False
     )
+
+
+def test_is_king_in_check_pawn_behind_king_does_not_attack():
+    fen = "8/8/8/3K4/2p5/8/8/8"
+    board = Board()
+    board.process_fen(fen)
+    assert (
+        UniversalMovementValidation.is_king_in_check(
+            color=Color.WHITE, board=board.board
+        )
+        == False
+    )
+
+
+def test_KingMovement_cannot_move_next_to_opposing_king():
+    fen = "8/8/8/3k4/8/3K4/8/8"
+    board = Board()
+    board.process_fen(fen)
+    king = board.board[5, 3]
+    valid_moves = KingMovement(king).get_valid_moves(board.board)
+    expected_moves = [(5, 2), (5, 4), (6, 2), (6, 3), (6, 4)]
+    assert valid_moves == expected_moves
+
+
+def test_get_attackers_of_any_square():
+    board = Board()
+    board.process_fen("4k3/8/8/2n5/1P3Q2/4K3/8/4R3 b - - 0 1")
+    attackers = UniversalMovementValidation.get_attackers(
+        board.board, (6, 4), Color.WHITE
+    )
+    assert set(attackers) == {(5, 4), (7, 4)}  # king on e3 and rook on e1
+
+    # The knight on c5 is attacked by the pawn on b4 only
+    attackers = UniversalMovementValidation.get_attackers(
+        board.board, (3, 2), Color.WHITE
+    )
+    assert attackers == [(4, 1)]
+    assert UniversalMovementValidation.is_square_attacked(
+        board.board, (3, 2), Color.WHITE
+    )
+    assert not UniversalMovementValidation.is_square_attacked(
+        board.board, (0, 0), Color.WHITE
+    )
+
+
+def test_get_valid_captures_includes_en_passant():
+    board = Board()
+    board.process_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    pawn = board.board[(3, 4)]
+    assert PawnMovement(pawn).get_valid_moves(board.board) == [(2, 4), (2, 3)]
+    assert PawnMovement(pawn).get_valid_captures(board.board) == [(2, 3)]
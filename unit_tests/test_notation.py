@@ -4,9 +4,9 @@ import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from notation import Notation
-from board import Board
+from notation import Notation, InvalidNotation
 from pieces import Piece, Color, PieceType
+from moves import Move
 
 
 # is_correct_format
@@ -70,6 +70,11 @@ def test_convert_to_coordinates():
     assert Notation.convert_to_coordinates("h7") == (1, 7)
 
 
+def test_interpret_notation_unknown_piece():
+    with pytest.raises(InvalidNotation):
+        Notation.interpret_notation("xe2e4")
+
+
 def test_notation_is_valid_all_valid():
     # Create a board with some pieces for testing
     board = {(1, 0): Piece(x=1, y=0, type=PieceType.PAWN, color=Color.BLACK)}
@@ -100,3 +105,55 @@ def test_notation_is_valid_piece_not_exist():
     board = {(1, 0): Piece(x=1, y=0, type=PieceType.PAWN, color=Color.BLACK)}
     # Test with notations where the specified piece does not exist at the original position
     assert Notation.notation_is_valid(board, "Pa7a6") == False  # No pawn at a5
+
+
+def test_convert_to_notation():
+    assert Notation.convert_to_notation((6, 0)) == "a2"
+    assert Notation.convert_to_notation((1, 7)) == "h7"
+
+
+def test_move_to_notation():
+    pawn = Piece(x=1, y=0, type=PieceType.PAWN, color=Color.BLACK)
+    assert Notation.move_to_notation(pawn, Move((1, 0), (3, 0))) == "pa7a5"
+
+    promoting_pawn = Piece(x=1, y=0, type=PieceType.PAWN, color=Color.WHITE)
+    assert Notation.move_to_notation(promoting_pawn, Move((1, 0), (0, 0), PieceType.QUEEN)) == "Pa7a8"
+    assert Notation.move_to_notation(promoting_pawn, Move((1, 0), (0, 0), PieceType.KNIGHT)) == "Pa7a8n"
+
+
+# standard algebraic notation
+@pytest.mark.parametrize(
+    "fen, move, san",
+    [
+        ("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1", Move((7, 6), (5, 5)), "Nf3"),
+        ("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2", Move((4, 4), (3, 3)), "exd5"),
+        ("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1", Move((3, 4), (2, 3)), "exd6"),
+        ("4k3/P7/8/8/8/8/8/4K3 w - - 0 1", Move((1, 0), (0, 0), PieceType.QUEEN), "a8=Q+"),
+        ("4k3/P7/8/8/8/8/8/4K3 w - - 0 1", Move((1, 0), (0, 0), PieceType.KNIGHT), "a8=N"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", Move((7, 4), (7, 6)), "O-O"),
+        ("4k3/8/8/8/8/8/8/R3K2R w KQ - 0 1", Move((7, 4), (7, 2)), "O-O-O"),
+        ("4k3/8/8/8/8/8/4K3/R6R w - - 0 1", Move((7, 0), (7, 3)), "Rad1"),
+        ("4k3/8/8/8/R7/8/4K3/R7 w - - 0 1", Move((7, 0), (6, 0)), "R1a2"),
+        ("4k3/8/8/1N6/8/1N3N2/8/4K3 w - - 0 1", Move((5, 1), (4, 3)), "Nb3d4"),
+        ("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1", Move((7, 0), (0, 0)), "Ra8#"),
+    ],
+)
+def test_san_round_trip(fen, move, san, make_board):
+    board = make_board(fen)
+    assert board.move_to_san(move) == san
+    assert board.san_to_move(san) == move
+    assert board.to_fen() == fen
+
+
+def test_san_to_move_castling_needs_the_right(make_board):
+    board = make_board("4k3/8/8/8/8/8/8/R3K2R w K - 0 1")
+    assert board.san_to_move("O-O") == Move((7, 4), (7, 6))
+    with pytest.raises(InvalidNotation):
+        board.san_to_move("O-O-O")
+
+
+def test_san_to_move_rejects_bad_notation(make_board):
+    board = make_board("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    for san in ["e5", "Nd2", "Zf3", "e", "Ke2"]:
+        with pytest.raises(InvalidNotation):
+            board.san_to_move(san)
@@ -0,0 +1,59 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from moves import Move
+from parallel import (
+    get_backend_name,
+    lazy_smp_search,
+    parallel_divide,
+    parallel_perft,
+    parallel_search,
+)
+from search import MATE_SCORE
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+@pytest.mark.parametrize("backend", ["dict", "bitboard", "mailbox"])
+def test_get_backend_name(backend):
+    assert get_backend_name(Board(backend=backend)) == backend
+
+
+def test_parallel_perft_matches_serial(make_board):
+    board = make_board(START_FEN)
+    assert parallel_perft(board, 3, workers=2) == board.perft(3) == 8902
+
+
+def test_parallel_divide_covers_root_moves(make_board):
+    board = make_board(START_FEN)
+    counts = parallel_divide(board, 2, workers=2)
+    assert len(counts) == 20
+    assert all(count == 20 for count in counts.values())
+
+
+def test_parallel_search_finds_back_rank_mate(make_board):
+    board = make_board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = parallel_search(board, 3, workers=2, table_mb=1)
+    assert result.best_move == Move((7, 0), (0, 0))
+    assert result.score == MATE_SCORE - 1
+    assert result.pv[0] == "Ra1a8"
+    assert board.to_fen() == "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+def test_lazy_smp_search_finds_back_rank_mate(make_board):
+    board = make_board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = lazy_smp_search(board, 3, workers=2, table_mb=1)
+    assert result.best_move == Move((7, 0), (0, 0))
+    assert result.score == MATE_SCORE - 1
+    assert board.to_fen() == "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"
+
+
+def test_lazy_smp_search_returns_legal_move(make_board):
+    fen = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w - - 0 1"
+    result = lazy_smp_search(make_board(fen), 3, workers=2, table_mb=1)
+    assert result.depth >= 3
+    assert result.best_move in make_board(fen).get_legal_moves()
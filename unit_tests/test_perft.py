@@ -0,0 +1,48 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from moves import Move
+from perft import PERFT_POSITIONS, run_perft
+
+
+@pytest.mark.parametrize("backend", ["dict", "bitboard", "mailbox"])
+def test_perft_starting_position(backend):
+    board = Board(backend=backend)
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+    assert board.perft(0) == 1
+    assert board.perft(1) == 20
+    assert board.perft(2) == 400
+
+
+def test_perft_leaves_board_unchanged():
+    fen = "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"
+    board = Board(backend="bitboard")
+    board.process_fen(fen)
+    before = {position: (piece.type, piece.color) for position, piece in board.board.items()}
+    board.perft(3)
+    after = {position: (piece.type, piece.color) for position, piece in board.board.items()}
+    assert after == before
+
+    fresh = Board(backend="bitboard")
+    fresh.process_fen(fen)
+    assert board.backend.pieces == fresh.backend.pieces
+
+
+def test_divide_sums_to_perft():
+    board = Board(backend="bitboard")
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+    nodes = board.divide(2)
+    assert len(nodes) == 20
+    assert nodes[Move((6, 4), (4, 4))] == 20
+    assert sum(nodes.values()) == 400
+
+
+@pytest.mark.parametrize("position", PERFT_POSITIONS, ids=lambda position: position.name)
+def test_perft_positions_match_known_counts(position):
+    for depth in (1, 2):
+        result = run_perft(position.fen, depth, expected=position.nodes[depth])
+        assert result.passed
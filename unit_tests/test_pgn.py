@@ -0,0 +1,119 @@
+import pytest
+import io
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from moves import Move
+from notation import Notation, InvalidNotation
+from pgn import PgnGame, read_games, replay_game, replay_file, format_game, moves_to_san
+from pieces import PieceType
+
+PGN = """[Event "Casual"]
+[White "A"]
+[Black "B"]
+[Result "1-0"]
+
+1. e4 e5 2. Bc4 {a comment
+over two lines} Nc6 3. Qh5 (3. Nf3 Nf6) Nf6?? $4 4. Qxf7# 1-0
+
+[Event "Promotion"]
+[FEN "8/P7/8/8/8/8/8/k6K w - - 0 1"]
+[SetUp "1"]
+
+1. a8=Q+ Kb2 ; rest of line
+*
+
+[Event "Broken"]
+
+1. e4 e5 2. Ke3 1/2-1/2
+"""
+
+
+def test_read_games_skips_comments_and_variations():
+    games = list(read_games(io.StringIO(PGN)))
+    assert len(games) == 3
+    assert games[0].headers["White"] == "A"
+    assert games[0].moves == ["e4", "e5", "Bc4", "Nc6", "Qh5", "Nf6??", "Qxf7#"]
+    assert games[0].result == "1-0"
+    assert games[1].moves == ["a8=Q+", "Kb2"]
+    assert games[1].result == "*"
+    assert games[2].result == "1/2-1/2"
+
+
+def test_replay_game_plays_moves_on_board():
+    scholars_mate, promotion, broken = read_games(io.StringIO(PGN))
+    board = Board(backend="bitboard")
+
+    assert len(list(replay_game(scholars_mate, board))) == 7
+    assert board.get_legal_moves() == []
+    assert board.is_king_in_check(board.expected_player)
+
+    assert list(replay_game(promotion, board))[0] == Move((1, 0), (0, 0), PieceType.QUEEN)
+    assert board.board[(0, 0)].type == PieceType.QUEEN
+
+    with pytest.raises(InvalidNotation):
+        list(replay_game(broken, board))
+    assert board.moves_made == 2
+
+
+def test_replay_file_reports_throughput(tmp_path):
+    path = tmp_path / "games.pgn"
+    path.write_text(PGN * 3)
+    stats = replay_file(str(path))
+    assert (stats.games, stats.moves, stats.errors) == (9, 33, 3)
+    assert stats.games_per_second > 0 and stats.moves_per_second > 0
+
+
+def test_san_to_move_disambiguates():
+    board = Board()
+    board.process_fen("4k3/8/8/8/8/8/4K3/R6R w - - 0 1")
+    legal_moves = board.get_legal_moves()
+    assert Notation.san_to_move(board.board, "Rad1", legal_moves) == Move((7, 0), (7, 3))
+    assert Notation.san_to_move(board.board, "Rhf1", legal_moves) == Move((7, 7), (7, 5))
+    with pytest.raises(InvalidNotation):
+        Notation.san_to_move(board.board, "Rd1", legal_moves)
+    with pytest.raises(InvalidNotation):
+        Notation.san_to_move(board.board, "Nf3", legal_moves)
+
+
+def test_format_game_round_trips_through_reader():
+    board = Board(backend="bitboard")
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    moves = []
+    sans = "e4 e5 Nf3 Nc6 Bb5 a6 Ba4 Nf6 O-O Be7 Re1 b5 Bb3 d6 c3 O-O".split()
+    for san in sans:
+        moves.append(board.san_to_move(san))
+        board.make_move(*moves[-1])
+
+    board.process_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+    assert moves_to_san(board, moves) == sans
+
+    game = PgnGame({"Event": 'The "Ruy"'}, sans, "*")
+    text = format_game(game, line_length=40)
+    assert text.startswith('[Event "The \\"Ruy\\""]\n\n1. e4 e5 2. Nf3 Nc6')
+    assert all(len(line) <= 40 for line in text.splitlines())
+    assert list(read_games(io.StringIO(text))) == [game]
+
+
+def test_replay_file_skips_games_it_can_not_set_up(tmp_path):
+    bad_setups = (
+        '[FEN "8/8/8/8"]\n\n1. Ka2 *\n\n'
+        '[FEN "8/8/8/8/8/8/8/K7 w - - 0 1"]\n\n1. Ka2 Kb7 *\n\n'
+        "1. e4 d5 2. e5 f5 3. exf6 e.p. Nxf6 *\n"
+    )
+    path = tmp_path / "games.pgn"
+    path.write_text(bad_setups)
+    stats = replay_file(str(path))
+    assert (stats.games, stats.moves, stats.errors) == (3, 7, 2)
+
+
+def test_castling_written_with_zeros_is_read_and_played():
+    game, = read_games(io.StringIO("1. e4 e5 2. Nf3 Nc6 3. Bc4 Bc5 4. 0-0 Nf6 5. d3 5...0-0 *\n"))
+    assert game.moves == ["e4", "e5", "Nf3", "Nc6", "Bc4", "Bc5", "0-0", "Nf6", "d3", "0-0"]
+    board = Board()
+    assert list(replay_game(game, board))[6] == Move((7, 4), (7, 6))
+    assert board.board[(7, 5)].type == PieceType.ROOK
+    assert board.board[(0, 6)].type == PieceType.KING
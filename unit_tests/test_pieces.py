@@ -1,5 +1,42 @@
 import pytest
+import copy
 import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pieces import Piece, Color, PieceType, EMPTY_SQUARE
+from board import Board
+
+
+def test_piece_is_slotted():
+    piece = Piece(6, 4, Color.WHITE, PieceType.PAWN)
+    assert not hasattr(piece, "__dict__")
+    with pytest.raises(AttributeError):
+        piece.value = 1
+
+
+def test_piece_flags_do_not_affect_equality():
+    moved = Piece(6, 4, Color.WHITE, PieceType.PAWN, has_moved=True)
+    assert moved == Piece(6, 4, Color.WHITE, PieceType.PAWN)
+
+
+def test_empty_squares_share_one_piece():
+    board = Board()
+    board.process_fen("4k3/8/8/8/8/8/4P3/4K3 w - - 0 1")
+    assert all(
+        piece is EMPTY_SQUARE
+        for piece in board.board.values()
+        if piece.type == PieceType.EMPTY
+    )
+
+    undo = board.make_move((6, 4), (4, 4))
+    assert board.board[(6, 4)] is EMPTY_SQUARE
+    board.unmake_move(undo)
+    assert board.board[(4, 4)] is EMPTY_SQUARE
+
+
+def test_empty_square_can_not_be_modified():
+    with pytest.raises(AttributeError):
+        EMPTY_SQUARE.has_moved = True
+    assert copy.deepcopy(EMPTY_SQUARE) is EMPTY_SQUARE
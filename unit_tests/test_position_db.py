@@ -0,0 +1,58 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from moves import Move
+from position_db import PositionDatabase, write_database, HEADER_SIZE, RECORD_SIZE
+
+FENS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b Qk e3 0 3",
+    "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+]
+
+
+@pytest.fixture
+def database_path(tmp_path, make_board):
+    path = str(tmp_path / "positions.db")
+    entries = [
+        (make_board(fen), index * 10 - 15, Move((6, 4), (4, 4)) if index else None, index)
+        for index, fen in enumerate(FENS)
+    ]
+    assert write_database(path, entries) == len(FENS)
+    return path
+
+
+def test_lookup_finds_every_position(database_path, make_board):
+    with PositionDatabase(database_path) as database:
+        assert len(database) == len(FENS)
+        assert os.path.getsize(database_path) == HEADER_SIZE + len(FENS) * RECORD_SIZE
+        for index, fen in enumerate(FENS):
+            record = database.lookup(make_board(fen))
+            assert (record.score, record.depth) == (index * 10 - 15, index)
+            assert record.to_board().to_fen() == fen
+        assert database.lookup(make_board(FENS[1])).move == Move((6, 4), (4, 4))
+        assert database.lookup(make_board(FENS[0])).move is None
+
+
+def test_lookup_ignores_clocks_and_misses_unknown_positions(database_path, make_board):
+    with PositionDatabase(database_path) as database:
+        assert make_board("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 9 30") in database
+        assert make_board("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 b - - 0 1") not in database
+        assert database.find(12345) is None
+
+
+def test_records_are_sorted_by_key(database_path, make_board):
+    with PositionDatabase(database_path) as database:
+        keys = [record.key for record in database]
+    assert keys == sorted(make_board(fen).zobrist_key for fen in FENS)
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.db"
+    path.write_bytes(b"not a position database")
+    with pytest.raises(ValueError):
+        PositionDatabase(str(path))
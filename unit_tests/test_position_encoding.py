@@ -0,0 +1,55 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from position_encoding import (
+    POSITION_SIZE,
+    encode_position,
+    decode_position,
+    encode_positions,
+    decode_positions,
+)
+
+FENS = [
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+    "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+    "rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b Qk e3 0 3",
+    "rnbqkbnr/pp1ppppp/8/2pP4/8/8/PPP1PPPP/RNBQKBNR w KQkq c6 0 3",
+    "8/8/8/8/8/8/8/K6k b - - 12 400",
+]
+
+
+@pytest.mark.parametrize("fen", FENS)
+def test_encode_and_decode_position(fen, make_board):
+    board = make_board(fen)
+    data = encode_position(board)
+    assert len(data) == POSITION_SIZE == 32
+
+    decoded = decode_position(data)
+    assert decoded.to_fen() == fen
+    assert decoded.zobrist_key == board.zobrist_key
+    assert decoded.evaluation == board.evaluation
+
+
+def test_decode_position_reuses_board(make_board):
+    board = make_board(FENS[1])
+    decode_position(encode_position(make_board(FENS[4])), board=board)
+    assert board.to_fen() == FENS[4]
+    assert board.get_legal_moves() == make_board(FENS[4]).get_legal_moves()
+
+
+def test_encode_and_decode_positions_in_bulk(make_board):
+    data = encode_positions(make_board(fen) for fen in FENS)
+    assert len(data) == POSITION_SIZE * len(FENS)
+
+    boards = list(decode_positions(memoryview(data), backend="bitboard"))
+    assert [board.to_fen() for board in boards] == FENS
+    with pytest.raises(ValueError):
+        list(decode_positions(data[:-1]))
+
+
+def test_encode_position_rejects_too_many_pieces(make_board):
+    with pytest.raises(ValueError):
+        encode_position(make_board("rnbqkbnr/pppppppp/p7/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"))
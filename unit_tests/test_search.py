@@ -0,0 +1,78 @@
+import pytest
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from moves import Move
+from search import Search, MATE_SCORE
+
+
+@pytest.mark.parametrize("backend", ["dict", "bitboard"])
+def test_search_finds_back_rank_mate(backend, make_board):
+    board = make_board("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1", backend)
+    result = Search(board).search(depth=3)
+    assert result.best_move == Move((7, 0), (0, 0))
+    assert result.notation == "Ra1a8"
+    assert result.score == MATE_SCORE - 1
+
+
+def test_search_captures_hanging_queen(make_board):
+    board = make_board("3qk3/8/8/8/8/8/8/3RK3 w - - 0 1")
+    result = Search(board).search(depth=2)
+    assert result.notation == "Rd1d8"
+    assert result.pv[:2] == ["Rd1d8", "ke8d8"]
+
+
+def test_search_leaves_board_unchanged(make_board):
+    fen = "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10"
+    board = make_board(fen)
+    before = {position: (piece.type, piece.color) for position, piece in board.board.items()}
+    key = board.zobrist_key
+    Search(board).search(depth=2)
+    assert {position: (piece.type, piece.color) for position, piece in board.board.items()} == before
+    assert board.zobrist_key == key
+
+
+def test_search_node_limit_returns_completed_iteration(make_board):
+    board = make_board("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1")
+    iterations = []
+    result = Search(board).search(depth=10, node_limit=3000, on_iteration=iterations.append)
+    assert result.nodes <= 3000
+    assert result.depth == iterations[-1].depth < 10
+    assert result.best_move is not None
+    assert result.nodes_per_second > 0
+
+
+def test_search_without_legal_moves(make_board):
+    # Black is stalemated
+    board = make_board("k7/2Q5/1K6/8/8/8/8/8 b - - 0 1")
+    result = Search(board).search(depth=3)
+    assert result.best_move is None
+    assert result.score == 0
+
+
+def test_quiescence_sees_recapture(make_board):
+    # Taking the pawn with the queen loses her to the pawn on d6
+    board = make_board("4k3/8/3p4/4p3/8/8/7Q/4K3 w - - 0 1")
+    result = Search(board).search(depth=1)
+    assert result.best_move.target != (3, 4)
+    assert Search(board, use_quiescence=False).search(depth=1).notation == "Qh2e5"
+
+
+def test_move_ordering_searches_fewer_nodes(make_board):
+    fen = "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10"
+    unordered = Search(make_board(fen), ordering=False).search(depth=3)
+    ordered = Search(make_board(fen)).search(depth=3)
+    assert ordered.nodes < unordered.nodes
+    assert ordered.score == unordered.score
+
+
+def test_order_moves_puts_winning_captures_first(make_board):
+    board = make_board("4k3/8/3p4/3qp3/8/2N5/7Q/4K3 w - - 0 1")
+    search = Search(board)
+    search.search(depth=1)
+    ordered = search.order_moves(board.get_legal_moves(), None, 0)
+    # Knight takes queen, then the queen takes the defended pawn last
+    assert ordered[0] == Move((5, 2), (3, 3))
+    assert ordered[-1] == Move((6, 7), (3, 4))
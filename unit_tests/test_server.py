@@ -0,0 +1,121 @@
+import pytest
+import asyncio
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from server import GameServer, start_server, load_test
+
+
+def run_requests(requests, server=None):
+    """Send request lines to a server on a free port over one connection and collect the responses."""
+
+    async def exchange():
+        listener = await start_server(server or GameServer(), port=0)
+        async with listener:
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            responses = []
+            for request in requests:
+                line = request if isinstance(request, str) else json.dumps(request)
+                writer.write(line.encode() + b"\n")
+                await writer.drain()
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+            return responses
+
+    return asyncio.run(exchange())
+
+
+def test_new_game_and_moves():
+    new, first, second = run_requests(
+        [
+            {"op": "new"},
+            {"op": "move", "game": 1, "move": "e2e4", "id": 7},
+            {"op": "move", "game": 1, "move": "Nf6"},
+        ]
+    )
+    assert new["ok"] and new["game"] == 1 and len(new["legal"]) == 20
+    assert first["ok"] and first["san"] == "e4" and first["id"] == 7
+    assert first["turn"] == "black" and first["result"] == "*"
+    assert second["move"] == "g8f6"
+    assert second["fen"] == "rnbqkb1r/pppppppp/5n2/8/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 1 2"
+
+
+def test_checkmate_ends_the_game():
+    *_, mate, after = run_requests(
+        [
+            {"op": "new"},
+            {"op": "move", "game": 1, "move": "f3"},
+            {"op": "move", "game": 1, "move": "e5"},
+            {"op": "move", "game": 1, "move": "g4"},
+            {"op": "move", "game": 1, "move": "Qh4#"},
+            {"op": "move", "game": 1, "move": "a3"},
+        ]
+    )
+    assert mate["san"] == "Qh4#"
+    assert (mate["result"], mate["termination"], mate["legal"]) == ("0-1", "checkmate", [])
+    assert not after["ok"] and "game is over" in after["error"]
+
+
+@pytest.mark.parametrize(
+    "request_line, error",
+    [
+        ("not json", "invalid request"),
+        ({"op": "fly"}, "unknown op"),
+        ({"op": "move", "game": 9, "move": "e4"}, "unknown game"),
+        ({"op": "move", "game": 1, "move": "e2e5"}, "e2e5"),
+        ({"op": "new", "fen": "garbage"}, "invalid FEN"),
+        ({"op": "new", "fen": "8/8/8/8/8/8/8/K7 w - - 0 1"}, "exactly one king"),
+        ({"op": "state", "game": [1]}, "game must be an integer"),
+        ({"op": ["new"]}, "unknown op"),
+    ],
+)
+def test_errors_are_reported(request_line, error):
+    _, response = run_requests([{"op": "new"}, request_line])
+    assert not response["ok"]
+    assert error in response["error"]
+
+
+def test_close_forgets_the_game():
+    server = GameServer()
+    _, closed, state = run_requests(
+        [{"op": "new"}, {"op": "close", "game": 1}, {"op": "state", "game": 1}], server
+    )
+    assert closed["ok"] and not state["ok"]
+    assert server.games == {}
+
+
+def test_load_test_reports_latency():
+    async def run():
+        listener = await start_server(GameServer(), port=0)
+        async with listener:
+            port = listener.sockets[0].getsockname()[1]
+            return await load_test(games=4, plies=10, port=port)
+
+    stats = asyncio.run(run())
+    assert stats.games == 4 and stats.errors == 0
+    assert stats.moves == len(stats.latencies) == 40
+    assert 0 < stats.percentile(0.5) <= stats.percentile(0.99)
+
+
+def test_internal_errors_keep_the_connection_open():
+    server = GameServer()
+
+    def fail(notation):
+        raise RuntimeError("boom")
+
+    async def new_game_with_failing_moves(request):
+        response = await GameServer.new_game(server, request)
+        server.games[response["game"]].play = fail
+        return response
+
+    server.operations["new"] = new_game_with_failing_moves
+    _, failed, state = run_requests(
+        [{"op": "new"}, {"op": "move", "game": 1, "move": "e4"}, {"op": "state", "game": 1}],
+        server,
+    )
+    assert not failed["ok"] and "RuntimeError: boom" in failed["error"]
+    assert state["ok"] and state["turn"] == "white"
@@ -0,0 +1,97 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from moves import Move
+from pieces import PieceType
+from search import Search
+from transposition import (
+    TranspositionTable,
+    SharedTranspositionTable,
+    encode_move,
+    decode_move,
+    EXACT,
+    LOWER_BOUND,
+    UPPER_BOUND,
+    ENTRY_SIZE,
+    BUCKET_SIZE,
+)
+
+
+def test_encode_and_decode_move():
+    for move in [
+        Move((6, 4), (4, 4)),
+        Move((1, 0), (0, 1), PieceType.KNIGHT),
+        Move((0, 0), (7, 7), PieceType.QUEEN),
+    ]:
+        assert decode_move(encode_move(move)) == move
+    assert decode_move(encode_move(None)) is None
+
+
+def test_table_size_follows_megabytes():
+    table = TranspositionTable(size_mb=1)
+    assert table.size * BUCKET_SIZE * ENTRY_SIZE == 1 << 20
+    assert len(table.keys) == len(table.data) == table.size * BUCKET_SIZE
+
+
+def test_store_and_probe():
+    table = TranspositionTable(size_mb=1)
+    move = Move((6, 4), (4, 4))
+    table.store(12345, 5, -250, UPPER_BOUND, move)
+
+    entry = table.probe(12345)
+    assert (entry.depth, entry.score, entry.bound, entry.move) == (5, -250, UPPER_BOUND, move)
+    assert table.probe(54321) is None
+    assert (table.probes, table.hits, table.hit_rate) == (2, 1, 0.5)
+
+
+def test_bucket_keeps_deepest_entry():
+    table = TranspositionTable(size_mb=1)
+    deep, shallow, newer = 7, 7 + table.size, 7 + 2 * table.size  # same bucket
+    table.store(deep, 8, 10, EXACT, None)
+    table.store(shallow, 2, 20, LOWER_BOUND, None)
+    assert table.probe(deep).depth == 8
+    assert table.probe(shallow).depth == 2
+
+    # The always-replace entry takes the next shallow search
+    table.store(newer, 3, 30, EXACT, None)
+    assert table.probe(deep) is not None
+    assert table.probe(shallow) is None
+    assert table.probe(newer).score == 30
+
+
+def test_torn_entry_reads_as_miss():
+    table = TranspositionTable(size_mb=1)
+    table.store(12345, 5, 100, EXACT, None)
+    slot = 12345 % table.size * BUCKET_SIZE
+    # Another writer replaced the data but not yet the key
+    table.data[slot] ^= 1 << 20
+    assert table.probe(12345) is None
+
+
+def test_shared_table_is_seen_by_attached_table():
+    table = SharedTranspositionTable(size_mb=1)
+    try:
+        attached = SharedTranspositionTable(size_mb=1, name=table.name)
+        move = Move((6, 4), (4, 4))
+        table.store(12345, 5, -250, EXACT, move)
+        assert attached.probe(12345) == (5, -250, EXACT, move)
+
+        attached.clear()
+        assert table.probe(12345) is None
+        attached.close()
+    finally:
+        table.close()
+
+
+def test_search_reuses_table_between_searches():
+    board = Board(backend="bitboard")
+    board.process_fen("r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10")
+    search = Search(board, TranspositionTable(size_mb=1))
+    first = search.search(depth=3)
+    second = search.search(depth=3)
+    assert second.nodes < first.nodes
+    assert second.best_move == first.best_move
+    assert search.table.hits > 0
@@ -0,0 +1,128 @@
+import pytest
+import io
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from moves import Move
+from notation import Notation, InvalidNotation
+from pieces import PieceType
+from search import MATE_SCORE
+from uci import UciEngine, format_score, run
+
+
+def make_engine():
+    output = io.StringIO()
+    return UciEngine(output), output
+
+
+def lines(output):
+    return output.getvalue().splitlines()
+
+
+def test_uci_and_isready():
+    engine, output = make_engine()
+    engine.handle("uci")
+    engine.handle("isready")
+    assert "uciok" in lines(output)
+    assert any(line.startswith("id author ") for line in lines(output))
+    assert lines(output)[-1] == "readyok"
+
+
+def test_position_startpos_moves():
+    engine, _ = make_engine()
+    engine.handle("position startpos moves e2e4 c7c5 g1f3")
+    assert engine.board.to_fen() == (
+        "rnbqkbnr/pp1ppppp/8/2p5/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+    )
+
+
+def test_position_fen_with_promotion_and_castling():
+    engine, _ = make_engine()
+    engine.handle("position fen 4k3/1P6/8/8/8/8/8/R3K3 w Q - 0 1 moves e1c1 e8f7 b7b8q")
+    assert engine.board.to_fen() == "1Q6/5k2/8/8/8/8/8/2KR4 b - - 0 2"
+
+
+def test_position_illegal_move_is_reported():
+    engine, output = make_engine()
+    engine.handle("position startpos moves e2e5")
+    assert lines(output) == ["info string illegal move e2e5"]
+
+
+def test_go_depth_reports_info_and_bestmove():
+    engine, output = make_engine()
+    engine.handle("position startpos")
+    engine.handle("go depth 2")
+    engine.handle("isready")
+    engine.stop([])
+    reported = lines(output)
+    assert any(line.startswith("info depth 2 score cp ") for line in reported)
+    assert reported[-1].startswith("bestmove ")
+
+
+def test_go_infinite_waits_for_stop():
+    engine, output = make_engine()
+    engine.handle("position startpos")
+    engine.handle("go infinite depth 1")
+    engine._search_thread.join(0.2)
+    assert not any(line.startswith("bestmove") for line in lines(output))
+    engine.handle("stop")
+    assert lines(output)[-1].startswith("bestmove ")
+
+
+@pytest.mark.parametrize("command", ["position startpos", "ucinewgame", "setoption name Hash value 1", "go depth 1"])
+def test_commands_stop_an_infinite_search(command):
+    engine, output = make_engine()
+    engine.handle("go infinite depth 1")
+    handler = threading.Thread(target=engine.handle, args=(command,), daemon=True)
+    handler.start()
+    handler.join(10)
+    assert not handler.is_alive()
+    assert any(line.startswith("bestmove ") for line in lines(output))
+    engine.stop([])
+
+
+def test_position_invalid_fen_is_reported():
+    engine, output = make_engine()
+    engine.handle("position fen 8/8/8 w - - 0 1")
+    assert lines(output) == ["info string invalid fen 8/8/8 w - - 0 1"]
+
+
+def test_go_finds_mate_in_one():
+    engine, output = make_engine()
+    engine.handle("position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    engine.handle("go depth 3")
+    engine.stop([])
+    assert any(" score mate 1 " in line for line in lines(output))
+    assert lines(output)[-1] == "bestmove a1a8"
+
+
+def test_run_stops_at_quit():
+    output = io.StringIO()
+    run(io.StringIO("uci\nquit\nisready\n"), output)
+    assert "uciok" in lines(output)
+    assert "readyok" not in lines(output)
+
+
+@pytest.mark.parametrize(
+    "score, expected",
+    [(35, "cp 35"), (MATE_SCORE - 1, "mate 1"), (MATE_SCORE - 4, "mate 2"), (-MATE_SCORE + 2, "mate -1")],
+)
+def test_format_score(score, expected):
+    assert format_score(score) == expected
+
+
+def test_uci_move_round_trip():
+    promotion = Move((1, 1), (0, 1), promotion=PieceType.QUEEN)
+    assert Notation.move_to_uci(promotion) == "b7b8q"
+    assert Notation.uci_to_move("b7b8q", [promotion]) == promotion
+    with pytest.raises(InvalidNotation):
+        Notation.uci_to_move("b7b8n", [promotion])
+
+
+@pytest.mark.parametrize("uci", ["e2e4x", "e2e4k", "e2e4p", "e2e4Q"])
+def test_uci_to_move_rejects_bad_promotion_letters(uci):
+    with pytest.raises(InvalidNotation, match="invalid promotion piece"):
+        Notation.uci_to_move(uci, [Move((6, 4), (4, 4))])
@@ -73,3 +73,26 @@ def test_pawn_can_be_promoted_white_queen():
     board.move_piece(notation)
     expected_piece = Piece(x=0, y=0, color=Color.WHITE, type=PieceType.QUEEN)
     assert board.board[(0, 0)] == expected_piece
+
+
+def test_make_move_and_unmake_move_capture():
+    fen = "4k3/8/8/8/8/8/1p6/R3K3"
+    board = Board()
+    board.process_fen(fen)
+    rook = board.board[(7, 0)]
+    pawn = board.board[(6, 1)]
+
+    undo = BoardUtils.make_move(board.board, rook, 7, 1)
+    assert board.board[(7, 1)] is rook
+    assert (rook.x, rook.y) == (7, 1)
+    assert board.board[(7, 0)].type == PieceType.EMPTY
+    BoardUtils.unmake_move(board.board, undo)
+
+    undo = BoardUtils.make_move(board.board, pawn, 7, 0)
+    assert undo.captured is rook
+    BoardUtils.unmake_move(board.board, undo)
+
+    assert board.board[(7, 0)] is rook
+    assert (rook.x, rook.y) == (7, 0)
+    assert board.board[(6, 1)] is pawn
+    assert (pawn.x, pawn.y) == (6, 1)
@@ -0,0 +1,87 @@
+import os
+import sys
+import random
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from board import Board
+from pieces import PieceType
+from zobrist import Zobrist
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+
+def full_key(board: Board) -> int:
+    return Zobrist.hash_board(
+        board.board,
+        board.expected_player,
+        board.en_passant_position,
+        board.castling_rights,
+    )
+
+
+def test_hash_board_side_to_move_and_en_passant():
+    white = Board()
+    white.process_fen("4k3/8/8/3pP3/8/8/8/4K3 w - - 0 1")
+    black = Board()
+    black.process_fen("4k3/8/8/3pP3/8/8/8/4K3 b - - 0 1")
+    en_passant = Board()
+    en_passant.process_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+
+    assert len({white.zobrist_key, black.zobrist_key, en_passant.zobrist_key}) == 3
+
+
+def test_castling_rights_change_key():
+    keys = set()
+    for castling in ["-", "K", "Qk", "KQkq"]:
+        board = Board()
+        board.process_fen(f"r3k2r/8/8/8/8/8/8/R3K2R w {castling} - 0 1")
+        keys.add(board.zobrist_key)
+    assert len(keys) == 4
+
+
+def test_lost_castling_rights_key_matches_full_hash():
+    board = Board()
+    board.process_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    undo = board.make_move((7, 0), (0, 0))  # the rook captures the rook, both lose a right
+    assert board.castling_rights == 0b0101
+    assert board.zobrist_key == full_key(board)
+    board.unmake_move(undo)
+    assert board.zobrist_key == full_key(board)
+
+
+def test_transposition_has_same_key():
+    board = Board()
+    board.process_fen(START_FEN)
+    start_key = board.zobrist_key
+
+    knight_moves = [((7, 6), (5, 5)), ((0, 6), (2, 5)), ((5, 5), (7, 6)), ((2, 5), (0, 6))]
+    for origin, target in knight_moves:
+        board.make_move(origin, target)
+    assert board.zobrist_key == start_key
+
+
+def test_promotion_key_matches_full_hash():
+    board = Board()
+    board.process_fen("4k3/P7/8/8/8/8/8/4K3 w - - 0 1")
+    undo = board.make_move((1, 0), (0, 0), promotion=PieceType.KNIGHT)
+    assert board.zobrist_key == full_key(board)
+    board.unmake_move(undo)
+    assert board.zobrist_key == full_key(board)
+
+
+def test_incremental_key_matches_full_hash_in_random_games():
+    rng = random.Random(8)
+    for _ in range(5):
+        board = Board(backend="bitboard")
+        board.process_fen(START_FEN)
+        undos = []
+        for _ in range(60):
+            moves = board.get_legal_moves()
+            if not moves:
+                break
+            undos.append(board.make_move(*rng.choice(moves)))
+            assert board.zobrist_key == full_key(board)
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+            assert board.zobrist_key == full_key(board)
@@ -1,6 +1,46 @@
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple, Optional
+from dataclasses import dataclass
 
-from pieces import Piece, PieceType, Color
+from pieces import Piece, PieceType, Color, EMPTY_SQUARE
+from king_validation import set_square
+
+
+@dataclass(slots=True)
+class MoveUndo:
+    """
+    Record of everything a move changed, used to revert it in place.
+
+    Attributes:
+        piece (Piece): The piece that was moved.
+        origin (Tuple[int, int]): The position the piece moved from.
+        target (Tuple[int, int]): The position the piece moved to.
+        captured (Piece): The piece removed by the move (an empty piece if nothing was captured).
+        captured_position (Tuple[int, int]): The position of the captured piece, which differs from target for en passant.
+        has_moved (bool): The has_moved flag of the moved piece before the move.
+        en_passantable (bool): The en_passantable flag of the moved piece before the move.
+        en_passant_position (Optional[Tuple[int, int]]): The position of the pawn that could be captured en passant before the move.
+        promoted (Optional[Piece]): The piece the pawn was promoted to, if any.
+        zobrist_key (int): The Zobrist key of the position before the move.
+        evaluation (Tuple[int, int, int]): The middle game score, end game score and phase of the position before the move.
+        castling_rights (int): The castling rights bit mask before the move.
+        halfmove_clock (int): The halfmove clock before the move.
+        rook_undo (Optional[MoveUndo]): The record of the rook move of a castling move, if any.
+    """
+
+    piece: Piece
+    origin: Tuple[int, int]
+    target: Tuple[int, int]
+    captured: Piece
+    captured_position: Tuple[int, int]
+    has_moved: bool = False
+    en_passantable: bool = False
+    en_passant_position: Optional[Tuple[int, int]] = None
+    promoted: Optional[Piece] = None
+    zobrist_key: int = 0
+    evaluation: Tuple[int, int, int] = (0, 0, 0)
+    castling_rights: int = 0
+    halfmove_clock: int = 0
+    rook_undo: Optional["MoveUndo"] = None
 
 
 class BoardUtils:
@@ -44,12 +84,98 @@ class BoardUtils:
             new_x (int): The new x-coordinate of the piece.
             new_y (int): The new y-coordinate of the piece.
         """
-        simulated_board[(piece.x, piece.y)] = Piece(
-            x=piece.x, y=piece.y, type=PieceType.EMPTY
-        )
+        simulated_board[(piece.x, piece.y)] = EMPTY_SQUARE
         updated_piece = Piece(x=new_x, y=new_y, type=piece.type, color=piece.color)
         simulated_board[(new_x, new_y)] = updated_piece
 
+    @staticmethod
+    def make_move(
+        board: Dict[Tuple[int, int], Piece],
+        piece: Piece,
+        new_x: int,
+        new_y: int,
+    ) -> MoveUndo:
+        """
+        Move a piece in place on the board, removing any captured piece.
+
+        Only the piece placement is changed, which is all that check detection needs.
+        The returned record can be passed to unmake_move to restore the board exactly.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The chessboard to update.
+            piece (Piece): The piece to be moved.
+            new_x (int): The new x-coordinate of the piece.
+            new_y (int): The new y-coordinate of the piece.
+
+        Returns:
+            MoveUndo: The record needed to revert the move.
+        """
+
+        origin = (piece.x, piece.y)
+        target = (new_x, new_y)
+        captured_position = target
+
+        # A pawn moving diagonally onto an empty square captures en passant
+        if (
+            piece.type == PieceType.PAWN
+            and new_y != piece.y
+            and board[target].type == PieceType.EMPTY
+        ):
+            captured_position = (piece.x, new_y)
+
+        undo = MoveUndo(
+            piece=piece,
+            origin=origin,
+            target=target,
+            captured=board[captured_position],
+            captured_position=captured_position,
+            has_moved=piece.has_moved,
+            en_passantable=piece.en_passantable,
+        )
+
+        if captured_position != target:
+            set_square(board, captured_position, EMPTY_SQUARE)
+        set_square(board, origin, EMPTY_SQUARE)
+        set_square(board, target, piece)
+        piece.x, piece.y = new_x, new_y
+
+        # Keep the king positions of a TrackedBoard up to date
+        king_positions = getattr(board, "king_positions", None)
+        if king_positions is not None:
+            if piece.type == PieceType.KING:
+                king_positions[piece.color] = target
+            if undo.captured.type == PieceType.KING:
+                del king_positions[undo.captured.color]
+
+        return undo
+
+    @staticmethod
+    def unmake_move(board: Dict[Tuple[int, int], Piece], undo: MoveUndo) -> None:
+        """
+        Revert a move made by make_move, restoring the board in place.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The chessboard to restore.
+            undo (MoveUndo): The record returned when the move was made.
+        """
+
+        piece = undo.piece
+        piece.x, piece.y = undo.origin
+        piece.has_moved = undo.has_moved
+        piece.en_passantable = undo.en_passantable
+        set_square(board, undo.origin, piece)
+
+        if undo.captured_position != undo.target:
+            set_square(board, undo.target, EMPTY_SQUARE)
+        set_square(board, undo.captured_position, undo.captured)
+
+        king_positions = getattr(board, "king_positions", None)
+        if king_positions is not None:
+            if piece.type == PieceType.KING:
+                king_positions[piece.color] = undo.origin
+            if undo.captured.type == PieceType.KING:
+                king_positions[undo.captured.color] = undo.captured_position
+
     @staticmethod
     def is_in_direct_contact_with_opposing_piece(
         piece_at_position: Piece,
@@ -88,44 +214,42 @@ class BoardUtils:
 
     @staticmethod
     def promote_pawn_if_available(
-        piece_to_check: Piece, board: Dict[Tuple[int], Piece]
+        piece_to_check: Piece,
+        board: Dict[Tuple[int], Piece],
+        promotion: PieceType = PieceType.QUEEN,
+        spare_pieces: Optional[Dict[Tuple[Color, PieceType], List[Piece]]] = None,
     ) -> Dict[Tuple[int], Piece]:
         """
-        Promote a pawn to a queen if available.
+        Promote a pawn to a queen (or the given piece type) if available.
 
         Args:
             piece_to_check (Piece): The piece to check for pawn promotion.
             board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            promotion (PieceType): The piece type to promote to (defaults to PieceType.QUEEN).
+            spare_pieces (Optional[Dict[Tuple[Color, PieceType], List[Piece]]]): Pieces off the board by (color, type), one is reused instead of allocating the promoted piece.
 
         Returns:
             Dict[Tuple[int, int], Piece]: The updated chessboard after pawn promotion.
         """
 
-        if (
-            piece_to_check.type == PieceType.PAWN
-            and piece_to_check.color == Color.WHITE
-            and piece_to_check.x == 0
-        ):
-
-            board[(piece_to_check.x, piece_to_check.y)] = Piece(
-                x=piece_to_check.x,
-                y=piece_to_check.y,
-                type=PieceType.QUEEN,
-                color=Color.WHITE,
-            )
-
-            # Check if a black pawn reached the 8th rank
-        elif (
-            piece_to_check.type == PieceType.PAWN
-            and piece_to_check.color == Color.BLACK
-            and piece_to_check.x == 7
-        ):
-
-            board[(piece_to_check.x, piece_to_check.y)] = Piece(
+        last_row = 0 if piece_to_check.color == Color.WHITE else 7
+        if piece_to_check.type != PieceType.PAWN or piece_to_check.x != last_row:
+            return board
+
+        # Reuse a promoted piece that an unmade move took off the board
+        spares = None
+        if spare_pieces:
+            spares = spare_pieces.get((piece_to_check.color, promotion))
+        if spares:
+            promoted = spares.pop()
+            promoted.x, promoted.y = piece_to_check.x, piece_to_check.y
+            promoted.has_moved = promoted.en_passantable = False
+        else:
+            promoted = Piece(
                 x=piece_to_check.x,
                 y=piece_to_check.y,
-                type=PieceType.QUEEN,
-                color=Color.BLACK,
+                type=promotion,
+                color=piece_to_check.color,
             )
-
+        set_square(board, (piece_to_check.x, piece_to_check.y), promoted)
         return board
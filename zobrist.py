@@ -0,0 +1,85 @@
+import random
+from functools import reduce
+from operator import xor
+from typing import Dict, List, Tuple, Optional
+from pieces import Piece, PieceType, Color
+
+# Fixed seed, so keys are identical between runs and processes
+_random = random.Random(2024)
+
+# Key of each piece type and color on each square index x * 8 + y (empty squares hash to 0)
+PIECE_KEYS: Dict[Tuple[PieceType, Color], List[int]] = {
+    (piece_type, color): [_random.getrandbits(64) for _ in range(64)]
+    for piece_type in PieceType
+    if piece_type != PieceType.EMPTY
+    for color in (Color.WHITE, Color.BLACK)
+}
+PIECE_KEYS[(PieceType.EMPTY, Color.NONE)] = [0] * 64
+
+# Hashed in when black is to move
+SIDE_KEY: int = _random.getrandbits(64)
+
+# Key of the file (y) of the pawn that can be captured en passant
+EN_PASSANT_KEYS: List[int] = [_random.getrandbits(64) for _ in range(8)]
+
+# Key of each combination of castling rights, indexed by the CASTLING_* bit mask of the Board
+_castling_right_keys = [_random.getrandbits(64) for _ in range(4)]
+CASTLING_KEYS: List[int] = [
+    reduce(
+        xor, (key for bit, key in enumerate(_castling_right_keys) if rights >> bit & 1), 0
+    )
+    for rights in range(16)
+]
+
+
+class Zobrist:
+    """
+    Utility class computing the 64-bit Zobrist key of a position.
+
+    The key is the XOR of one random number per piece on its square, SIDE_KEY when black is
+    to move, the castling rights left and the file of the pawn that can be captured en passant. Each term can be XORed
+    in and out on its own, which lets the Board update the key incrementally.
+    """
+
+    @staticmethod
+    def piece_key(piece: Piece, position: Tuple[int, int]) -> int:
+        """
+        Get the key of a piece standing on the given position.
+
+        Args:
+            piece (Piece): The piece (an empty piece has the key 0).
+            position (Tuple[int, int]): The position of the piece.
+
+        Returns:
+            int: The key of the piece on the position.
+        """
+        return PIECE_KEYS[(piece.type, piece.color)][position[0] * 8 + position[1]]
+
+    @staticmethod
+    def hash_board(
+        board: Dict[Tuple[int, int], Piece],
+        player: Color,
+        en_passant_position: Optional[Tuple[int, int]] = None,
+        castling_rights: int = 0,
+    ) -> int:
+        """
+        Compute the key of a position from scratch.
+
+        Args:
+            board (Dict[Tuple[int, int], Piece]): The current state of the chessboard.
+            player (Color): The color of the player to move.
+            en_passant_position (Optional[Tuple[int, int]]): The position of the pawn that can be captured en passant, if any.
+            castling_rights (int): The bit mask of the castling rights left (defaults to none).
+
+        Returns:
+            int: The Zobrist key of the position.
+        """
+
+        key = 0
+        for position, piece in board.items():
+            key ^= Zobrist.piece_key(piece, position)
+        if player == Color.BLACK:
+            key ^= SIDE_KEY
+        if en_passant_position is not None:
+            key ^= EN_PASSANT_KEYS[en_passant_position[1]]
+        return key ^ CASTLING_KEYS[castling_rights]